@@ -4,7 +4,7 @@ from src.config.settings import Settings
 
 if __name__ == '__main__':
     settings = Settings.load()
-    app = create_app()
+    app = create_app(settings)
     app.run(
         host=settings.host,
         port=settings.port,
@@ -0,0 +1,110 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from .phase_timer import timed
+
+
+class OverloadedError(RuntimeError):
+    """Raised when an evaluation cannot be admitted because the wait queue is full."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bounds concurrent evaluations with a bounded wait queue and deadline-aware waiting."""
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        max_queued: int = 32,
+        queue_timeout: float = 5.0,
+        retry_after: int = 1
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._expired = 0
+
+    @contextmanager
+    def admit(self, deadline: Optional[float] = None) -> Iterator[None]:
+        """
+        Hold an evaluation slot for the duration of the block.
+
+        Args:
+            deadline: Optional time.monotonic() value after which the caller no longer needs the result
+
+        Raises:
+            OverloadedError: If the wait queue is full or no slot frees up within the queue timeout
+            TimeoutError: If the deadline passes before a slot is acquired
+        """
+        with timed('admission'):
+            self._acquire(deadline)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def snapshot(self) -> dict:
+        """Return current load and lifetime admission counters."""
+        with self._condition:
+            return {
+                'in_flight': self._in_flight,
+                'queued': self._queued,
+                'max_in_flight': self.max_in_flight,
+                'max_queued': self.max_queued,
+                'admitted': self._admitted,
+                'rejected': self._rejected,
+                'expired': self._expired
+            }
+
+    def _acquire(self, deadline: Optional[float]) -> None:
+        with self._condition:
+            if deadline is not None and time.monotonic() >= deadline:
+                self._expired += 1
+                raise TimeoutError("Request deadline expired before admission")
+
+            # A non-positive limit disables concurrency control entirely
+            if self.max_in_flight <= 0 or (self._in_flight < self.max_in_flight and self._queued == 0):
+                self._in_flight += 1
+                self._admitted += 1
+                return
+
+            if self._queued >= self.max_queued:
+                self._rejected += 1
+                raise OverloadedError("Too many evaluations in progress, try again later", self.retry_after)
+
+            wait_until = time.monotonic() + self.queue_timeout
+            if deadline is not None:
+                wait_until = min(wait_until, deadline)
+
+            self._queued += 1
+            try:
+                while self._in_flight >= self.max_in_flight:
+                    remaining = wait_until - time.monotonic()
+                    if remaining <= 0:
+                        if deadline is not None and time.monotonic() >= deadline:
+                            self._expired += 1
+                            raise TimeoutError("Request deadline expired while queued for admission")
+                        self._rejected += 1
+                        raise OverloadedError("Timed out waiting for an evaluation slot", self.retry_after)
+                    self._condition.wait(remaining)
+
+                self._in_flight += 1
+                self._admitted += 1
+            finally:
+                self._queued -= 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
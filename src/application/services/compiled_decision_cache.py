@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zen
+from typing import Dict, List, Optional, Set, Tuple
+from .finite_domain_lookup import FiniteDomainLookup
+from .phase_timer import timed
+
+
+_NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+class CompiledDecisionCache:
+    """
+    Shares one ZenEngine and compiled decision content across services and versions.
+
+    Decision graphs live at <rules_root>/<family>/<version>/<family>.json unless a
+    family registers another file name with register_family(). Decision
+    nodes reference other graphs by key, either "<family>/<version>" or "<family>"
+    for the latest version; the engine resolves them through this cache's loader
+    so a shared sub-decision is parsed once no matter how many parents use it.
+    Entries are reloaded when the file on disk changes. The engine calls the loader
+    on every evaluation that reaches a decision node, so resolved keys are served
+    from memory and files are re-checked at most every `reload_interval` seconds.
+
+    With `precompute_lookups` enabled, finite-domain branches of each version are
+    also enumerated into lookup tables when the version is first loaded.
+    """
+
+    def __init__(self, rules_root: str = None, precompute_lookups: bool = False, reload_interval: float = 1.0):
+        if rules_root is None:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            rules_root = os.path.join(current_dir, '..', '..', 'rules')
+        self.rules_root = rules_root
+        self.precompute_lookups = precompute_lookups
+        self.reload_interval = reload_interval
+
+        self._lock = threading.Lock()
+        self._file_names: Dict[str, str] = {}
+        self._contents: Dict[Tuple[str, str], Tuple[float, zen.ZenDecisionContent]] = {}
+        self._decisions: Dict[Tuple[str, str], Tuple[float, zen.ZenDecision]] = {}
+        self._lookups: Dict[Tuple[str, str], Tuple[float, FiniteDomainLookup]] = {}
+        # Content digest and referenced decision keys of each loaded graph
+        self._digests: Dict[Tuple[str, str], Tuple[float, str, List[str]]] = {}
+        # Content served to the engine loader per decision key, with the time its file was last checked
+        self._resolved: Dict[str, Tuple[float, zen.ZenDecisionContent]] = {}
+        self._loads = 0
+        self._hits = 0
+
+        self.engine = zen.ZenEngine({'loader': self._load})
+
+    def register_family(self, family: str, file_name: str) -> None:
+        """Read a family's decisions from `file_name` in each version directory instead of <family>.json."""
+        with self._lock:
+            self._file_names[self._checked_name(family)] = file_name
+
+    def get_available_versions(self, family: str):
+        """Get versions of a decision family, latest first."""
+        family_path = os.path.join(self.rules_root, self._checked_name(family))
+        if not os.path.isdir(family_path):
+            return []
+
+        versions = [
+            item for item in os.listdir(family_path)
+            if item.isdigit() and os.path.isdir(os.path.join(family_path, item))
+        ]
+        return sorted(versions, key=int, reverse=True)
+
+    def resolve_path(self, family: str, version: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Locate the decision file for a family and version.
+
+        Returns:
+            Tuple of the concrete version and the decision file path
+        """
+        if version is None:
+            versions = self.get_available_versions(family)
+            if not versions:
+                raise FileNotFoundError(f"No versions available for decision {family}")
+            version = versions[0]
+
+        with self._lock:
+            file_name = self._file_names.get(family, f"{family}.json")
+        path = os.path.join(self.rules_root, self._checked_name(family), self._checked_name(version), file_name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Rules file not found for {family} version {version}: {path}")
+        return version, path
+
+    def get_content(self, family: str, version: Optional[str] = None) -> zen.ZenDecisionContent:
+        """Get parsed decision content, parsing the file only when it is new or has changed."""
+        version, path = self.resolve_path(family, version)
+        modified = os.path.getmtime(path)
+
+        with self._lock:
+            cached = self._contents.get((family, version))
+            if cached is not None and cached[0] == modified:
+                self._hits += 1
+                return cached[1]
+
+        with timed('load'):
+            with open(path, 'r') as f:
+                raw = f.read()
+            content = zen.ZenDecisionContent(raw)
+            digest = hashlib.sha256(raw.encode('utf-8')).hexdigest()
+            references = _decision_references(raw)
+
+        with self._lock:
+            self._contents[(family, version)] = (modified, content)
+            self._digests[(family, version)] = (modified, digest, references)
+            self._loads += 1
+            # A reloaded graph may change what its keys, or the latest version, resolve to
+            self._resolved.clear()
+        return content
+
+    def get_decision(self, family: str, version: Optional[str] = None) -> zen.ZenDecision:
+        """Get a ready-to-evaluate decision for a family and version."""
+        version, path = self.resolve_path(family, version)
+        modified = os.path.getmtime(path)
+
+        with self._lock:
+            cached = self._decisions.get((family, version))
+            if cached is not None and cached[0] == modified:
+                self._hits += 1
+                return cached[1]
+
+        content = self.get_content(family, version)
+        with timed('compile'):
+            decision = self.engine.create_decision(content)
+
+        with self._lock:
+            self._decisions[(family, version)] = (modified, decision)
+        return decision
+
+    def fingerprint(self, family: str, version: Optional[str] = None) -> str:
+        """
+        Identify the decision content a version evaluates with, including every graph it references.
+
+        The fingerprint changes whenever the version's file or any referenced graph
+        changes, so results derived from a version can be keyed by it.
+        """
+        version, _ = self.resolve_path(family, version)
+        return self._fingerprint(family, version, set())
+
+    def get_lookup(self, family: str, version: Optional[str] = None) -> Optional[FiniteDomainLookup]:
+        """Get the precomputed finite-domain lookup for a version, building it on first use."""
+        if not self.precompute_lookups:
+            return None
+
+        version, path = self.resolve_path(family, version)
+        modified = os.path.getmtime(path)
+
+        with self._lock:
+            cached = self._lookups.get((family, version))
+            if cached is not None and cached[0] == modified:
+                return cached[1]
+
+        decision = self.get_decision(family, version)
+        with timed('precompute'):
+            with open(path, 'r') as f:
+                graph = json.load(f)
+            lookup = FiniteDomainLookup.build(graph, decision)
+
+        with self._lock:
+            self._lookups[(family, version)] = (modified, lookup)
+        return lookup
+
+    def stats(self) -> dict:
+        """Return cached entry counts and load/hit counters."""
+        with self._lock:
+            return {
+                'contents': sorted(f"{family}/{version}" for family, version in self._contents),
+                'decisions': sorted(f"{family}/{version}" for family, version in self._decisions),
+                'lookups': {
+                    f"{family}/{version}": lookup.describe()
+                    for (family, version), (_, lookup) in sorted(self._lookups.items())
+                },
+                'loads': self._loads,
+                'hits': self._hits
+            }
+
+    def _load(self, key: str) -> zen.ZenDecisionContent:
+        """Engine loader callback resolving decision node keys."""
+        # Runs for every evaluation reaching a decision node, so stay off the filesystem when possible
+        resolved = self._resolved.get(key)
+        now = time.monotonic()
+        if resolved is not None and now - resolved[0] < self.reload_interval:
+            return resolved[1]
+
+        content = self.get_content(*_split_key(key))
+        with self._lock:
+            self._resolved[key] = (now, content)
+        return content
+
+    def _fingerprint(self, family: str, version: str, seen: Set[Tuple[str, str]]) -> str:
+        self.get_content(family, version)
+        with self._lock:
+            _, digest, references = self._digests[(family, version)]
+
+        seen.add((family, version))
+        parts = [digest]
+        for reference in references:
+            ref_family, ref_version = _split_key(reference)
+            ref_version, _ = self.resolve_path(ref_family, ref_version)
+            if (ref_family, ref_version) not in seen:
+                parts.append(self._fingerprint(ref_family, ref_version, seen))
+        return parts[0] if len(parts) == 1 else hashlib.sha256(':'.join(parts).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _checked_name(name: str) -> str:
+        # Keys come from decision graphs, so keep them from escaping the rules directory
+        if not _NAME_PATTERN.match(name or ''):
+            raise ValueError(f"Invalid decision key component: {name!r}")
+        return name
+
+
+def _split_key(key: str) -> Tuple[str, Optional[str]]:
+    """Split a decision node key into family and version (None for latest)."""
+    if key.endswith('.json'):
+        key = key[:-len('.json')]
+
+    family, _, version = key.strip('/').partition('/')
+    # "latest" is accepted as an explicit alias only in decision node keys
+    if version == 'latest':
+        version = ''
+    return family, version or None
+
+
+def _decision_references(raw: str) -> List[str]:
+    """Get the keys of the decision nodes in a graph."""
+    try:
+        graph = json.loads(raw)
+    except ValueError:
+        return []
+
+    return sorted({
+        node['content']['key'] for node in graph.get('nodes', [])
+        if node.get('type') == 'decisionNode' and isinstance(node.get('content', {}).get('key'), str)
+    })
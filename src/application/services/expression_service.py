@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+import zen
+from collections import OrderedDict
+from datetime import datetime
+from typing import Tuple
+from ...domain.interfaces.expression_service import IExpressionService
+from ...domain.models.expression_evaluation import ExpressionEvaluationRequest, ExpressionEvaluationResult
+from .performance import format_performance_us
+
+
+class ExpressionService(IExpressionService):
+    """Evaluates ZEN expressions, compiling each source text once and caching it with LRU eviction."""
+
+    def __init__(self, cache_size: int = 1024):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[bool, str], zen.Expression]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def evaluate_expression(self, request: ExpressionEvaluationRequest) -> ExpressionEvaluationResult:
+        """Evaluate an expression against each of the provided contexts."""
+        if not request.expression or not request.expression.strip():
+            raise ValueError("expression cannot be empty")
+
+        compiled, cached = self._compile(request.expression, request.unary)
+
+        started = time.perf_counter()
+        results = []
+        for i, context in enumerate(request.contexts):
+            try:
+                results.append(compiled.evaluate(context))
+            except RuntimeError as e:
+                raise ValueError(f"Failed to evaluate expression for contexts[{i}]: {_engine_error(e)}") from e
+        elapsed_us = (time.perf_counter() - started) * 1000000.0
+
+        return ExpressionEvaluationResult(
+            results=results,
+            performance=format_performance_us(elapsed_us),
+            timestamp=datetime.utcnow(),
+            cached=cached
+        )
+
+    def stats(self) -> dict:
+        """Return cache occupancy and hit/miss counters."""
+        with self._lock:
+            return {
+                'size': len(self._cache),
+                'max_size': self.cache_size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions
+            }
+
+    def _compile(self, expression: str, unary: bool):
+        """Get a compiled expression from the cache, compiling it on a miss."""
+        key = (unary, expression)
+        with self._lock:
+            compiled = self._cache.get(key)
+            if compiled is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return compiled, True
+            self._misses += 1
+
+        try:
+            compiled = zen.compile_unary_expression(expression) if unary else zen.compile_expression(expression)
+        except RuntimeError as e:
+            raise ValueError(f"Invalid expression: {_engine_error(e)}") from e
+
+        with self._lock:
+            self._cache[key] = compiled
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+        return compiled, False
+
+
+def _engine_error(error: RuntimeError) -> str:
+    """Extract the engine's error source from its message, dropping the native backtrace."""
+    first_line = str(error).split('\n', 1)[0]
+    try:
+        return json.loads(first_line).get('source', first_line)
+    except (ValueError, AttributeError):
+        return first_line
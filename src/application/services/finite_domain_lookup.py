@@ -0,0 +1,308 @@
+import itertools
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_SWITCH_CONDITION = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*==\s*("(?:[^"\\]|\\.)*")\s*$')
+_FIELD_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class _Marker:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+# Domain classes besides the literal values a table compares against
+MISSING = _Marker('MISSING')
+OTHER = _Marker('OTHER')
+
+
+@dataclass
+class _FieldDomain:
+    """Values of one table input that the table can tell apart."""
+
+    name: str
+    kind: type
+    literals: List[Any]
+
+    def classes(self) -> List[Any]:
+        if self.kind is bool:
+            return [True, False, MISSING]
+        return list(self.literals) + [OTHER, MISSING]
+
+    def classify(self, observation: Dict[str, Any]) -> Any:
+        """Map an observed value to its domain class, or None when it lies outside the domain."""
+        if self.name not in observation:
+            return MISSING
+
+        value = observation[self.name]
+        # Exact type checks: True must not be taken for 1, nor a number for a string
+        if type(value) is not self.kind:
+            return None
+        if self.kind is str and value not in self.literals:
+            return OTHER
+        return value
+
+    def representative(self, value_class: Any, attempt: int = 0) -> Any:
+        """Pick a concrete value for a domain class; OTHER gets a string no table row mentions."""
+        if value_class is OTHER:
+            candidate = f"__other_{attempt}__"
+            while candidate in self.literals:
+                candidate = '_' + candidate
+            return candidate
+        return value_class
+
+
+@dataclass
+class _Branch:
+    """Precomputed results for one switch branch that leads to a single finite-domain table."""
+
+    node_name: str
+    fields: List[_FieldDomain]
+    results: Dict[Tuple[Any, ...], Dict[str, Any]] = field(default_factory=dict)
+    # Fields whose observed value is echoed into the result, for OTHER classes
+    echoed: Dict[Tuple[Any, ...], List[str]] = field(default_factory=dict)
+
+
+class FiniteDomainLookup:
+    """
+    Serves observations from tables precomputed through the engine.
+
+    At version load the graph is searched for switch branches of the form
+    `risk_type == "attic"` that lead to a single decision table whose input cells
+    are all blank or string/boolean literals and whose outputs are literals. Such
+    a table can only distinguish the literals it mentions, so every input
+    combination falls into a small number of classes (each literal, any other
+    string, absent). Each class is evaluated once through the engine, the
+    resulting table is checked against the engine with fresh values, and only
+    branches that agree are kept.
+
+    An observation is served from the table only when it has no fields besides
+    the switch field and the table inputs, and every input is absent or of the
+    exact type the table compares against. Everything else goes to the engine.
+    """
+
+    def __init__(self, switch_field: Optional[str] = None, branches: Dict[str, _Branch] = None):
+        self.switch_field = switch_field
+        self._branches = branches or {}
+
+    @classmethod
+    def build(cls, graph: Dict[str, Any], decision, max_combinations: int = 4096) -> 'FiniteDomainLookup':
+        """Find finite-domain branches of a decision graph and precompute them through its compiled decision."""
+        switch = _root_switch(graph)
+        if switch is None:
+            return cls()
+
+        nodes = {node['id']: node for node in graph.get('nodes', [])}
+        edges = graph.get('edges', [])
+
+        switch_field = None
+        branches: Dict[str, _Branch] = {}
+        # Every value already claimed by an earlier statement, eligible or not
+        seen = set()
+        for statement in switch['content'].get('statements', []):
+            if statement.get('isDefault'):
+                continue
+
+            # With first-hit statements, stop at the first condition that is not a plain equality test
+            match = _SWITCH_CONDITION.match(statement.get('condition') or '')
+            if match is None or switch_field not in (None, match.group(1)):
+                break
+            switch_field = match.group(1)
+            value = json.loads(match.group(2))
+            # First-hit routing never reaches a later statement testing the same value
+            if value in seen:
+                continue
+            seen.add(value)
+
+            table = _branch_table(switch['id'], statement['id'], nodes, edges)
+            fields = _table_domains(table) if table is not None else None
+            if fields is None or any(domain.name == switch_field for domain in fields):
+                continue
+
+            combinations = 1
+            for domain in fields:
+                combinations *= len(domain.classes())
+            if combinations > max_combinations:
+                continue
+
+            branch = _Branch(node_name=table.get('name', table['id']), fields=fields)
+            if _materialize(branch, switch_field, value, decision):
+                branches[value] = branch
+
+        return cls(switch_field, branches)
+
+    def lookup(self, observation: Any) -> Optional[Dict[str, Any]]:
+        """Get the precomputed result for an observation, or None if it must be evaluated by the engine."""
+        if not self._branches or not isinstance(observation, dict):
+            return None
+
+        branch_value = observation.get(self.switch_field)
+        branch = self._branches.get(branch_value) if type(branch_value) is str else None
+        if branch is None or len(observation) > len(branch.fields) + 1:
+            return None
+
+        key = []
+        for domain in branch.fields:
+            value_class = domain.classify(observation)
+            if value_class is None:
+                return None
+            key.append(value_class)
+
+        # Reject fields outside the table inputs; absent inputs do not count towards the length
+        present = sum(1 for value_class in key if value_class is not MISSING)
+        if len(observation) != present + 1:
+            return None
+
+        key = tuple(key)
+        # Shallow copy: nested output values are shared, and treated as read-only like the rest of a result
+        result = dict(branch.results[key])
+        for name in branch.echoed.get(key, ()):
+            result[name] = observation[name]
+        return result
+
+    def describe(self) -> Dict[str, Any]:
+        """Summarize the precomputed branches."""
+        return {
+            value: {
+                'node': branch.node_name,
+                'fields': [domain.name for domain in branch.fields],
+                'entries': len(branch.results)
+            }
+            for value, branch in self._branches.items()
+        }
+
+
+def _root_switch(graph: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get the first-hit switch node the input node feeds, if that is all it feeds."""
+    nodes = {node['id']: node for node in graph.get('nodes', [])}
+    inputs = [node for node in nodes.values() if node.get('type') == 'inputNode']
+    if len(inputs) != 1:
+        return None
+
+    outgoing = [edge for edge in graph.get('edges', []) if edge.get('sourceId') == inputs[0]['id']]
+    if len(outgoing) != 1:
+        return None
+
+    switch = nodes.get(outgoing[0].get('targetId'))
+    if switch is None or switch.get('type') != 'switchNode':
+        return None
+    if switch.get('content', {}).get('hitPolicy', 'first') != 'first':
+        return None
+    return switch
+
+
+def _branch_table(switch_id: str, statement_id: str, nodes: Dict[str, Any], edges: List[Dict[str, Any]]):
+    """Get the decision table a switch statement leads to, if nothing but output nodes follow it."""
+    targets = [edge for edge in edges if edge.get('sourceId') == switch_id and edge.get('sourceHandle') == statement_id]
+    if len(targets) != 1:
+        return None
+
+    table = nodes.get(targets[0].get('targetId'))
+    if table is None or table.get('type') != 'decisionTableNode':
+        return None
+    if sum(1 for edge in edges if edge.get('targetId') == table['id']) != 1:
+        return None
+
+    for edge in edges:
+        if edge.get('sourceId') != table['id']:
+            continue
+        target = nodes.get(edge.get('targetId'))
+        if target is None or target.get('type') != 'outputNode':
+            return None
+        if any(other.get('sourceId') == target['id'] for other in edges):
+            return None
+    return table
+
+
+def _table_domains(table: Dict[str, Any]) -> Optional[List[_FieldDomain]]:
+    """Work out the input domains of a first-hit table with literal cells, or None if it has any other kind."""
+    content = table.get('content', {})
+    if content.get('hitPolicy', 'first') != 'first' or content.get('inputField') or content.get('outputPath'):
+        return None
+    if content.get('executionMode', 'single') != 'single':
+        return None
+
+    inputs = content.get('inputs', [])
+    if not inputs or any(not _FIELD_NAME.match(column.get('field') or '') for column in inputs):
+        return None
+    if len({column['field'] for column in inputs}) != len(inputs):
+        return None
+
+    literals: Dict[str, List[Any]] = {column['field']: [] for column in inputs}
+    for rule in content.get('rules', []):
+        for column in inputs:
+            cell = (rule.get(column['id']) or '').strip()
+            if not cell:
+                continue
+            value = _literal(cell)
+            if type(value) not in (str, bool):
+                return None
+            if value not in literals[column['field']]:
+                literals[column['field']].append(value)
+
+        # Outputs that reference inputs would make results depend on more than the domain class
+        for column in content.get('outputs', []):
+            cell = (rule.get(column['id']) or '').strip()
+            if cell and _literal(cell) is _NOT_LITERAL:
+                return None
+
+    domains = []
+    for name, values in literals.items():
+        kinds = {type(value) for value in values}
+        if len(kinds) > 1:
+            return None
+        domains.append(_FieldDomain(name=name, kind=kinds.pop() if kinds else str, literals=values))
+    return domains
+
+
+_NOT_LITERAL = object()
+
+
+def _literal(cell: str) -> Any:
+    try:
+        return json.loads(cell)
+    except ValueError:
+        return _NOT_LITERAL
+
+
+def _observation(switch_field: str, switch_value: str, fields: List[_FieldDomain], key: Tuple[Any, ...], attempt: int) -> Dict[str, Any]:
+    observation = {switch_field: switch_value}
+    for domain, value_class in zip(fields, key):
+        if value_class is not MISSING:
+            observation[domain.name] = domain.representative(value_class, attempt)
+    return observation
+
+
+def _materialize(branch: _Branch, switch_field: str, switch_value: str, decision) -> bool:
+    """Enumerate a branch through the engine, then check the table against fresh engine evaluations."""
+    keys = list(itertools.product(*(domain.classes() for domain in branch.fields)))
+
+    for key in keys:
+        observation = _observation(switch_field, switch_value, branch.fields, key, 0)
+        result = decision.evaluate(observation).get('result', {})
+        branch.results[key] = result
+        echoed = [
+            domain.name for domain, value_class in zip(branch.fields, key)
+            if value_class is OTHER and result.get(domain.name) == observation[domain.name]
+        ]
+        if echoed:
+            branch.echoed[key] = echoed
+
+    lookup = FiniteDomainLookup(switch_field, {switch_value: branch})
+    for key in keys:
+        # A different representative for OTHER proves the result does not depend on the concrete string
+        observation = _observation(switch_field, switch_value, branch.fields, key, 1)
+        expected = decision.evaluate(observation).get('result', {})
+        if _canonical(lookup.lookup(observation)) != _canonical(expected):
+            return False
+    return True
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True)
@@ -1,13 +1,54 @@
 import requests
 import json
+import msgpack
 from typing import List, Dict, Any, Optional
+from urllib3.exceptions import NewConnectionError
+from .node_pool import NodePool
 
 
 class FireMitigationService:
-    """Service for submitting fire mitigation observations to the rules engine."""
+    """
+    Service for submitting fire mitigation observations to the rules engine.
 
-    def __init__(self, rules_api_base_url: str = "http://localhost:5000"):
-        self.rules_api_base_url = rules_api_base_url.rstrip('/')
+    Given several `rules_api_base_urls`, requests are sharded by property id with
+    consistent hashing so each property keeps reaching the same node and its warm
+    caches and delta state. Nodes that stop responding are ejected and their
+    properties fall over to the next node on the ring until they recover.
+    """
+
+    JSON_CONTENT_TYPE = 'application/json'
+    MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+    # Gateway errors mean the node, not the request, is at fault; 504 is left out because
+    # the engine answers it when the client's own deadline expires
+    NODE_FAILURE_STATUSES = (502, 503)
+
+    def __init__(
+        self,
+        rules_api_base_url: str = "http://localhost:5000",
+        wire_format: str = "json",
+        rules_api_base_urls: Optional[List[str]] = None,
+        max_concurrency_per_node: int = 16,
+        failure_threshold: int = 3,
+        ejection_seconds: float = 10.0,
+        node_pool: Optional[NodePool] = None
+    ):
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+
+        # Several clients can share one pool so health and concurrency limits are tracked fleet-wide
+        if node_pool is None:
+            node_pool = NodePool(
+                [url.rstrip('/') for url in (rules_api_base_urls or [rules_api_base_url])],
+                max_concurrency_per_node=max_concurrency_per_node,
+                failure_threshold=failure_threshold,
+                ejection_seconds=ejection_seconds
+            )
+        self.nodes = node_pool
+        self.rules_api_base_url = node_pool.nodes[0]
+        self.wire_format = wire_format
+        # Reuse connections across submissions instead of reconnecting per request
+        self._session = requests.Session()
 
     def submit_property_observations(
         self,
@@ -35,25 +76,173 @@ class FireMitigationService:
             'property_id': property_id
         }
 
-        # Determine endpoint URL
-        endpoint = f"{self.rules_api_base_url}/rules/latest" if version is None else f"{self.rules_api_base_url}/rules/version/{version}"
+        # Determine endpoint path
+        path = "/rules/latest" if version is None else f"/rules/version/{version}"
 
-        try:
-            # Submit to rules engine
-            response = requests.post(
-                endpoint,
-                json=payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
+        return self._post(property_id, path, payload, "Failed to submit observations to rules engine")
 
-            response.raise_for_status()
-            return response.json()
+    def submit_columnar_observations(
+        self,
+        property_id: str,
+        columns: Dict[str, List[Any]],
+        version: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit observations as one array per field instead of an array of objects.
 
-        except requests.exceptions.RequestException as e:
-            raise RuntimeError(f"Failed to submit observations to rules engine: {str(e)}") from e
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse rules engine response: {str(e)}") from e
+        Args:
+            property_id: Unique identifier for the property (used as request_id)
+            columns: Equal-length arrays keyed by field name; None marks a field absent for that observation
+            version: Optional version to use, defaults to 'latest'
+
+        Returns:
+            Dict containing the rules engine response with columnar results
+        """
+        if not columns or not any(columns.values()):
+            raise ValueError("columns cannot be empty")
+
+        payload = {
+            'columns': columns,
+            'property_id': property_id
+        }
+
+        path = "/rules/latest" if version is None else f"/rules/version/{version}"
+
+        return self._post(property_id, path, payload, "Failed to submit observations to rules engine")
+
+    def submit_property_delta(
+        self,
+        property_id: str,
+        added: Optional[Dict[str, Dict[str, Any]]] = None,
+        changed: Optional[Dict[str, Dict[str, Any]]] = None,
+        removed: Optional[List[str]] = None,
+        version: Optional[str] = None,
+        replace: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Submit only the observations that changed since the last assessment of a property.
+
+        Args:
+            property_id: Unique identifier for the property
+            added: New observations keyed by observation id
+            changed: Updated observations keyed by observation id
+            removed: Ids of observations that no longer apply
+            version: Optional version to use, defaults to 'latest'
+            replace: Whether `added` holds every observation of the property, as on its first
+                submission or after the engine answered 409 for unknown state
+
+        Returns:
+            Dict containing the merged assessment keyed by observation id
+        """
+        if not (added or changed or removed):
+            raise ValueError("delta cannot be empty")
+
+        payload = {
+            'property_id': property_id,
+            'added': added or {},
+            'changed': changed or {},
+            'removed': removed or [],
+            'replace': replace
+        }
+
+        path = "/rules/latest/delta" if version is None else f"/rules/version/{version}/delta"
+
+        # A delta the owning node may already have applied must not be applied again elsewhere
+        return self._post(
+            property_id, path, payload, "Failed to submit observation delta to rules engine", resend=False
+        )
+
+    def node_for_property(self, property_id: str) -> str:
+        """Get the node a property's requests are currently routed to."""
+        return self.nodes.candidates(str(property_id))[0]
+
+    def check_node_health(self) -> Dict[str, bool]:
+        """Probe every node's /health endpoint, reinstating nodes that respond and ejecting ones that do not."""
+        health = {}
+        for node in self.nodes.nodes:
+            try:
+                healthy = self._session.get(f"{node}/health", timeout=5).ok
+            except requests.exceptions.RequestException:
+                healthy = False
+
+            if healthy:
+                self.nodes.record_success(node)
+            else:
+                self.nodes.record_failure(node)
+            health[node] = healthy
+        return health
+
+    def _post(
+        self,
+        property_id: str,
+        path: str,
+        payload: Dict[str, Any],
+        failure_message: str,
+        resend: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Post a payload to the node owning the property, falling over to the next node when it is unreachable.
+
+        Only connection failures and 502/503 responses are retried elsewhere; a
+        request that timed out may still be running on its node, so it is not
+        resent. With `resend` disabled, only requests that never reached a node
+        (the connection could not be opened) fall over.
+        """
+        body = self._encode_payload(payload)
+        headers = self._request_headers()
+        last_error: Optional[requests.exceptions.RequestException] = None
+
+        for node in self.nodes.candidates(str(property_id)):
+            try:
+                with self.nodes.slot(node):
+                    response = self._session.post(f"{node}{path}", data=body, headers=headers, timeout=30)
+            except requests.exceptions.ConnectionError as e:
+                self.nodes.record_failure(node)
+                if not (resend or _never_sent(e)):
+                    raise RuntimeError(f"{failure_message}: {str(e)}") from e
+                last_error = e
+                continue
+            except requests.exceptions.RequestException as e:
+                self.nodes.record_failure(node)
+                raise RuntimeError(f"{failure_message}: {str(e)}") from e
+
+            if response.status_code in self.NODE_FAILURE_STATUSES:
+                self.nodes.record_failure(node)
+                last_error = requests.exceptions.HTTPError(
+                    f"{response.status_code} Server Error for url: {response.url}", response=response
+                )
+                if not resend:
+                    raise RuntimeError(f"{failure_message}: {str(last_error)}") from last_error
+                continue
+
+            self.nodes.record_success(node)
+            try:
+                response.raise_for_status()
+                return self._decode_response(response)
+            except requests.exceptions.RequestException as e:
+                raise RuntimeError(f"{failure_message}: {str(e)}") from e
+            except (json.JSONDecodeError, msgpack.UnpackException, ValueError) as e:
+                raise RuntimeError(f"Failed to parse rules engine response: {str(e)}") from e
+
+        raise RuntimeError(f"{failure_message}: {str(last_error)}") from last_error
+
+    def _request_headers(self) -> Dict[str, str]:
+        """Build Content-Type and Accept headers for the configured wire format."""
+        content_type = self.MSGPACK_CONTENT_TYPE if self.wire_format == "msgpack" else self.JSON_CONTENT_TYPE
+        return {'Content-Type': content_type, 'Accept': content_type}
+
+    def _encode_payload(self, payload: Dict[str, Any]) -> bytes:
+        """Encode a request payload using the configured wire format."""
+        if self.wire_format == "msgpack":
+            return msgpack.packb(payload, use_bin_type=True)
+        return json.dumps(payload).encode('utf-8')
+
+    def _decode_response(self, response: requests.Response) -> Dict[str, Any]:
+        """Decode a response body according to the Content-Type the server chose."""
+        content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+        if content_type == self.MSGPACK_CONTENT_TYPE:
+            return msgpack.unpackb(response.content, raw=False)
+        return response.json()
 
     def create_sample_observations(self) -> List[Dict[str, Any]]:
         """
@@ -119,3 +308,11 @@ class FireMitigationService:
             observations=all_observations,
             version=version
         )
+
+
+def _never_sent(error: requests.exceptions.ConnectionError) -> bool:
+    """Check whether a connection error happened before any of the request reached the node."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, 'reason', reason), NewConnectionError)
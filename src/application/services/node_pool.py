@@ -0,0 +1,183 @@
+import bisect
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class NodeSaturatedError(RuntimeError):
+    """Raised when a node's concurrency limit stays full for longer than the acquire timeout."""
+
+
+class ConsistentHashRing:
+    """
+    Maps keys onto nodes with consistent hashing.
+
+    Each node is placed on the ring at `replicas` virtual points so load spreads
+    evenly, and adding or removing a node only moves the keys adjacent to its points.
+    """
+
+    def __init__(self, nodes: List[str] = None, replicas: int = 160):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self._nodes: List[str] = []
+        for node in nodes or []:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def add_node(self, node: str) -> None:
+        """Place a node's virtual points on the ring."""
+        if node in self._nodes:
+            return
+        self._nodes.append(node)
+        for i in range(self.replicas):
+            point = _hash(f"{node}#{i}")
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def remove_node(self, node: str) -> None:
+        """Remove a node's virtual points from the ring."""
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        kept = [(point, owner) for point, owner in zip(self._points, self._owners) if owner != node]
+        self._points = [point for point, _ in kept]
+        self._owners = [owner for _, owner in kept]
+
+    def node_for(self, key: str) -> Optional[str]:
+        """Get the node owning a key, or None when the ring is empty."""
+        preference = self.preference_list(key)
+        return preference[0] if preference else None
+
+    def preference_list(self, key: str) -> List[str]:
+        """Get every node in the order a key falls over to them, owner first."""
+        if not self._points:
+            return []
+
+        start = bisect.bisect(self._points, _hash(key))
+        preference: List[str] = []
+        for offset in range(len(self._points)):
+            owner = self._owners[(start + offset) % len(self._points)]
+            if owner not in preference:
+                preference.append(owner)
+                if len(preference) == len(self._nodes):
+                    break
+        return preference
+
+
+class NodePool:
+    """
+    Routes keys to a fleet of nodes, ejecting unhealthy nodes and bounding per-node concurrency.
+
+    A node is ejected after `failure_threshold` consecutive failures. Its keys fall
+    over to the next node on the ring until `ejection_seconds` have passed, after
+    which the node is tried again; one success reinstates it and one more failure
+    ejects it for another period.
+    """
+
+    def __init__(
+        self,
+        nodes: List[str],
+        max_concurrency_per_node: int = 16,
+        failure_threshold: int = 3,
+        ejection_seconds: float = 10.0,
+        acquire_timeout: float = 30.0,
+        replicas: int = 160,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if not nodes:
+            raise ValueError("nodes cannot be empty")
+
+        self.max_concurrency_per_node = max_concurrency_per_node
+        self.failure_threshold = failure_threshold
+        self.ejection_seconds = ejection_seconds
+        self.acquire_timeout = acquire_timeout
+        self._clock = clock
+
+        self._ring = ConsistentHashRing(nodes, replicas=replicas)
+        self._lock = threading.Lock()
+        self._failures: Dict[str, int] = {node: 0 for node in self._ring.nodes}
+        self._ejected_until: Dict[str, float] = {}
+        self._requests: Dict[str, int] = {node: 0 for node in self._ring.nodes}
+        self._ejections: Dict[str, int] = {node: 0 for node in self._ring.nodes}
+        # A non-positive limit disables per-node concurrency control
+        self._slots: Dict[str, Optional[threading.BoundedSemaphore]] = {
+            node: threading.BoundedSemaphore(max_concurrency_per_node) if max_concurrency_per_node > 0 else None
+            for node in self._ring.nodes
+        }
+
+    @property
+    def nodes(self) -> List[str]:
+        return self._ring.nodes
+
+    def candidates(self, key: str) -> List[str]:
+        """
+        Get the nodes to try for a key, in order.
+
+        Available nodes come first in ring order; ejected nodes follow as a last
+        resort so requests still go somewhere when the whole fleet looks unhealthy.
+        """
+        preference = self._ring.preference_list(key)
+        now = self._clock()
+        with self._lock:
+            available = [node for node in preference if self._ejected_until.get(node, 0.0) <= now]
+        return available + [node for node in preference if node not in available]
+
+    @contextmanager
+    def slot(self, node: str) -> Iterator[None]:
+        """
+        Hold one of a node's concurrency slots for the duration of the block.
+
+        Raises:
+            NodeSaturatedError: If no slot frees up within the acquire timeout
+        """
+        semaphore = self._slots[node]
+        if semaphore is not None and not semaphore.acquire(timeout=self.acquire_timeout):
+            raise NodeSaturatedError(f"Node {node} is at its concurrency limit of {self.max_concurrency_per_node}")
+
+        with self._lock:
+            self._requests[node] += 1
+        try:
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def record_success(self, node: str) -> None:
+        """Reset a node's failure count, reinstating it if it was ejected."""
+        with self._lock:
+            self._failures[node] = 0
+            self._ejected_until.pop(node, None)
+
+    def record_failure(self, node: str) -> None:
+        """Count a failure against a node, ejecting it once the threshold is reached."""
+        with self._lock:
+            self._failures[node] += 1
+            # A node on probation after an ejection is ejected again on its first failure
+            if node in self._ejected_until or self._failures[node] >= self.failure_threshold:
+                self._ejected_until[node] = self._clock() + self.ejection_seconds
+                self._ejections[node] += 1
+
+    def snapshot(self) -> dict:
+        """Return per-node health, ejection and request counters."""
+        now = self._clock()
+        with self._lock:
+            return {
+                node: {
+                    'healthy': self._ejected_until.get(node, 0.0) <= now,
+                    'consecutive_failures': self._failures[node],
+                    'ejections': self._ejections[node],
+                    'requests': self._requests[node]
+                }
+                for node in self._ring.nodes
+            }
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode('utf-8')).digest()[:8], 'big')
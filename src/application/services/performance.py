@@ -0,0 +1,27 @@
+import re
+
+
+_PERFORMANCE_PATTERN = re.compile(r'^\s*([0-9]*\.?[0-9]+)\s*(ns|µs|us|ms|s)\s*$')
+
+_UNIT_TO_MICROSECONDS = {
+    'ns': 0.001,
+    'µs': 1.0,
+    'us': 1.0,
+    'ms': 1000.0,
+    's': 1000000.0
+}
+
+
+def parse_performance_us(performance: str) -> float:
+    """Convert a zen engine performance string such as '35.0µs' or '1.2ms' into microseconds."""
+    match = _PERFORMANCE_PATTERN.match(performance or '')
+    if not match:
+        return 0.0
+
+    value, unit = match.groups()
+    return float(value) * _UNIT_TO_MICROSECONDS[unit]
+
+
+def format_performance_us(microseconds: float) -> str:
+    """Format microseconds the way aggregated performance is reported by the API."""
+    return f"{microseconds:.1f}µs"
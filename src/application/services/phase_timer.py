@@ -0,0 +1,78 @@
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class PhaseTimer:
+    """
+    Accumulates wall-clock time per named phase of one request.
+
+    Phases may nest; a phase's time excludes the phases running inside it, so the
+    recorded phases add up to the time spent inside any of them. Repeated phases
+    with the same name are summed.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        # Child time accumulated by each open phase, innermost last
+        self._open: List[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as `name`."""
+        started = time.perf_counter()
+        self._open.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._open.pop()
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - children
+            if self._open:
+                self._open[-1] += elapsed
+
+    def elapsed_ms(self) -> float:
+        """Time since the timer was created, in milliseconds."""
+        return (time.perf_counter() - self.started) * 1000.0
+
+    def phases_ms(self) -> Dict[str, float]:
+        """Recorded phases in milliseconds, in the order they first ran."""
+        return {name: seconds * 1000.0 for name, seconds in self.phases.items()}
+
+    def server_timing(self, total_ms: Optional[float] = None) -> str:
+        """Format the phases and total as a Server-Timing header value."""
+        entries = [f"{name};dur={ms:.3f}" for name, ms in self.phases_ms().items()]
+        entries.append(f"total;dur={self.elapsed_ms() if total_ms is None else total_ms:.3f}")
+        return ', '.join(entries)
+
+
+_current: contextvars.ContextVar[Optional[PhaseTimer]] = contextvars.ContextVar('phase_timer', default=None)
+
+
+def start_timer() -> contextvars.Token:
+    """Make a new timer current for the calling context, returning the token to stop it with."""
+    return _current.set(PhaseTimer())
+
+
+def stop_timer(token: contextvars.Token) -> None:
+    """Restore the timer that was current before start_timer()."""
+    _current.reset(token)
+
+
+def current_timer() -> Optional[PhaseTimer]:
+    """Get the timer of the request being handled, if one is being timed."""
+    return _current.get()
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Time the enclosed block as a phase of the current request; does nothing outside a timed request."""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+
+    with timer.phase(name):
+        yield
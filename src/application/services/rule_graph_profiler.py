@@ -0,0 +1,102 @@
+import random
+import threading
+from typing import Any, Dict, Optional
+from .performance import parse_performance_us
+
+
+class RuleGraphProfiler:
+    """Aggregates engine trace output per version, graph node and decision table row."""
+
+    def __init__(self, sample_rate: float = 0.0):
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._versions: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def should_sample(self) -> bool:
+        """Decide whether the next evaluation should run with tracing enabled."""
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def record(self, version: str, trace: Dict[str, Any], performance: Optional[str] = None) -> None:
+        """Fold a single evaluation trace into the aggregate for a version."""
+        with self._lock:
+            profile = self._versions.setdefault(version, {
+                'samples': 0,
+                'total_us': 0.0,
+                'nodes': {}
+            })
+            profile['samples'] += 1
+            profile['total_us'] += parse_performance_us(performance)
+            self._record_nodes(profile['nodes'], trace)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the aggregated statistics with derived averages."""
+        with self._lock:
+            versions = {}
+            for version, profile in self._versions.items():
+                nodes = {}
+                for node_key, node in profile['nodes'].items():
+                    nodes[node_key] = {
+                        **node,
+                        'avg_us': node['total_us'] / node['hits'] if node['hits'] else 0.0,
+                        'rows': {row_id: dict(row) for row_id, row in node['rows'].items()}
+                    }
+
+                versions[version] = {
+                    'samples': profile['samples'],
+                    'total_us': profile['total_us'],
+                    'avg_us': profile['total_us'] / profile['samples'] if profile['samples'] else 0.0,
+                    'nodes': nodes
+                }
+
+            return {
+                'sample_rate': self.sample_rate,
+                'versions': versions
+            }
+
+    def reset(self) -> None:
+        """Discard all aggregated statistics."""
+        with self._lock:
+            self._versions = {}
+
+    def _record_nodes(self, nodes: Dict[str, Any], trace: Dict[str, Any], prefix: str = '') -> None:
+        for node_id, node_trace in trace.items():
+            if not isinstance(node_trace, dict):
+                continue
+
+            node_key = f"{prefix}{node_id}"
+            node = nodes.setdefault(node_key, {
+                'name': node_trace.get('name'),
+                'hits': 0,
+                'total_us': 0.0,
+                'max_us': 0.0,
+                'rows': {}
+            })
+
+            elapsed_us = parse_performance_us(node_trace.get('performance'))
+            node['hits'] += 1
+            node['total_us'] += elapsed_us
+            node['max_us'] = max(node['max_us'], elapsed_us)
+
+            trace_data = node_trace.get('traceData')
+            if not isinstance(trace_data, dict):
+                continue
+
+            if 'rule' in trace_data:
+                # Decision table: record which row produced the first hit
+                rule = trace_data.get('rule') or {}
+                row_id = rule.get('_id')
+                if row_id is not None:
+                    row = node['rows'].setdefault(row_id, {'index': trace_data.get('index'), 'hits': 0})
+                    row['hits'] += 1
+            elif 'statements' in trace_data:
+                # Switch node: record which statements matched
+                for statement in trace_data.get('statements') or []:
+                    row = node['rows'].setdefault(statement.get('id'), {'index': None, 'hits': 0})
+                    row['hits'] += 1
+            elif trace_data and all(isinstance(child, dict) and 'order' in child for child in trace_data.values()):
+                # Decision node: traceData holds the trace of the referenced sub-graph
+                self._record_nodes(nodes, trace_data, prefix=f"{node_key}/")
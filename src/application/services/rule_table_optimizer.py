@@ -0,0 +1,260 @@
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_STRING_LITERAL = re.compile(r'^"([^"\\]*)"$|^\'([^\'\\]*)\'$')
+_NUMBER_LITERAL = re.compile(r'^-?[0-9]+(\.[0-9]+)?$')
+_COMPARISON = re.compile(r'^(>=|<=|>|<)\s*(-?[0-9]+(?:\.[0-9]+)?)$')
+_RANGE = re.compile(r'^([\[\(])\s*(-?[0-9]+(?:\.[0-9]+)?)\s*\.\.\s*(-?[0-9]+(?:\.[0-9]+)?)\s*([\]\)])$')
+
+
+@dataclass
+class CellCondition:
+    """
+    Conservative model of a decision table cell.
+
+    kind is one of:
+        'any'      - empty cell, matches every value
+        'values'   - equality against one of a finite set of literals
+        'interval' - numeric comparison or range
+        'unknown'  - anything else; nothing can be proven about it
+    """
+
+    kind: str
+    values: frozenset = frozenset()
+    low: float = float('-inf')
+    low_inclusive: bool = False
+    high: float = float('inf')
+    high_inclusive: bool = False
+
+    def contains_number(self, number: float) -> bool:
+        above = number > self.low or (self.low_inclusive and number == self.low)
+        below = number < self.high or (self.high_inclusive and number == self.high)
+        return above and below
+
+
+@dataclass
+class TableOptimization:
+    """Outcome of optimizing a single first-hit decision table."""
+
+    node_id: str
+    node_name: str
+    original_order: List[str]
+    optimized_order: List[str]
+    pinned_pairs: int
+    unreachable_rows: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def reordered(self) -> bool:
+        return self.original_order != self.optimized_order
+
+
+@dataclass
+class OptimizationReport:
+    """Summary of all tables considered by the optimizer."""
+
+    tables: List[TableOptimization] = field(default_factory=list)
+    skipped: List[Dict[str, str]] = field(default_factory=list)
+
+
+def parse_cell(cell: str) -> CellCondition:
+    """Parse a decision table cell into a CellCondition, falling back to 'unknown'."""
+    text = (cell or '').strip()
+    if not text:
+        return CellCondition('any')
+
+    comparison = _COMPARISON.match(text)
+    if comparison:
+        operator, number = comparison.group(1), float(comparison.group(2))
+        if operator in ('>', '>='):
+            return CellCondition('interval', low=number, low_inclusive=operator == '>=')
+        return CellCondition('interval', high=number, high_inclusive=operator == '<=')
+
+    interval = _RANGE.match(text)
+    if interval:
+        return CellCondition(
+            'interval',
+            low=float(interval.group(2)),
+            low_inclusive=interval.group(1) == '[',
+            high=float(interval.group(3)),
+            high_inclusive=interval.group(4) == ']'
+        )
+
+    values = set()
+    for part in text.split(','):
+        literal = _parse_literal(part.strip())
+        if literal is None:
+            return CellCondition('unknown')
+        values.add(literal)
+
+    return CellCondition('values', values=frozenset(values))
+
+
+def _parse_literal(text: str) -> Optional[Tuple[str, Any]]:
+    """Parse a literal into a type-tagged value so that true and 1 never compare equal."""
+    string = _STRING_LITERAL.match(text)
+    if string:
+        return ('string', string.group(1) if string.group(1) is not None else string.group(2))
+    if _NUMBER_LITERAL.match(text):
+        return ('number', float(text))
+    if text in ('true', 'false'):
+        return ('bool', text == 'true')
+    if text == 'null':
+        return ('null', None)
+    return None
+
+
+def cells_disjoint(first: CellCondition, second: CellCondition) -> bool:
+    """Prove that no value can satisfy both cells."""
+    if 'any' in (first.kind, second.kind) or 'unknown' in (first.kind, second.kind):
+        return False
+
+    if first.kind == 'values' and second.kind == 'values':
+        return not (first.values & second.values)
+
+    if first.kind == 'interval' and second.kind == 'interval':
+        return _intervals_disjoint(first, second)
+
+    values, interval = (first, second) if first.kind == 'values' else (second, first)
+    # Only numeric literals can be reasoned about against a numeric interval
+    if any(kind != 'number' for kind, _ in values.values):
+        return False
+    return not any(interval.contains_number(number) for _, number in values.values)
+
+
+def cell_covers(outer: CellCondition, inner: CellCondition) -> bool:
+    """Prove that every value satisfying inner also satisfies outer."""
+    if outer.kind == 'any':
+        return True
+    if inner.kind in ('any', 'unknown') or outer.kind == 'unknown':
+        return False
+
+    if outer.kind == 'values':
+        return inner.kind == 'values' and inner.values <= outer.values
+
+    if inner.kind == 'values':
+        return all(kind == 'number' and outer.contains_number(number) for kind, number in inner.values)
+
+    low_ok = inner.low > outer.low or (inner.low == outer.low and (outer.low_inclusive or not inner.low_inclusive))
+    high_ok = inner.high < outer.high or (inner.high == outer.high and (outer.high_inclusive or not inner.high_inclusive))
+    return low_ok and high_ok
+
+
+def _intervals_disjoint(first: CellCondition, second: CellCondition) -> bool:
+    if first.high < second.low or second.high < first.low:
+        return True
+    if first.high == second.low:
+        return not (first.high_inclusive and second.low_inclusive)
+    if second.high == first.low:
+        return not (second.high_inclusive and first.low_inclusive)
+    return False
+
+
+class RuleTableOptimizer:
+    """Reorders first-hit decision table rows by observed hit counts without changing semantics."""
+
+    def __init__(self, row_hits: Dict[str, int]):
+        self.row_hits = row_hits
+
+    @staticmethod
+    def load_row_hits(stats: Dict[str, Any], version: Optional[str] = None) -> Dict[str, int]:
+        """
+        Extract per-row hit counts from an /admin/profile snapshot or a flat {row_id: hits} mapping.
+
+        Args:
+            stats: Parsed statistics document
+            version: Version to read from a profile snapshot; all versions are summed if omitted
+
+        Returns:
+            Dict of decision table row id to hit count
+        """
+        if 'versions' not in stats:
+            return {row_id: int(hits) for row_id, hits in stats.items()}
+
+        versions = stats['versions']
+        if version is not None:
+            versions = {version: versions.get(version, {})}
+
+        row_hits: Dict[str, int] = {}
+        for profile in versions.values():
+            for node in profile.get('nodes', {}).values():
+                for row_id, row in node.get('rows', {}).items():
+                    row_hits[row_id] = row_hits.get(row_id, 0) + int(row.get('hits', 0))
+        return row_hits
+
+    def optimize(self, rule_json: str) -> Tuple[str, OptimizationReport]:
+        """
+        Produce an equivalent decision graph with hot rows moved ahead of colder ones.
+
+        Args:
+            rule_json: Decision graph JSON content
+
+        Returns:
+            Tuple of optimized decision graph JSON and a report of what changed
+        """
+        graph = json.loads(rule_json)
+        report = OptimizationReport()
+
+        for node in graph.get('nodes', []):
+            if node.get('type') != 'decisionTableNode':
+                continue
+
+            content = node.get('content', {})
+            if content.get('hitPolicy') != 'first':
+                report.skipped.append({'node_id': node['id'], 'reason': f"hitPolicy {content.get('hitPolicy')}"})
+                continue
+
+            rows, table = self._optimize_table(node['id'], node.get('name'), content)
+            content['rules'] = rows
+            report.tables.append(table)
+
+        return json.dumps(graph, indent=2, ensure_ascii=False), report
+
+    def _optimize_table(self, node_id: str, node_name: str, content: Dict[str, Any]):
+        rows = content.get('rules', [])
+        input_ids = [column['id'] for column in content.get('inputs', [])]
+        conditions = [[parse_cell(row.get(input_id, '')) for input_id in input_ids] for row in rows]
+
+        # predecessors[j] holds every earlier row that must stay ahead of row j
+        predecessors = [set() for _ in rows]
+        pinned_pairs = 0
+        for later in range(len(rows)):
+            for earlier in range(later):
+                if not self._rows_disjoint(conditions[earlier], conditions[later]):
+                    predecessors[later].add(earlier)
+                    pinned_pairs += 1
+
+        unreachable = []
+        for later in range(len(rows)):
+            for earlier in range(later):
+                if all(cell_covers(outer, inner) for outer, inner in zip(conditions[earlier], conditions[later])):
+                    unreachable.append({
+                        'row_id': rows[later].get('_id'),
+                        'index': later,
+                        'shadowed_by': rows[earlier].get('_id')
+                    })
+                    break
+
+        order = []
+        placed = set()
+        while len(order) < len(rows):
+            available = [i for i in range(len(rows)) if i not in placed and predecessors[i] <= placed]
+            chosen = max(available, key=lambda i: (self.row_hits.get(rows[i].get('_id'), 0), -i))
+            order.append(chosen)
+            placed.add(chosen)
+
+        table = TableOptimization(
+            node_id=node_id,
+            node_name=node_name,
+            original_order=[row.get('_id') for row in rows],
+            optimized_order=[rows[i].get('_id') for i in order],
+            pinned_pairs=pinned_pairs,
+            unreachable_rows=unreachable
+        )
+        return [rows[i] for i in order], table
+
+    @staticmethod
+    def _rows_disjoint(first: List[CellCondition], second: List[CellCondition]) -> bool:
+        return any(cells_disjoint(a, b) for a, b in zip(first, second))
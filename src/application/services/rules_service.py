@@ -1,16 +1,41 @@
 import json
 import os
-import zen
+import time
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from ...domain.interfaces.rules_service import IRulesService
+from ...domain.interfaces.audit_sink import IAuditSink
+from ...domain.interfaces.property_state_repository import IPropertyStateRepository
+from ...domain.interfaces.result_cache import IResultCache
+from ...domain.models.audit_record import AuditRecord
+from ...domain.models.property_state import PropertyDeltaRequest, PropertyState
 from ...domain.models.rule_evaluation import RuleEvaluationRequest, RuleEvaluationResult
+from .compiled_decision_cache import CompiledDecisionCache
+from .finite_domain_lookup import FiniteDomainLookup
+from .performance import format_performance_us, parse_performance_us
+from .phase_timer import timed
+from .rule_graph_profiler import RuleGraphProfiler
 
 
 class RulesService(IRulesService):
     """Service implementation for rules engine operations."""
 
-    def __init__(self, rules_base_path: str = None):
-        self.engine = zen.ZenEngine()
+    def __init__(
+        self,
+        rules_base_path: str = None,
+        profiler: RuleGraphProfiler = None,
+        property_state_repository: IPropertyStateRepository = None,
+        max_observations_per_property: int = 1000,
+        audit_sink: IAuditSink = None,
+        decision_cache: CompiledDecisionCache = None,
+        result_cache: IResultCache = None,
+        rules_file_name: str = 'fire_risk.json'
+    ):
+        self._profiler = profiler
+        self._result_cache = result_cache
+        self._property_states = property_state_repository
+        self._audit_sink = audit_sink
+        self.max_observations_per_property = max_observations_per_property
         # Default to src/rules/fire_risk relative to the service file location
         if rules_base_path is None:
             current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,6 +43,15 @@ class RulesService(IRulesService):
         else:
             self.rules_base_path = rules_base_path
 
+        # Decisions are compiled through a shared cache whose engine resolves decision node references
+        rules_root, self._rules_family = os.path.split(os.path.normpath(self.rules_base_path))
+        if decision_cache is None:
+            decision_cache = CompiledDecisionCache(rules_root)
+        # Each version directory holds the decision under a fixed file name, whatever the directory is called
+        decision_cache.register_family(self._rules_family, rules_file_name)
+        self._decision_cache = decision_cache
+        self.engine = decision_cache.engine
+
     def get_available_versions(self):
         """Get list of available rule versions."""
         try:
@@ -39,59 +73,35 @@ class RulesService(IRulesService):
         versions = self.get_available_versions()
         return versions[0] if versions else None
 
-    def load_rules_by_version(self, version: str = None):
-        """Load rules JSON content by version."""
-        if version is None:
-            version = self.get_latest_version()
-        
-        if version is None:
-            raise FileNotFoundError("No rule versions available")
-        
-        rules_file_path = os.path.join(self.rules_base_path, version, 'fire_risk.json')
-        
-        if not os.path.exists(rules_file_path):
-            raise FileNotFoundError(f"Rules file not found for version {version}: {rules_file_path}")
-
-        with open(rules_file_path, 'r') as f:
-            return f.read()
-
     def evaluate_fire_risk(self, request: RuleEvaluationRequest) -> RuleEvaluationResult:
         """Evaluate fire risk rules against provided observations."""
+        started = time.perf_counter()
         try:
             # Determine which version will be used
             version_to_use = request.version
             if version_to_use is None:
-                version_to_use = self.get_latest_version()
-            
-            # Load rule definition by version
-            rule_json = self.load_rules_by_version(version_to_use)
-
-            # Create decision from rule definition
-            decision = self.engine.create_decision(rule_json)
-
-            # Handle both single observation and array of observations
-            if isinstance(request.observations, list):
-                # Process array of observations
-                results = []
-                total_performance_time = 0
-                
-                for observation in request.observations:
-                    result = decision.evaluate(observation)
-                    results.append(result.get('result', {}))
-                    
-                    # Parse performance time for aggregation
-                    perf_str = result.get('performance', '0µs')
-                    if 'µs' in perf_str:
-                        time_val = float(perf_str.replace('µs', ''))
-                        total_performance_time += time_val
-                
-                final_result = results
-                performance_str = f"{total_performance_time:.1f}µs"
-            else:
-                # Process single observation
-                result = decision.evaluate(request.observations)
-                final_result = result.get('result', {})
-                performance_str = result.get('performance', '')
+                with timed('resolve'):
+                    version_to_use = self.get_latest_version()
+
+            # Load compiled decision by version
+            decision = self._load_decision(version_to_use)
+            lookup = self._load_lookup(version_to_use)
+
+            with timed('evaluate'):
+                # Handle both single observation and array of observations
+                if isinstance(request.observations, list):
+                    final_result, total_performance_time = self._evaluate_observations(
+                        decision, request.observations, version_to_use, lookup, request.deadline
+                    )
+                else:
+                    results, total_performance_time = self._evaluate_observations(
+                        decision, [request.observations], version_to_use, lookup, request.deadline
+                    )
+                    final_result = results[0]
+                performance_str = format_performance_us(total_performance_time)
+
+            self._audit('evaluation', request.request_id, version_to_use, request.observations,
+                        final_result, performance_str, started)
 
             return RuleEvaluationResult(
                 result=final_result,
@@ -100,5 +110,228 @@ class RulesService(IRulesService):
                 api_version=version_to_use,
                 request_id=request.request_id
             )
+        except TimeoutError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Failed to evaluate rules: {str(e)}") from e
+
+    def evaluate_property_delta(self, request: PropertyDeltaRequest) -> RuleEvaluationResult:
+        """Evaluate only added and changed observations and return the merged property assessment."""
+        if self._property_states is None:
+            raise RuntimeError("Property state store is not configured")
+
+        started = time.perf_counter()
+        version_to_use = request.version
+        if version_to_use is None:
+            with timed('resolve'):
+                version_to_use = self.get_latest_version()
+        if version_to_use is None:
+            raise RuntimeError("Failed to evaluate rules: No rule versions available")
+
+        # State is keyed by version, so only a version that exists may reach the store
+        try:
+            decision = self._load_decision(version_to_use)
+            lookup = self._load_lookup(version_to_use)
         except Exception as e:
             raise RuntimeError(f"Failed to evaluate rules: {str(e)}") from e
+
+        with self._property_states.lock(request.property_id, version_to_use):
+            if request.replace:
+                if request.changed or request.removed:
+                    raise ValueError("A replacing submission may only contain added observations")
+                existing = None
+            else:
+                existing = self._property_states.get(request.property_id, version_to_use)
+                # Without stored state a delta would silently drop every earlier observation
+                if existing is None:
+                    raise LookupError(
+                        f"No stored state for property {request.property_id} at version {version_to_use}; "
+                        f"resubmit all observations as added with replace set"
+                    )
+            known_ids = set(existing.observations) if existing is not None else set()
+
+            # Changes against state this instance does not hold cannot be merged correctly
+            unknown_ids = (set(request.changed) | set(request.removed)) - known_ids
+            if unknown_ids:
+                raise LookupError(
+                    f"Unknown observation ids for property {request.property_id} at version {version_to_use}: "
+                    f"{', '.join(sorted(unknown_ids))}; resubmit all observations as added with replace set"
+                )
+
+            conflicting_ids = set(request.changed) & set(request.removed)
+            if conflicting_ids:
+                raise ValueError(f"Observation ids both changed and removed: {', '.join(sorted(conflicting_ids))}")
+
+            duplicate_ids = set(request.added) & known_ids
+            if duplicate_ids:
+                raise ValueError(f"Observation ids already exist: {', '.join(sorted(duplicate_ids))}")
+
+            remaining = (len(known_ids) - len(set(request.removed))) + len(request.added)
+            if remaining > self.max_observations_per_property:
+                raise ValueError(
+                    f"Property would hold {remaining} observations, limit is {self.max_observations_per_property}"
+                )
+
+            try:
+                state = PropertyState(
+                    property_id=request.property_id,
+                    version=version_to_use,
+                    observations=dict(existing.observations) if existing is not None else {},
+                    results=dict(existing.results) if existing is not None else {}
+                )
+                for observation_id in request.removed:
+                    state.observations.pop(observation_id, None)
+                    state.results.pop(observation_id, None)
+
+                pending = dict(request.added)
+                for observation_id, observation in request.changed.items():
+                    # Resubmitting an identical observation does not need another evaluation
+                    if observation != state.observations.get(observation_id):
+                        pending[observation_id] = observation
+
+                with timed('evaluate'):
+                    results, total_performance_time = self._evaluate_observations(
+                        decision, list(pending.values()), version_to_use, lookup, request.deadline
+                    )
+                for (observation_id, observation), result in zip(pending.items(), results):
+                    state.observations[observation_id] = observation
+                    state.results[observation_id] = result
+
+                self._property_states.save(state)
+            except TimeoutError:
+                raise
+            except Exception as e:
+                raise RuntimeError(f"Failed to evaluate rules: {str(e)}") from e
+
+        performance_str = format_performance_us(total_performance_time)
+        self._audit(
+            'delta',
+            request.property_id,
+            version_to_use,
+            {'added': request.added, 'changed': request.changed, 'removed': request.removed},
+            {observation_id: state.results[observation_id] for observation_id in pending},
+            performance_str,
+            started
+        )
+
+        return RuleEvaluationResult(
+            result=dict(state.results),
+            performance=performance_str,
+            timestamp=datetime.utcnow(),
+            api_version=version_to_use,
+            request_id=request.property_id
+        )
+
+    def _load_decision(self, version: str):
+        """Get the compiled decision for a version from the shared cache."""
+        if version is None:
+            raise FileNotFoundError("No rule versions available")
+
+        return self._decision_cache.get_decision(self._rules_family, version)
+
+    def _load_lookup(self, version: str) -> Optional[FiniteDomainLookup]:
+        """Get the precomputed finite-domain lookup for a version, if lookups are enabled."""
+        return self._decision_cache.get_lookup(self._rules_family, version)
+
+    def _audit(self, kind: str, property_id, version: str, inputs, outputs, performance: str, started: float) -> None:
+        """Hand an evaluation to the audit sink; the sink never blocks on I/O."""
+        if self._audit_sink is None:
+            return
+
+        self._audit_sink.record(AuditRecord(
+            kind=kind,
+            property_id=property_id,
+            version=version,
+            inputs=inputs,
+            outputs=outputs,
+            performance=performance,
+            duration_ms=(time.perf_counter() - started) * 1000.0
+        ))
+
+    def _evaluate_observations(
+        self,
+        decision,
+        observations: List[Dict[str, Any]],
+        version: str,
+        lookup: Optional[FiniteDomainLookup],
+        deadline: Optional[float]
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Evaluate observations in order, returning their results and the summed evaluation time in microseconds.
+
+        When a shared result cache is available, observations a lookup table cannot
+        answer are fetched from it in one batch and only the misses reach the engine.
+        Observations selected for profiling bypass both so the profiler sees every
+        row a sampled evaluation hits.
+        """
+        # Decide sampling first: lookup tables and cached results never reach the profiler
+        sampled = [self._profiler is not None and self._profiler.should_sample() for _ in observations]
+
+        precomputed: List[Optional[Dict[str, Any]]] = [None] * len(observations)
+        if lookup is not None:
+            for i, observation in enumerate(observations):
+                if sampled[i]:
+                    continue
+                started = time.perf_counter()
+                result = lookup.lookup(observation)
+                if result is not None:
+                    precomputed[i] = {
+                        'result': result,
+                        'performance': format_performance_us((time.perf_counter() - started) * 1000000.0)
+                    }
+
+        cached: Dict[int, Dict[str, Any]] = {}
+        fingerprint = None
+        if self._result_cache is not None and self._result_cache.available():
+            # Lookup tables answer faster than a cache round trip, so only the rest are fetched
+            candidates = [i for i in range(len(observations)) if precomputed[i] is None and not sampled[i]]
+            if candidates:
+                fingerprint = self._decision_cache.fingerprint(self._rules_family, version)
+                with timed('result_cache'):
+                    hits = self._result_cache.get_many(version, fingerprint, [observations[i] for i in candidates])
+                cached = {i: hit for i, hit in zip(candidates, hits) if hit is not None}
+                candidates = set(candidates)
+
+        results = []
+        computed = []
+        total_performance_time = 0
+        for i, observation in enumerate(observations):
+            if i in cached:
+                results.append(cached[i])
+                continue
+
+            # Drop remaining work once the caller can no longer use the result
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Request deadline exceeded after {i} of {len(observations)} observations")
+
+            if precomputed[i] is not None:
+                result = precomputed[i]
+            else:
+                result = self._evaluate_observation(decision, observation, version, sampled[i])
+            results.append(result.get('result', {}))
+
+            # Parse performance time for aggregation
+            total_performance_time += parse_performance_us(result.get('performance', '0µs'))
+            if fingerprint is not None and i in candidates:
+                computed.append((observation, results[-1]))
+
+        if computed:
+            with timed('result_cache'):
+                self._result_cache.put_many(version, fingerprint, computed)
+
+        return results, total_performance_time
+
+    def _evaluate_observation(
+        self,
+        decision,
+        observation: Dict[str, Any],
+        version: str,
+        sampled: bool = False
+    ) -> Dict[str, Any]:
+        """Evaluate a single observation, tracing it when selected for profiling."""
+        if not sampled:
+            return decision.evaluate(observation)
+
+        result = decision.evaluate(observation, {'trace': True})
+        self._profiler.record(version, result.pop('trace', {}), result.get('performance'))
+        return result
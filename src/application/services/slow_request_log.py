@@ -0,0 +1,75 @@
+import random
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class SlowRequestLog:
+    """
+    Ring buffer of recent slow requests with their phase breakdown.
+
+    Requests faster than `threshold_ms` are ignored; of the rest, `sample_rate`
+    are kept, and the oldest entries are dropped once `capacity` is reached.
+    """
+
+    def __init__(self, capacity: int = 100, threshold_ms: float = 50.0, sample_rate: float = 1.0, rng: Optional[random.Random] = None):
+        self.capacity = capacity
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._entries: deque = deque(maxlen=max(capacity, 0))
+        self._requests = 0
+        self._slow = 0
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        total_ms: float,
+        phases_ms: Dict[str, float],
+        request_bytes: Optional[int],
+        response_bytes: Optional[int]
+    ) -> bool:
+        """Offer a finished request to the log, returning True if it was kept."""
+        with self._lock:
+            self._requests += 1
+            if total_ms < self.threshold_ms:
+                return False
+            self._slow += 1
+            if self.capacity <= 0 or self._rng.random() >= self.sample_rate:
+                return False
+
+            self._entries.append({
+                'timestamp': datetime.utcnow().isoformat(),
+                'method': method,
+                'path': path,
+                'status': status,
+                'total_ms': round(total_ms, 3),
+                'phases_ms': {name: round(ms, 3) for name, ms in phases_ms.items()},
+                'request_bytes': request_bytes,
+                'response_bytes': response_bytes
+            })
+            return True
+
+    def snapshot(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Return kept requests, slowest first, with request counters."""
+        with self._lock:
+            entries = sorted(self._entries, key=lambda entry: entry['total_ms'], reverse=True)
+            return {
+                'threshold_ms': self.threshold_ms,
+                'sample_rate': self.sample_rate,
+                'capacity': self.capacity,
+                'requests': self._requests,
+                'slow_requests': self._slow,
+                'entries': entries[:limit] if limit is not None else entries
+            }
+
+    def reset(self) -> None:
+        """Drop kept requests and counters."""
+        with self._lock:
+            self._entries.clear()
+            self._requests = 0
+            self._slow = 0
@@ -3,8 +3,19 @@ from ..domain.interfaces.greeting_repository import IGreetingRepository
 from ..domain.interfaces.greeting_service import IGreetingService
 from ..domain.interfaces.rules_service import IRulesService
 from ..infrastructure.repositories.in_memory_greeting_repository import InMemoryGreetingRepository
+from ..infrastructure.repositories.in_memory_property_state_repository import InMemoryPropertyStateRepository
+from ..infrastructure.audit.ndjson_audit_sink import NdjsonAuditSink
+from ..infrastructure.audit.null_audit_sink import NullAuditSink
+from ..infrastructure.cache.null_result_cache import NullResultCache
+from ..infrastructure.cache.sqlite_result_cache import SqliteResultCache
 from ..application.services.greeting_service import GreetingService
 from ..application.services.rules_service import RulesService
+from ..application.services.admission_controller import AdmissionController
+from ..application.services.rule_graph_profiler import RuleGraphProfiler
+from ..application.services.compiled_decision_cache import CompiledDecisionCache
+from ..application.services.expression_service import ExpressionService
+from ..application.services.slow_request_log import SlowRequestLog
+from .settings import Settings
 
 
 class Container(containers.DeclarativeContainer):
@@ -14,17 +25,93 @@ class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         modules=[
             "src.presentation.controllers.greeting_controller",
-            "src.presentation.controllers.rules_controller"
+            "src.presentation.controllers.rules_controller",
+            "src.presentation.controllers.admin_controller",
+            "src.presentation.controllers.expression_controller"
         ]
     )
     
+    # Settings
+    settings = providers.Singleton(Settings.load)
+    
     # Repositories
     greeting_repository = providers.Singleton(InMemoryGreetingRepository)
     
+    property_state_repository = providers.Singleton(
+        InMemoryPropertyStateRepository,
+        max_properties=settings.provided.property_state_max_properties,
+        ttl_seconds=settings.provided.property_state_ttl_seconds
+    )
+    
+    audit_sink = providers.Selector(
+        settings.provided.audit_sink,
+        none=providers.Singleton(NullAuditSink),
+        ndjson=providers.Singleton(
+            NdjsonAuditSink,
+            directory=settings.provided.audit_directory,
+            queue_size=settings.provided.audit_queue_size,
+            batch_size=settings.provided.audit_batch_size,
+            flush_interval=settings.provided.audit_flush_interval_seconds,
+            segment_max_bytes=settings.provided.audit_segment_max_bytes,
+            segment_max_age=settings.provided.audit_segment_max_age_seconds,
+            fsync=settings.provided.audit_fsync
+        )
+    )
+    
+    result_cache = providers.Selector(
+        settings.provided.result_cache_backend,
+        none=providers.Singleton(NullResultCache),
+        sqlite=providers.Singleton(
+            SqliteResultCache,
+            path=settings.provided.result_cache_path,
+            max_entries=settings.provided.result_cache_max_entries,
+            timeout_ms=settings.provided.result_cache_timeout_ms,
+            retry_interval=settings.provided.result_cache_retry_seconds
+        )
+    )
+    
     # Services  
     greeting_service = providers.Factory(
         GreetingService,
         greeting_repository=greeting_repository
     )
     
-    rules_service = providers.Factory(RulesService)
\ No newline at end of file
+    rule_profiler = providers.Singleton(
+        RuleGraphProfiler,
+        sample_rate=settings.provided.profile_sample_rate
+    )
+    
+    slow_request_log = providers.Singleton(
+        SlowRequestLog,
+        capacity=settings.provided.slow_request_log_size,
+        threshold_ms=settings.provided.slow_request_threshold_ms,
+        sample_rate=settings.provided.slow_request_sample_rate
+    )
+    
+    decision_cache = providers.Singleton(
+        CompiledDecisionCache,
+        precompute_lookups=settings.provided.precompute_lookup_tables
+    )
+    
+    rules_service = providers.Factory(
+        RulesService,
+        decision_cache=decision_cache,
+        profiler=rule_profiler,
+        property_state_repository=property_state_repository,
+        max_observations_per_property=settings.provided.max_observations_per_property,
+        audit_sink=audit_sink,
+        result_cache=result_cache
+    )
+    
+    admission_controller = providers.Singleton(
+        AdmissionController,
+        max_in_flight=settings.provided.max_in_flight_evaluations,
+        max_queued=settings.provided.max_queued_evaluations,
+        queue_timeout=settings.provided.queue_timeout_seconds,
+        retry_after=settings.provided.retry_after_seconds
+    )
+    
+    expression_service = providers.Singleton(
+        ExpressionService,
+        cache_size=settings.provided.expression_cache_size
+    )
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -13,6 +14,50 @@ class Settings:
     
     # API settings
     api_version: str = os.getenv('API_VERSION', 'v1')
+
+    # Admission control settings
+    max_in_flight_evaluations: int = int(os.getenv('MAX_IN_FLIGHT_EVALUATIONS', '8'))
+    max_queued_evaluations: int = int(os.getenv('MAX_QUEUED_EVALUATIONS', '32'))
+    queue_timeout_seconds: float = float(os.getenv('QUEUE_TIMEOUT_SECONDS', '5'))
+    retry_after_seconds: int = int(os.getenv('RETRY_AFTER_SECONDS', '1'))
+    max_observations_per_request: int = int(os.getenv('MAX_OBSERVATIONS_PER_REQUEST', '1000'))
+    max_request_bytes: int = int(os.getenv('MAX_REQUEST_BYTES', str(4 * 1024 * 1024)))
+
+    # Property state settings
+    property_state_max_properties: int = int(os.getenv('PROPERTY_STATE_MAX_PROPERTIES', '10000'))
+    property_state_ttl_seconds: float = float(os.getenv('PROPERTY_STATE_TTL_SECONDS', '3600'))
+    max_observations_per_property: int = int(os.getenv('MAX_OBSERVATIONS_PER_PROPERTY', '1000'))
+
+    # Decision settings
+    precompute_lookup_tables: bool = os.getenv('PRECOMPUTE_LOOKUP_TABLES', 'True').lower() == 'true'
+
+    # Result cache settings
+    result_cache_backend: str = os.getenv('RESULT_CACHE_BACKEND', 'none')
+    # Unset keeps the database in a private per-user directory under /dev/shm (or the temp directory)
+    result_cache_path: Optional[str] = os.getenv('RESULT_CACHE_PATH') or None
+    result_cache_max_entries: int = int(os.getenv('RESULT_CACHE_MAX_ENTRIES', '100000'))
+    result_cache_timeout_ms: float = float(os.getenv('RESULT_CACHE_TIMEOUT_MS', '50'))
+    result_cache_retry_seconds: float = float(os.getenv('RESULT_CACHE_RETRY_SECONDS', '5'))
+
+    # Expression settings
+    expression_cache_size: int = int(os.getenv('EXPRESSION_CACHE_SIZE', '1024'))
+
+    # Profiling settings
+    profile_sample_rate: float = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+    server_timing_enabled: bool = os.getenv('SERVER_TIMING_ENABLED', 'True').lower() == 'true'
+    slow_request_threshold_ms: float = float(os.getenv('SLOW_REQUEST_THRESHOLD_MS', '50'))
+    slow_request_sample_rate: float = float(os.getenv('SLOW_REQUEST_SAMPLE_RATE', '1'))
+    slow_request_log_size: int = int(os.getenv('SLOW_REQUEST_LOG_SIZE', '100'))
+
+    # Audit settings
+    audit_sink: str = os.getenv('AUDIT_SINK', 'none')
+    audit_directory: str = os.getenv('AUDIT_DIRECTORY', 'audit')
+    audit_queue_size: int = int(os.getenv('AUDIT_QUEUE_SIZE', '10000'))
+    audit_batch_size: int = int(os.getenv('AUDIT_BATCH_SIZE', '500'))
+    audit_flush_interval_seconds: float = float(os.getenv('AUDIT_FLUSH_INTERVAL_SECONDS', '1'))
+    audit_segment_max_bytes: int = int(os.getenv('AUDIT_SEGMENT_MAX_BYTES', str(64 * 1024 * 1024)))
+    audit_segment_max_age_seconds: float = float(os.getenv('AUDIT_SEGMENT_MAX_AGE_SECONDS', '3600'))
+    audit_fsync: str = os.getenv('AUDIT_FSYNC', 'batch')
     
     @classmethod
     def load(cls) -> 'Settings':
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from ..models.audit_record import AuditRecord
+
+
+class IAuditSink(ABC):
+    """Interface for recording evaluations to an append-only audit trail."""
+    
+    @abstractmethod
+    def record(self, record: AuditRecord) -> bool:
+        """Queue a record without blocking, returning False if it had to be dropped."""
+        pass
+    
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return counters describing queued, written and dropped records."""
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """Flush pending records and release resources."""
+        pass
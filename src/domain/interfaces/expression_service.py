@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from ..models.expression_evaluation import ExpressionEvaluationRequest, ExpressionEvaluationResult
+
+
+class IExpressionService(ABC):
+    """Interface for standalone ZEN expression evaluation."""
+    
+    @abstractmethod
+    def evaluate_expression(self, request: ExpressionEvaluationRequest) -> ExpressionEvaluationResult:
+        """Evaluate an expression against each of the provided contexts."""
+        pass
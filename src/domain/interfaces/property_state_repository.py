@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import ContextManager, Optional
+from ..models.property_state import PropertyState
+
+
+class IPropertyStateRepository(ABC):
+    """Interface for per-property evaluation state storage."""
+    
+    @abstractmethod
+    def get(self, property_id: str, version: str) -> Optional[PropertyState]:
+        """Retrieve the stored state of a property for a rules version."""
+        pass
+    
+    @abstractmethod
+    def save(self, state: PropertyState) -> PropertyState:
+        """Store the state of a property, evicting older entries if needed."""
+        pass
+    
+    @abstractmethod
+    def delete(self, property_id: str, version: str) -> bool:
+        """Remove the stored state of a property, returning whether it existed."""
+        pass
+    
+    @abstractmethod
+    def lock(self, property_id: str, version: str) -> ContextManager:
+        """Serialize read-modify-write updates of a single property."""
+        pass
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class IResultCache(ABC):
+    """Interface for a result cache shared by worker processes, keyed by decision version and observation."""
+    
+    @abstractmethod
+    def available(self) -> bool:
+        """Check whether the backend can currently be used; callers skip the cache entirely when it cannot."""
+        pass
+    
+    @abstractmethod
+    def get_many(self, version: str, fingerprint: str, observations: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Get cached results for observations, with None for each miss."""
+        pass
+    
+    @abstractmethod
+    def put_many(self, version: str, fingerprint: str, entries: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> None:
+        """Store (observation, result) pairs evaluated with the given decision content."""
+        pass
+    
+    @abstractmethod
+    def invalidate(self, version: Optional[str] = None) -> int:
+        """Drop cached results for a version, or for every version, returning the number removed."""
+        pass
+    
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return size, hit/miss and error counters."""
+        pass
+    
+    @abstractmethod
+    def close(self) -> None:
+        """Release backend resources."""
+        pass
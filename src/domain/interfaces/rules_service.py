@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from ..models.property_state import PropertyDeltaRequest
 from ..models.rule_evaluation import RuleEvaluationRequest, RuleEvaluationResult
 
 
@@ -8,4 +9,9 @@ class IRulesService(ABC):
     @abstractmethod
     def evaluate_fire_risk(self, request: RuleEvaluationRequest) -> RuleEvaluationResult:
         """Evaluate fire risk rules against provided observations."""
+        pass
+    
+    @abstractmethod
+    def evaluate_property_delta(self, request: PropertyDeltaRequest) -> RuleEvaluationResult:
+        """Evaluate only added and changed observations and return the merged property assessment."""
         pass
\ No newline at end of file
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+
+
+@dataclass
+class AuditRecord:
+    """Domain model representing a single recorded rules evaluation."""
+    
+    kind: str
+    property_id: Optional[str]
+    version: str
+    inputs: Union[Dict[str, Any], List[Dict[str, Any]]]
+    outputs: Union[Dict[str, Any], List[Dict[str, Any]]]
+    performance: str
+    duration_ms: float
+    timestamp: Optional[datetime] = None
+    
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.utcnow()
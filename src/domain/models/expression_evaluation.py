@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+from datetime import datetime
+
+
+@dataclass
+class ExpressionEvaluationRequest:
+    """Domain model representing a single expression evaluated against a batch of contexts."""
+    
+    expression: str
+    contexts: List[Dict[str, Any]] = field(default_factory=list)
+    unary: bool = False
+
+
+@dataclass
+class ExpressionEvaluationResult:
+    """Domain model representing the results of an expression evaluation, one per context."""
+    
+    results: List[Any]
+    performance: str
+    timestamp: datetime
+    cached: bool = False
+    
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = datetime.utcnow()
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+@dataclass
+class PropertyState:
+    """Domain model holding the last evaluated observations of a property for one rules version."""
+    
+    property_id: str
+    version: str
+    observations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    updated_at: Optional[datetime] = None
+    
+    def __post_init__(self):
+        if self.updated_at is None:
+            self.updated_at = datetime.utcnow()
+
+
+@dataclass
+class PropertyDeltaRequest:
+    """Domain model representing added, changed and removed observations for a property."""
+    
+    property_id: str
+    added: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    changed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    replace: bool = False  # Full submission: added holds every observation and any stored state is discarded
+    version: Optional[str] = None
+    deadline: Optional[float] = None  # time.monotonic() value after which the result is no longer needed
@@ -10,6 +10,7 @@ class RuleEvaluationRequest:
     observations: Union[Dict[str, Any], List[Dict[str, Any]]]
     version: Optional[str] = None
     request_id: Optional[str] = None
+    deadline: Optional[float] = None  # time.monotonic() value after which the result is no longer needed
 
 
 @dataclass
@@ -0,0 +1,215 @@
+import atexit
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional
+from ...domain.interfaces.audit_sink import IAuditSink
+from ...domain.models.audit_record import AuditRecord
+
+
+class NdjsonAuditSink(IAuditSink):
+    """
+    Append-only audit sink writing gzip-compressed NDJSON segments from a background thread.
+
+    Request threads only enqueue records; serialization, compression and disk I/O
+    happen on the writer thread. When the queue is full records are dropped and
+    counted rather than blocking the caller.
+
+    fsync policies:
+        'batch'  - fsync after every written batch
+        'rotate' - fsync only when a segment is closed
+        'never'  - leave durability to the operating system
+    """
+
+    FSYNC_POLICIES = ('batch', 'rotate', 'never')
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        directory: str,
+        queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        segment_max_age: float = 3600,
+        fsync: str = 'batch',
+        compress_level: int = 6
+    ):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unsupported fsync policy: {fsync}")
+
+        self.directory = directory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_age = segment_max_age
+        self.fsync = fsync
+        self.compress_level = compress_level
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._dropped = 0
+        self._written = 0
+        self._batches = 0
+        self._segments = 0
+        self._write_errors = 0
+
+        self._raw_file = None
+        self._gzip_file: Optional[gzip.GzipFile] = None
+        self._segment_path: Optional[str] = None
+        self._segment_opened_at = 0.0
+        self._sequence = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, record: AuditRecord) -> bool:
+        """Queue a record without blocking, returning False if it had to be dropped."""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._stats_lock:
+                self._dropped += 1
+            return False
+
+        with self._stats_lock:
+            self._enqueued += 1
+        return True
+
+    def stats(self) -> dict:
+        """Return counters describing queued, written and dropped records."""
+        with self._stats_lock:
+            return {
+                'enabled': True,
+                'directory': self.directory,
+                'queue_depth': self._queue.qsize(),
+                'enqueued': self._enqueued,
+                'written': self._written,
+                'dropped': self._dropped,
+                'batches': self._batches,
+                'segments': self._segments,
+                'write_errors': self._write_errors,
+                'current_segment': self._segment_path
+            }
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush pending records, close the open segment and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[AuditRecord] = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                if item is self._STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+                # Drain whatever is already queued, up to one batch
+                while not stopping and len(batch) < self.batch_size:
+                    item = self._queue.get_nowait()
+                    if item is self._STOP:
+                        stopping = True
+                    else:
+                        batch.append(item)
+            except queue.Empty:
+                pass
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+                if self._segment_expired():
+                    self._close_segment()
+            except Exception:
+                with self._stats_lock:
+                    self._write_errors += 1
+                self._abandon_segment()
+
+        try:
+            self._close_segment()
+        except Exception:
+            with self._stats_lock:
+                self._write_errors += 1
+
+    def _write_batch(self, batch: List[AuditRecord]) -> None:
+        if self._gzip_file is None:
+            self._open_segment()
+
+        lines = [json.dumps(asdict(record), default=_json_default, separators=(',', ':')) for record in batch]
+        self._gzip_file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        # Sync flush so a reader sees complete records without waiting for the segment to close
+        self._gzip_file.flush()
+
+        if self.fsync == 'batch':
+            os.fsync(self._raw_file.fileno())
+
+        with self._stats_lock:
+            self._written += len(batch)
+            self._batches += 1
+
+        if self._raw_file.tell() >= self.segment_max_bytes:
+            self._close_segment()
+
+    def _open_segment(self) -> None:
+        self._sequence += 1
+        name = f"audit-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{self._sequence:06d}.ndjson.gz"
+        self._segment_path = os.path.join(self.directory, name)
+        self._raw_file = open(self._segment_path, 'ab')
+        self._gzip_file = gzip.GzipFile(fileobj=self._raw_file, mode='wb', compresslevel=self.compress_level)
+        self._segment_opened_at = time.monotonic()
+
+        with self._stats_lock:
+            self._segments += 1
+
+    def _segment_expired(self) -> bool:
+        return self._gzip_file is not None and time.monotonic() - self._segment_opened_at >= self.segment_max_age
+
+    def _close_segment(self) -> None:
+        if self._gzip_file is None:
+            return
+
+        self._gzip_file.close()
+        if self.fsync in ('batch', 'rotate'):
+            os.fsync(self._raw_file.fileno())
+        self._raw_file.close()
+        self._gzip_file = None
+        self._raw_file = None
+        self._segment_path = None
+
+    def _abandon_segment(self) -> None:
+        # After a write error start over in a fresh segment rather than appending to a damaged one
+        for handle in (self._gzip_file, self._raw_file):
+            try:
+                if handle is not None:
+                    handle.close()
+            except Exception:
+                pass
+        self._gzip_file = None
+        self._raw_file = None
+        self._segment_path = None
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,18 @@
+from ...domain.interfaces.audit_sink import IAuditSink
+from ...domain.models.audit_record import AuditRecord
+
+
+class NullAuditSink(IAuditSink):
+    """Audit sink used when auditing is disabled; discards every record."""
+    
+    def record(self, record: AuditRecord) -> bool:
+        """Discard the record."""
+        return True
+    
+    def stats(self) -> dict:
+        """Report that auditing is disabled."""
+        return {'enabled': False}
+    
+    def close(self) -> None:
+        """Nothing to release."""
+        pass
@@ -0,0 +1,30 @@
+from typing import Any, Dict, List, Optional, Tuple
+from ...domain.interfaces.result_cache import IResultCache
+
+
+class NullResultCache(IResultCache):
+    """Result cache used when sharing results between processes is disabled."""
+    
+    def available(self) -> bool:
+        """Never available, so callers skip the cache."""
+        return False
+    
+    def get_many(self, version: str, fingerprint: str, observations: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Report every observation as a miss."""
+        return [None] * len(observations)
+    
+    def put_many(self, version: str, fingerprint: str, entries: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> None:
+        """Discard the results."""
+        pass
+    
+    def invalidate(self, version: Optional[str] = None) -> int:
+        """Nothing is cached."""
+        return 0
+    
+    def stats(self) -> dict:
+        """Report that the result cache is disabled."""
+        return {'enabled': False}
+    
+    def close(self) -> None:
+        """Nothing to release."""
+        pass
@@ -0,0 +1,330 @@
+import hashlib
+import json
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import msgpack
+from ...domain.interfaces.result_cache import IResultCache
+
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS results ('
+    ' key BLOB PRIMARY KEY,'
+    ' version TEXT NOT NULL,'
+    ' fingerprint TEXT NOT NULL,'
+    ' value BLOB NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS results_version ON results (version, fingerprint)'
+)
+
+# SQLite's default limit on bound parameters per statement
+_MAX_VARIABLES = 999
+
+
+class _PoolExhausted(sqlite3.OperationalError):
+    """Raised when every pooled connection stays checked out for longer than the lock timeout."""
+
+
+class SqliteResultCache(IResultCache):
+    """
+    Result cache shared by the worker processes on a host through one SQLite database.
+
+    Placing the database on a memory-backed filesystem such as /dev/shm makes it
+    effectively shared memory with locking handled by SQLite. Without an explicit
+    `path` the database lives in a per-user directory under `base_directory`
+    (/dev/shm when present) that only this user can access, since rows read back
+    are served as engine results. The database file is created readable and
+    writable by its owner only. Entries are keyed by
+    a hash of version, decision fingerprint and the canonical JSON of the
+    observation, so a changed rules file never serves stale results; the first
+    write with a new fingerprint also purges the version's older entries.
+
+    Each process keeps at most `max_connections` connections, checked out per
+    call and returned afterwards, so request threads that come and go do not
+    accumulate connections or file descriptors.
+
+    The oldest entries are evicted once the table grows past `max_entries`. When
+    the database cannot be opened or a query fails, the cache reports itself
+    unavailable for `retry_interval` seconds and callers go straight to the engine.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 100000,
+        timeout_ms: float = 50.0,
+        retry_interval: float = 5.0,
+        evict_interval: int = 256,
+        base_directory: Optional[str] = None,
+        max_connections: int = 4
+    ):
+        self._private_directory: Optional[str] = None
+        if path is None:
+            if base_directory is None:
+                base_directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+            self._private_directory = os.path.join(base_directory, f"fire-rules-{os.getuid()}")
+            path = os.path.join(self._private_directory, 'result-cache.sqlite')
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout_ms = timeout_ms
+        self.retry_interval = retry_interval
+        self.evict_interval = evict_interval
+        self.max_connections = max(max_connections, 1)
+
+        self._lock = threading.Lock()
+        # Connections opened by this process, and the ones not checked out; neither may cross a fork
+        self._pid = os.getpid()
+        self._connections: List[sqlite3.Connection] = []
+        self._idle: List[sqlite3.Connection] = []
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self._unavailable_until = 0.0
+        self._purged: set = set()
+        self._writes_since_evict = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._errors = 0
+        self._bypassed = 0
+        self._last_error: Optional[str] = None
+
+    def available(self) -> bool:
+        """Check whether the backend is outside its post-failure cooldown."""
+        if time.monotonic() >= self._unavailable_until:
+            return True
+
+        with self._lock:
+            self._bypassed += 1
+        return False
+
+    def get_many(self, version: str, fingerprint: str, observations: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Get cached results for observations, with None for each miss."""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(observations)
+        positions: Dict[bytes, List[int]] = {}
+        for i, observation in enumerate(observations):
+            key = _key(version, fingerprint, observation)
+            if key is not None:
+                positions.setdefault(key, []).append(i)
+
+        try:
+            keys = list(positions)
+            with self._connection() as connection:
+                for start in range(0, len(keys), _MAX_VARIABLES):
+                    chunk = keys[start:start + _MAX_VARIABLES]
+                    rows = connection.execute(
+                        f"SELECT key, value FROM results WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    ).fetchall()
+                    for key, value in rows:
+                        result = msgpack.unpackb(value, raw=False)
+                        for i in positions[key]:
+                            # Each position gets its own copy so duplicate observations do not share a result
+                            results[i] = result if i == positions[key][0] else msgpack.unpackb(value, raw=False)
+        except (sqlite3.Error, OSError, ValueError, msgpack.UnpackException) as e:
+            self._failed(e)
+            return [None] * len(observations)
+
+        hits = sum(1 for result in results if result is not None)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(observations) - hits
+        return results
+
+    def put_many(self, version: str, fingerprint: str, entries: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> None:
+        """Store (observation, result) pairs, evicting the oldest entries when the cache is full."""
+        rows = []
+        for observation, result in entries:
+            key = _key(version, fingerprint, observation)
+            if key is not None:
+                rows.append((key, version, fingerprint, msgpack.packb(result, use_bin_type=True)))
+        if not rows:
+            return
+
+        try:
+            with self._connection() as connection:
+                with connection:
+                    if (version, fingerprint) not in self._purged:
+                        # Results of an older rules file for this version can never be served again
+                        connection.execute('DELETE FROM results WHERE version = ? AND fingerprint != ?', (version, fingerprint))
+                    connection.executemany('INSERT OR REPLACE INTO results (key, version, fingerprint, value) VALUES (?, ?, ?, ?)', rows)
+                self._purged.add((version, fingerprint))
+
+                with self._lock:
+                    self._writes += len(rows)
+                    self._writes_since_evict += len(rows)
+                    evict = self._writes_since_evict >= self.evict_interval
+                    if evict:
+                        self._writes_since_evict = 0
+                if evict:
+                    self._evict(connection)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            self._failed(e)
+
+    def invalidate(self, version: Optional[str] = None) -> int:
+        """
+        Drop cached results for a version, or for every version, returning the number removed.
+
+        Raises:
+            RuntimeError: If the backend cannot be reached
+        """
+        try:
+            with self._connection() as connection, connection:
+                if version is None:
+                    cursor = connection.execute('DELETE FROM results')
+                else:
+                    cursor = connection.execute('DELETE FROM results WHERE version = ?', (version,))
+        except (sqlite3.Error, OSError) as e:
+            self._failed(e)
+            raise RuntimeError(f"Result cache is unavailable: {str(e)}") from e
+        return cursor.rowcount
+
+    def stats(self) -> dict:
+        """Return size, hit/miss and error counters."""
+        try:
+            with self._connection() as connection:
+                entries = connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        except (sqlite3.Error, OSError):
+            entries = None
+
+        with self._lock:
+            return {
+                'enabled': True,
+                'backend': 'sqlite',
+                'path': self.path,
+                'available': time.monotonic() >= self._unavailable_until,
+                'entries': entries,
+                'connections': len(self._connections),
+                'max_entries': self.max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'writes': self._writes,
+                'evictions': self._evictions,
+                'errors': self._errors,
+                'bypassed': self._bypassed,
+                'last_error': self._last_error
+            }
+
+    def close(self) -> None:
+        """Close every connection this process opened."""
+        with self._lock:
+            connections, self._connections, self._idle = self._connections, [], []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Check a connection out of the pool for the duration of the block, opening one if none is idle."""
+        self._reset_after_fork()
+        if not self._slots.acquire(timeout=self.timeout_ms / 1000.0):
+            raise _PoolExhausted(f"All {self.max_connections} result cache connections are busy")
+
+        try:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                connection = self._open()
+
+            try:
+                yield connection
+            except BaseException:
+                # A connection that failed mid-statement may be left in a bad state
+                self._discard(connection)
+                raise
+
+            with self._lock:
+                if connection in self._connections:
+                    self._idle.append(connection)
+        finally:
+            self._slots.release()
+
+    def _open(self) -> sqlite3.Connection:
+        self._create_database_file()
+        connection = sqlite3.connect(self.path, timeout=self.timeout_ms / 1000.0, check_same_thread=False)
+        try:
+            # Contents are disposable, so trade durability for cheap concurrent writes
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def _discard(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+
+    def _reset_after_fork(self) -> None:
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # The parent's connections stay the parent's; the child opens its own
+                self._pid = os.getpid()
+                self._connections = []
+                self._idle = []
+                self._slots = threading.BoundedSemaphore(self.max_connections)
+
+    def _create_database_file(self) -> None:
+        if self._private_directory is not None:
+            os.makedirs(self._private_directory, mode=0o700, exist_ok=True)
+            info = os.lstat(self._private_directory)
+            # Another user able to write here could plant rows that are served as engine results
+            if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+                raise PermissionError(f"Result cache directory {self._private_directory} is not private to this user")
+
+        # SQLite gives its -wal and -shm files the permissions of the database file
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        entries = connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        if entries <= self.max_entries:
+            return
+
+        # Evict down to 90% so eviction does not run again on the very next write
+        excess = entries - int(self.max_entries * 0.9)
+        with connection:
+            cursor = connection.execute(
+                'DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY rowid LIMIT ?)', (excess,)
+            )
+        with self._lock:
+            self._evictions += cursor.rowcount
+
+    def _failed(self, error: Exception) -> None:
+        with self._lock:
+            self._errors += 1
+            self._last_error = str(error)
+            # Lock contention is transient; anything else means the backend is unusable for a while
+            transient = isinstance(error, _PoolExhausted) or (
+                isinstance(error, sqlite3.OperationalError) and 'locked' in str(error)
+            )
+            if not transient:
+                self._unavailable_until = time.monotonic() + self.retry_interval
+
+
+def _key(version: str, fingerprint: str, observation: Dict[str, Any]) -> Optional[bytes]:
+    """Hash version, fingerprint and canonical observation; None for observations JSON cannot represent."""
+    try:
+        canonical = json.dumps(observation, sort_keys=True, separators=(',', ':'), ensure_ascii=False, allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(f"{version}\0{fingerprint}\0{canonical}".encode('utf-8')).digest()[:16]
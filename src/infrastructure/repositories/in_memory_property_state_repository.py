@@ -0,0 +1,68 @@
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import ContextManager, Optional, Tuple
+from ...domain.interfaces.property_state_repository import IPropertyStateRepository
+from ...domain.models.property_state import PropertyState
+
+
+class InMemoryPropertyStateRepository(IPropertyStateRepository):
+    """Bounded in-memory property state store with LRU and idle-time eviction."""
+    
+    LOCK_STRIPES = 64
+    
+    def __init__(self, max_properties: int = 10000, ttl_seconds: float = 3600):
+        self.max_properties = max_properties
+        self.ttl = timedelta(seconds=ttl_seconds) if ttl_seconds > 0 else None
+        self._states: "OrderedDict[Tuple[str, str], PropertyState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(self.LOCK_STRIPES)]
+        self._evictions = 0
+    
+    def get(self, property_id: str, version: str) -> Optional[PropertyState]:
+        """Retrieve the stored state of a property for a rules version."""
+        key = (str(property_id), version)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return None
+            
+            if self.ttl is not None and datetime.utcnow() - state.updated_at > self.ttl:
+                del self._states[key]
+                self._evictions += 1
+                return None
+            
+            self._states.move_to_end(key)
+            return state
+    
+    def save(self, state: PropertyState) -> PropertyState:
+        """Store the state of a property, evicting the least recently used entries if needed."""
+        key = (str(state.property_id), state.version)
+        state.updated_at = datetime.utcnow()
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_properties:
+                self._states.popitem(last=False)
+                self._evictions += 1
+        return state
+    
+    def delete(self, property_id: str, version: str) -> bool:
+        """Remove the stored state of a property, returning whether it existed."""
+        with self._lock:
+            return self._states.pop((str(property_id), version), None) is not None
+    
+    def lock(self, property_id: str, version: str) -> ContextManager:
+        """Return the lock stripe guarding updates of a property."""
+        stripe = zlib.crc32(f"{property_id}:{version}".encode('utf-8')) % self.LOCK_STRIPES
+        return self._stripes[stripe]
+    
+    def stats(self) -> dict:
+        """Return the number of stored properties and lifetime evictions."""
+        with self._lock:
+            return {
+                'properties': len(self._states),
+                'max_properties': self.max_properties,
+                'evictions': self._evictions
+            }
@@ -1,10 +1,14 @@
 from flask import Flask
+from dependency_injector import providers
 from ..config.container import Container
+from ..config.settings import Settings
 from .controllers.greeting_controller import greeting_bp
 from .controllers.rules_controller import rules_bp
+from .controllers.admin_controller import admin_bp
+from .controllers.expression_controller import expressions_bp
 
 
-def create_app() -> Flask:
+def create_app(settings: Settings = None) -> Flask:
     """Create and configure the Flask application."""
 
     # Create Flask app
@@ -12,9 +16,18 @@ def create_app() -> Flask:
 
     # Configure container
     container = Container()
+    if settings is not None:
+        container.settings.override(providers.Object(settings))
+    else:
+        settings = container.settings()
+
+    # Reject oversized bodies before they are read into memory
+    app.config['MAX_CONTENT_LENGTH'] = settings.max_request_bytes
     container.wire(modules=[
         "src.presentation.controllers.greeting_controller",
-        "src.presentation.controllers.rules_controller"
+        "src.presentation.controllers.rules_controller",
+        "src.presentation.controllers.admin_controller",
+        "src.presentation.controllers.expression_controller"
     ])
 
     # Store container in app context for cleanup
@@ -23,6 +36,8 @@ def create_app() -> Flask:
     # Register blueprints
     app.register_blueprint(greeting_bp)
     app.register_blueprint(rules_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(expressions_bp)
 
     # Health check endpoint
     @app.route('/health')
@@ -0,0 +1,88 @@
+import json
+from typing import Any, Dict, List
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - Arrow bodies are optional
+    pa = None
+
+
+def arrow_available() -> bool:
+    """Check whether pyarrow is installed for Arrow IPC bodies."""
+    return pa is not None
+
+
+def validate_columns(columns: Any) -> int:
+    """
+    Validate a struct-of-arrays payload and return its row count.
+
+    Raises:
+        ValueError: If columns is not an object of equal-length arrays
+    """
+    if not isinstance(columns, dict) or not columns:
+        raise ValueError('columns must be a non-empty object of arrays')
+
+    length = None
+    for name, values in columns.items():
+        if not isinstance(values, list):
+            raise ValueError(f'columns[{name}] must be an array')
+        if length is None:
+            length = len(values)
+        elif len(values) != length:
+            raise ValueError(f'columns[{name}] has {len(values)} values, expected {length}')
+
+    if length == 0:
+        raise ValueError('columns cannot be empty')
+
+    return length
+
+
+def columns_to_rows(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Transpose columns into observation objects, omitting null cells."""
+    names = list(columns)
+    return [
+        {name: value for name, value in zip(names, values) if value is not None}
+        for values in zip(*columns.values())
+    ]
+
+
+def rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose result objects into columns, using null where a row lacks a field."""
+    names: Dict[str, None] = {}
+    for row in rows:
+        for name in row:
+            names.setdefault(name, None)
+
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def arrow_to_columns(body: bytes) -> Dict[str, List[Any]]:
+    """Decode an Arrow IPC stream into columns."""
+    try:
+        reader = pa.ipc.open_stream(body)
+        return reader.read_all().to_pydict()
+    except (pa.ArrowInvalid, OSError) as e:
+        raise ValueError(f'Malformed Arrow IPC stream: {str(e)}') from e
+
+
+def columns_to_arrow(columns: Dict[str, List[Any]], metadata: Dict[str, Any]) -> bytes:
+    """
+    Encode columns as an Arrow IPC stream with response metadata in the schema.
+
+    Columns whose values Arrow cannot type consistently (for example a field that
+    is a string for one risk type and an object for another) are sent as JSON text.
+    """
+    arrays = []
+    for values in columns.values():
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            arrays.append(pa.array([None if value is None else json.dumps(value) for value in values], type=pa.string()))
+
+    schema_metadata = {key: '' if value is None else str(value) for key, value in metadata.items()}
+    table = pa.Table.from_arrays(arrays, names=list(columns)).replace_schema_metadata(schema_metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,152 @@
+from flask import Blueprint, jsonify, request
+from dependency_injector.wiring import Provide, inject
+from ...config.container import Container
+from ...application.services.admission_controller import AdmissionController
+from ...application.services.rule_graph_profiler import RuleGraphProfiler
+from ...application.services.compiled_decision_cache import CompiledDecisionCache
+from ...application.services.expression_service import ExpressionService
+from ...application.services.slow_request_log import SlowRequestLog
+from ...domain.interfaces.audit_sink import IAuditSink
+from ...domain.interfaces.result_cache import IResultCache
+from ...infrastructure.repositories.in_memory_property_state_repository import InMemoryPropertyStateRepository
+
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+
+@admin_bp.route('/profile', methods=['GET'])
+@inject
+def get_rule_profile(
+    profiler: RuleGraphProfiler = Provide[Container.rule_profiler]
+):
+    """Get per-node and per-row timing aggregated from sampled evaluations."""
+    try:
+        return jsonify(profiler.snapshot()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get profile: {str(e)}'}), 500
+
+
+@admin_bp.route('/profile', methods=['DELETE'])
+@inject
+def reset_rule_profile(
+    profiler: RuleGraphProfiler = Provide[Container.rule_profiler]
+):
+    """Discard aggregated profiling statistics."""
+    try:
+        profiler.reset()
+        return jsonify({'status': 'reset'}), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to reset profile: {str(e)}'}), 500
+
+
+@admin_bp.route('/slow-requests', methods=['GET'])
+@inject
+def get_slow_requests(
+    slow_request_log: SlowRequestLog = Provide[Container.slow_request_log]
+):
+    """Get recent slow /rules requests, slowest first, with their phase breakdown and payload sizes."""
+    try:
+        limit = request.args.get('limit', type=int)
+        return jsonify(slow_request_log.snapshot(limit)), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get slow requests: {str(e)}'}), 500
+
+
+@admin_bp.route('/slow-requests', methods=['DELETE'])
+@inject
+def reset_slow_requests(
+    slow_request_log: SlowRequestLog = Provide[Container.slow_request_log]
+):
+    """Discard recorded slow requests."""
+    try:
+        slow_request_log.reset()
+        return jsonify({'status': 'reset'}), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to reset slow requests: {str(e)}'}), 500
+
+
+@admin_bp.route('/admission', methods=['GET'])
+@inject
+def get_admission_stats(
+    admission_controller: AdmissionController = Provide[Container.admission_controller]
+):
+    """Get current load and admission counters."""
+    try:
+        return jsonify(admission_controller.snapshot()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get admission stats: {str(e)}'}), 500
+
+
+@admin_bp.route('/property-state', methods=['GET'])
+@inject
+def get_property_state_stats(
+    property_state_repository: InMemoryPropertyStateRepository = Provide[Container.property_state_repository]
+):
+    """Get property state store size and eviction counters."""
+    try:
+        return jsonify(property_state_repository.stats()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get property state stats: {str(e)}'}), 500
+
+
+@admin_bp.route('/audit', methods=['GET'])
+@inject
+def get_audit_stats(
+    audit_sink: IAuditSink = Provide[Container.audit_sink]
+):
+    """Get audit queue depth and written/dropped record counters."""
+    try:
+        return jsonify(audit_sink.stats()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get audit stats: {str(e)}'}), 500
+
+
+@admin_bp.route('/decision-cache', methods=['GET'])
+@inject
+def get_decision_cache_stats(
+    decision_cache: CompiledDecisionCache = Provide[Container.decision_cache]
+):
+    """Get compiled decisions held in memory and cache counters."""
+    try:
+        return jsonify(decision_cache.stats()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get decision cache stats: {str(e)}'}), 500
+
+
+@admin_bp.route('/expression-cache', methods=['GET'])
+@inject
+def get_expression_cache_stats(
+    expression_service: ExpressionService = Provide[Container.expression_service]
+):
+    """Get compiled expression cache occupancy and hit/miss counters."""
+    try:
+        return jsonify(expression_service.stats()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get expression cache stats: {str(e)}'}), 500
+
+
+@admin_bp.route('/result-cache', methods=['GET'])
+@inject
+def get_result_cache_stats(
+    result_cache: IResultCache = Provide[Container.result_cache]
+):
+    """Get shared result cache size, hit/miss and error counters."""
+    try:
+        return jsonify(result_cache.stats()), 200
+    except Exception as e:
+        return jsonify({'error': f'Failed to get result cache stats: {str(e)}'}), 500
+
+
+@admin_bp.route('/result-cache', methods=['DELETE'])
+@inject
+def invalidate_result_cache(
+    result_cache: IResultCache = Provide[Container.result_cache]
+):
+    """Drop shared cached results, for one version when ?version= is given."""
+    try:
+        removed = result_cache.invalidate(request.args.get('version'))
+        return jsonify({'status': 'invalidated', 'removed': removed}), 200
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 503
+    except Exception as e:
+        return jsonify({'error': f'Failed to invalidate result cache: {str(e)}'}), 500
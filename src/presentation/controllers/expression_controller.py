@@ -0,0 +1,83 @@
+from flask import Blueprint
+from dependency_injector.wiring import Provide, inject
+from werkzeug.exceptions import HTTPException
+from ...config.container import Container
+from ...config.settings import Settings
+from ...application.services.admission_controller import AdmissionController, OverloadedError
+from ...domain.interfaces.expression_service import IExpressionService
+from ...domain.models.expression_evaluation import ExpressionEvaluationRequest
+from ..serialization import is_arrow_request, is_supported_request, make_response, parse_request_body
+
+
+expressions_bp = Blueprint('expressions', __name__, url_prefix='/expressions')
+
+
+@expressions_bp.route('/evaluate', methods=['POST'])
+@inject
+def evaluate_expression(
+    expression_service: IExpressionService = Provide[Container.expression_service],
+    admission_controller: AdmissionController = Provide[Container.admission_controller],
+    settings: Settings = Provide[Container.settings]
+):
+    """Evaluate a single ZEN expression against one context or a batch of contexts."""
+    try:
+        # Validate request content type
+        if is_arrow_request():
+            return make_response({'error': 'Arrow IPC bodies are only accepted for rule evaluation'}, 415)
+        if not is_supported_request():
+            return make_response({'error': 'Content-Type must be application/json or application/msgpack'}, 400)
+
+        data = parse_request_body()
+        if not isinstance(data, dict):
+            return make_response({'error': 'Request body must be an object'}, 400)
+
+        # Validate required fields
+        expression = data.get('expression')
+        if not isinstance(expression, str):
+            return make_response({'error': 'Missing required field: expression'}, 400)
+
+        # Accept either a single context or an array of contexts
+        batched = 'contexts' in data
+        contexts = data['contexts'] if batched else [data.get('context', {})]
+        if not isinstance(contexts, list) or not contexts:
+            return make_response({'error': 'contexts must be a non-empty array of objects'}, 400)
+        for i, context in enumerate(contexts):
+            if not isinstance(context, dict):
+                return make_response({'error': f'contexts[{i}] must be an object'}, 400)
+
+        if len(contexts) > settings.max_observations_per_request:
+            return make_response({
+                'error': f'contexts array exceeds limit of {settings.max_observations_per_request}'
+            }, 413)
+
+        # Create domain request object
+        expression_request = ExpressionEvaluationRequest(
+            expression=expression,
+            contexts=contexts,
+            unary=bool(data.get('unary', False))
+        )
+
+        # Evaluate expression once an evaluation slot is available
+        with admission_controller.admit():
+            result = expression_service.evaluate_expression(expression_request)
+
+        # Return response
+        return make_response({
+            'result': result.results if batched else result.results[0],
+            'performance': result.performance,
+            'timestamp': result.timestamp.isoformat(),
+            'cached': result.cached
+        }, 200)
+
+    except OverloadedError as e:
+        response = make_response({'error': str(e)}, 429)
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    except HTTPException as e:
+        return make_response({'error': e.description}, e.code)
+    except ValueError as e:
+        return make_response({'error': f'Invalid request data: {str(e)}'}, 400)
+    except RuntimeError as e:
+        return make_response({'error': str(e)}, 500)
+    except Exception as e:
+        return make_response({'error': f'Internal server error: {str(e)}'}, 500)
@@ -1,12 +1,64 @@
-from flask import Blueprint, request, jsonify
+import math
+import time
+from flask import Blueprint, g, request
 from dependency_injector.wiring import Provide, inject
+from werkzeug.exceptions import HTTPException
 from ...config.container import Container
+from ...config.settings import Settings
+from ...application.services.admission_controller import AdmissionController, OverloadedError
+from ...application.services.phase_timer import current_timer, start_timer, stop_timer, timed
+from ...application.services.slow_request_log import SlowRequestLog
 from ...domain.interfaces.rules_service import IRulesService
+from ...domain.models.property_state import PropertyDeltaRequest
 from ...domain.models.rule_evaluation import RuleEvaluationRequest
+from ..columnar import columns_to_rows, rows_to_columns, validate_columns
+from ..serialization import (
+    is_arrow_request, is_supported_columnar_request, is_supported_request, make_columnar_response, make_response,
+    parse_request_body
+)
 
 
 rules_bp = Blueprint('rules', __name__, url_prefix='/rules')
 
+# Remaining time budget the client is willing to wait, in milliseconds
+DEADLINE_HEADER = 'X-Request-Deadline-Ms'
+
+
+@rules_bp.before_request
+def _start_phase_timer():
+    """Time each phase of the request from here until the response is serialized."""
+    g.phase_timer_token = start_timer()
+
+
+@rules_bp.after_request
+@inject
+def _finish_phase_timer(
+    response,
+    slow_request_log: SlowRequestLog = Provide[Container.slow_request_log],
+    settings: Settings = Provide[Container.settings]
+):
+    """Report phase timings in the Server-Timing header and offer the request to the slow request log."""
+    timer = current_timer()
+    token = g.pop('phase_timer_token', None)
+    if timer is None or token is None:
+        return response
+    stop_timer(token)
+    total_ms = timer.elapsed_ms()
+
+    if settings.server_timing_enabled:
+        response.headers['Server-Timing'] = timer.server_timing(total_ms)
+
+    slow_request_log.record(
+        method=request.method,
+        path=request.path,
+        status=response.status_code,
+        total_ms=total_ms,
+        phases_ms=timer.phases_ms(),
+        request_bytes=request.content_length,
+        response_bytes=response.calculate_content_length()
+    )
+    return response
+
 
 @rules_bp.route('/versions', methods=['GET'])
 @inject
@@ -17,124 +69,268 @@ def get_available_versions(
     try:
         versions = rules_service.get_available_versions()
         latest = rules_service.get_latest_version()
-        
-        return jsonify({
+
+        return make_response({
             'versions': versions,
             'latest': latest
-        }), 200
-        
+        }, 200)
+
     except Exception as e:
-        return jsonify({'error': f'Failed to get versions: {str(e)}'}), 500
+        return make_response({'error': f'Failed to get versions: {str(e)}'}, 500)
 
 
 @rules_bp.route('/latest', methods=['POST'])
 @inject
 def evaluate_rules_latest(
-    rules_service: IRulesService = Provide[Container.rules_service]
+    rules_service: IRulesService = Provide[Container.rules_service],
+    admission_controller: AdmissionController = Provide[Container.admission_controller],
+    settings: Settings = Provide[Container.settings]
 ):
     """Evaluate rules against provided observations using latest version."""
-    try:
-        # Validate request content type
-        if not request.is_json:
-            return jsonify({'error': 'Content-Type must be application/json'}), 400
-        
-        data = request.get_json()
-        
-        # Validate required fields
-        if 'observations' not in data:
-            return jsonify({'error': 'Missing required field: observations'}), 400
-        
-        # Validate observations format (must be dict or array of dicts)
-        observations = data['observations']
-        if not isinstance(observations, (dict, list)):
-            return jsonify({'error': 'observations must be an object or array of objects'}), 400
-        
-        if isinstance(observations, list):
-            if not observations:
-                return jsonify({'error': 'observations array cannot be empty'}), 400
-            for i, obs in enumerate(observations):
-                if not isinstance(obs, dict):
-                    return jsonify({'error': f'observations[{i}] must be an object'}), 400
-        
-        # Create domain request object with latest version (None will default to latest)
-        rule_request = RuleEvaluationRequest(
-            observations=observations,
-            version=None,  # This will use latest version
-            request_id=data.get('property_id')
-        )
-        
-        # Evaluate rules
-        result = rules_service.evaluate_fire_risk(rule_request)
-        
-        # Return response
-        return jsonify({
-            'result': result.result,
-            'performance': result.performance,
-            'timestamp': result.timestamp.isoformat(),
-            'api_version': result.api_version,
-            'property_id': result.request_id
-        }), 200
-        
-    except ValueError as e:
-        return jsonify({'error': f'Invalid request data: {str(e)}'}), 400
-    except RuntimeError as e:
-        return jsonify({'error': str(e)}), 500
-    except Exception as e:
-        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+    # None will default to latest version
+    return _evaluate_rules(rules_service, admission_controller, settings, version=None)
 
 
 @rules_bp.route('/version/<version>', methods=['POST'])
 @inject
 def evaluate_rules_versioned(
     version: str,
-    rules_service: IRulesService = Provide[Container.rules_service]
+    rules_service: IRulesService = Provide[Container.rules_service],
+    admission_controller: AdmissionController = Provide[Container.admission_controller],
+    settings: Settings = Provide[Container.settings]
 ):
     """Evaluate rules against provided observations using specified version."""
+    return _evaluate_rules(rules_service, admission_controller, settings, version=version)
+
+
+@rules_bp.route('/latest/delta', methods=['POST'])
+@inject
+def evaluate_delta_latest(
+    rules_service: IRulesService = Provide[Container.rules_service],
+    admission_controller: AdmissionController = Provide[Container.admission_controller],
+    settings: Settings = Provide[Container.settings]
+):
+    """Apply observation changes to a property's assessment using latest version."""
+    return _evaluate_delta(rules_service, admission_controller, settings, version=None)
+
+
+@rules_bp.route('/version/<version>/delta', methods=['POST'])
+@inject
+def evaluate_delta_versioned(
+    version: str,
+    rules_service: IRulesService = Provide[Container.rules_service],
+    admission_controller: AdmissionController = Provide[Container.admission_controller],
+    settings: Settings = Provide[Container.settings]
+):
+    """Apply observation changes to a property's assessment using specified version."""
+    return _evaluate_delta(rules_service, admission_controller, settings, version=version)
+
+
+def _parse_deadline():
+    """Convert the client's deadline header into a time.monotonic() value."""
+    budget = request.headers.get(DEADLINE_HEADER)
+    if budget is None:
+        return None
+
+    try:
+        budget_ms = float(budget)
+    except ValueError:
+        raise ValueError(f'{DEADLINE_HEADER} must be a number of milliseconds')
+
+    # NaN never compares as expired, so it would silently disable deadline shedding
+    if not math.isfinite(budget_ms):
+        raise ValueError(f'{DEADLINE_HEADER} must be a finite number of milliseconds')
+
+    return time.monotonic() + budget_ms / 1000.0
+
+
+def _evaluate_rules(
+    rules_service: IRulesService,
+    admission_controller: AdmissionController,
+    settings: Settings,
+    version: str = None
+):
+    """Validate the request body, evaluate it under admission control and serialize the result."""
     try:
         # Validate request content type
-        if not request.is_json:
-            return jsonify({'error': 'Content-Type must be application/json'}), 400
-        
-        data = request.get_json()
-        
-        # Validate required fields
-        if 'observations' not in data:
-            return jsonify({'error': 'Missing required field: observations'}), 400
-        
-        # Validate observations format (must be dict or array of dicts)
-        observations = data['observations']
-        if not isinstance(observations, (dict, list)):
-            return jsonify({'error': 'observations must be an object or array of objects'}), 400
-        
-        if isinstance(observations, list):
-            if not observations:
-                return jsonify({'error': 'observations array cannot be empty'}), 400
-            for i, obs in enumerate(observations):
-                if not isinstance(obs, dict):
-                    return jsonify({'error': f'observations[{i}] must be an object'}), 400
-        
-        # Create domain request object
-        rule_request = RuleEvaluationRequest(
-            observations=observations,
-            version=version,
-            request_id=data.get('property_id')
-        )
-        
-        # Evaluate rules
-        result = rules_service.evaluate_fire_risk(rule_request)
-        
+        if not is_supported_columnar_request():
+            return make_response({
+                'error': 'Content-Type must be application/json, application/msgpack or application/vnd.apache.arrow.stream'
+            }, 400)
+
+        deadline = _parse_deadline()
+
+        with timed('parse'):
+            data = parse_request_body()
+        if not isinstance(data, dict):
+            return make_response({'error': 'Request body must be an object'}, 400)
+
+        with timed('validate'):
+            # Columnar payloads carry one array per field instead of an array of objects
+            columnar = 'columns' in data
+
+            if columnar:
+                if validate_columns(data['columns']) > settings.max_observations_per_request:
+                    return make_response({
+                        'error': f'columns exceed limit of {settings.max_observations_per_request} observations'
+                    }, 413)
+                observations = columns_to_rows(data['columns'])
+            else:
+                # Validate required fields
+                if 'observations' not in data:
+                    return make_response({'error': 'Missing required field: observations'}, 400)
+
+                # Validate observations format (must be dict or array of dicts)
+                observations = data['observations']
+                if not isinstance(observations, (dict, list)):
+                    return make_response({'error': 'observations must be an object or array of objects'}, 400)
+
+                if isinstance(observations, list):
+                    if not observations:
+                        return make_response({'error': 'observations array cannot be empty'}, 400)
+                    for i, obs in enumerate(observations):
+                        if not isinstance(obs, dict):
+                            return make_response({'error': f'observations[{i}] must be an object'}, 400)
+
+                    if len(observations) > settings.max_observations_per_request:
+                        return make_response({
+                            'error': f'observations array exceeds limit of {settings.max_observations_per_request}'
+                        }, 413)
+
+            # Create domain request object
+            rule_request = RuleEvaluationRequest(
+                observations=observations,
+                version=version,
+                request_id=data.get('property_id'),
+                deadline=deadline
+            )
+
+        # Evaluate rules once an evaluation slot is available
+        with admission_controller.admit(deadline):
+            result = rules_service.evaluate_fire_risk(rule_request)
+
+        # Return response
+        with timed('serialize'):
+            if columnar:
+                return make_columnar_response({
+                    'result': rows_to_columns(result.result),
+                    'performance': result.performance,
+                    'timestamp': result.timestamp.isoformat(),
+                    'api_version': result.api_version,
+                    'property_id': result.request_id
+                }, 200)
+
+            return make_response({
+                'result': result.result,
+                'performance': result.performance,
+                'timestamp': result.timestamp.isoformat(),
+                'api_version': result.api_version,
+                'property_id': result.request_id
+            }, 200)
+
+    except OverloadedError as e:
+        response = make_response({'error': str(e)}, 429)
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    except TimeoutError as e:
+        return make_response({'error': str(e)}, 504)
+    except HTTPException as e:
+        return make_response({'error': e.description}, e.code)
+    except ValueError as e:
+        return make_response({'error': f'Invalid request data: {str(e)}'}, 400)
+    except RuntimeError as e:
+        return make_response({'error': str(e)}, 500)
+    except Exception as e:
+        return make_response({'error': f'Internal server error: {str(e)}'}, 500)
+
+
+def _evaluate_delta(
+    rules_service: IRulesService,
+    admission_controller: AdmissionController,
+    settings: Settings,
+    version: str = None
+):
+    """Validate a delta body, apply it under admission control and serialize the merged assessment."""
+    try:
+        # Validate request content type; an Arrow body carries only columns, not a delta
+        if is_arrow_request():
+            return make_response({'error': 'Arrow IPC bodies are only accepted for rule evaluation'}, 415)
+        if not is_supported_request():
+            return make_response({'error': 'Content-Type must be application/json or application/msgpack'}, 400)
+
+        deadline = _parse_deadline()
+
+        with timed('parse'):
+            data = parse_request_body()
+        if not isinstance(data, dict):
+            return make_response({'error': 'Request body must be an object'}, 400)
+
+        with timed('validate'):
+            # Validate required fields
+            if data.get('property_id') is None:
+                return make_response({'error': 'Missing required field: property_id'}, 400)
+
+            # Validate delta format (added/changed map ids to objects, removed lists ids)
+            added = data.get('added', {})
+            changed = data.get('changed', {})
+            removed = data.get('removed', [])
+            for name, observations in (('added', added), ('changed', changed)):
+                if not isinstance(observations, dict):
+                    return make_response({'error': f'{name} must be an object keyed by observation id'}, 400)
+                for observation_id, obs in observations.items():
+                    if not isinstance(obs, dict):
+                        return make_response({'error': f'{name}[{observation_id}] must be an object'}, 400)
+
+            if not isinstance(removed, list) or not all(isinstance(observation_id, str) for observation_id in removed):
+                return make_response({'error': 'removed must be an array of observation ids'}, 400)
+
+            replace = data.get('replace', False)
+            if not isinstance(replace, bool):
+                return make_response({'error': 'replace must be a boolean'}, 400)
+
+            if len(added) + len(changed) > settings.max_observations_per_request:
+                return make_response({
+                    'error': f'delta exceeds limit of {settings.max_observations_per_request} observations'
+                }, 413)
+
+            # Create domain request object
+            delta_request = PropertyDeltaRequest(
+                property_id=str(data['property_id']),
+                added=added,
+                changed=changed,
+                removed=removed,
+                replace=replace,
+                version=version,
+                deadline=deadline
+            )
+
+        # Evaluate changes once an evaluation slot is available
+        with admission_controller.admit(deadline):
+            result = rules_service.evaluate_property_delta(delta_request)
+
         # Return response
-        return jsonify({
-            'result': result.result,
-            'performance': result.performance,
-            'timestamp': result.timestamp.isoformat(),
-            'api_version': result.api_version,
-            'property_id': result.request_id
-        }), 200
-        
+        with timed('serialize'):
+            return make_response({
+                'result': result.result,
+                'performance': result.performance,
+                'timestamp': result.timestamp.isoformat(),
+                'api_version': result.api_version,
+                'property_id': result.request_id
+            }, 200)
+
+    except OverloadedError as e:
+        response = make_response({'error': str(e)}, 429)
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    except TimeoutError as e:
+        return make_response({'error': str(e)}, 504)
+    except HTTPException as e:
+        return make_response({'error': e.description}, e.code)
+    except LookupError as e:
+        return make_response({'error': str(e)}, 409)
     except ValueError as e:
-        return jsonify({'error': f'Invalid request data: {str(e)}'}), 400
+        return make_response({'error': f'Invalid request data: {str(e)}'}, 400)
     except RuntimeError as e:
-        return jsonify({'error': str(e)}), 500
+        return make_response({'error': str(e)}, 500)
     except Exception as e:
-        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
\ No newline at end of file
+        return make_response({'error': f'Internal server error: {str(e)}'}, 500)
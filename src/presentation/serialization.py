@@ -0,0 +1,107 @@
+from typing import Any
+
+import msgpack
+from flask import Response, jsonify, request
+from .columnar import arrow_available, arrow_to_columns, columns_to_arrow
+
+
+JSON_MIMETYPE = 'application/json'
+MSGPACK_MIMETYPE = 'application/msgpack'
+ARROW_STREAM_MIMETYPE = 'application/vnd.apache.arrow.stream'
+
+# Arrow bodies carry only columns, so the property id travels in a header
+PROPERTY_ID_HEADER = 'X-Property-Id'
+
+# Aliases clients commonly send for MessagePack bodies
+MSGPACK_MIMETYPES = (MSGPACK_MIMETYPE, 'application/x-msgpack', 'application/vnd.msgpack')
+
+
+def is_msgpack_request() -> bool:
+    """Check whether the request body is MessagePack encoded."""
+    return request.mimetype in MSGPACK_MIMETYPES
+
+
+def is_arrow_request() -> bool:
+    """Check whether the request body is an Arrow IPC stream."""
+    return request.mimetype == ARROW_STREAM_MIMETYPE
+
+
+def is_supported_request() -> bool:
+    """Check whether the request body uses a supported row-oriented wire format."""
+    return request.is_json or is_msgpack_request()
+
+
+def is_supported_columnar_request() -> bool:
+    """Check whether the request body uses a supported wire format, Arrow IPC streams included."""
+    return is_supported_request() or is_arrow_request()
+
+
+def parse_request_body() -> Any:
+    """Decode the request body according to its Content-Type."""
+    if is_arrow_request():
+        if not arrow_available():
+            raise ValueError('Arrow IPC bodies require pyarrow to be installed')
+        return {
+            'columns': arrow_to_columns(request.get_data(cache=False)),
+            'property_id': request.headers.get(PROPERTY_ID_HEADER)
+        }
+
+    if is_msgpack_request():
+        try:
+            return msgpack.unpackb(request.get_data(cache=False), raw=False)
+        except (msgpack.UnpackException, ValueError) as e:
+            raise ValueError(f'Malformed MessagePack body: {str(e)}') from e
+
+    return request.get_json()
+
+
+def negotiate_response_mimetype() -> str:
+    """Pick the response format from the Accept header, mirroring the request format on ties."""
+    preferred = MSGPACK_MIMETYPE if is_msgpack_request() else JSON_MIMETYPE
+    alternative = JSON_MIMETYPE if preferred == MSGPACK_MIMETYPE else MSGPACK_MIMETYPE
+
+    accept = request.accept_mimetypes
+    if not accept:
+        return preferred
+
+    return accept.best_match([preferred, alternative], default=preferred)
+
+
+def make_response(payload: Any, status: int = 200):
+    """Serialize a response payload using the negotiated wire format."""
+    if negotiate_response_mimetype() == MSGPACK_MIMETYPE:
+        response = Response(msgpack.packb(payload, use_bin_type=True), status=status, mimetype=MSGPACK_MIMETYPE)
+    else:
+        response = jsonify(payload)
+        response.status_code = status
+
+    response.vary.add('Accept')
+    response.vary.add('Content-Type')
+    return response
+
+
+def make_columnar_response(payload: Any, status: int = 200):
+    """Serialize a columnar response, as an Arrow IPC stream when the client asks for one."""
+    if arrow_available() and _wants_arrow():
+        metadata = {key: value for key, value in payload.items() if key != 'result'}
+        response = Response(
+            columns_to_arrow(payload['result'], metadata),
+            status=status,
+            mimetype=ARROW_STREAM_MIMETYPE
+        )
+        response.vary.add('Accept')
+        response.vary.add('Content-Type')
+        return response
+
+    return make_response(payload, status)
+
+
+def _wants_arrow() -> bool:
+    accept = request.accept_mimetypes
+    if not accept:
+        return is_arrow_request()
+
+    # Arrow must be asked for explicitly unless the request itself was Arrow
+    if is_arrow_request():
+        return accept.best_match([ARROW_STREAM_MIMETYPE, JSON_MIMETYPE, MSGPACK_MIMETYPE]) == ARROW_STREAM_MIMETYPE
+    return ARROW_STREAM_MIMETYPE in accept.values() and accept[ARROW_STREAM_MIMETYPE] >= accept[negotiate_response_mimetype()]
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Closed- and open-loop load generator for the rules engine API.
+
+Drives one or more rules engine instances through FireMitigationService with a
+configurable request mix and reports throughput, latency histogram and error
+rates. Passing several --target/--spawn options runs the same workload against
+each of them and prints the results side by side.
+
+Usage:
+    # Spawn a local instance and run 8 closed-loop clients for 30 seconds
+    python -m src.tools.load_generator --mode closed --concurrency 8 --duration 30
+
+    # Compare two server configurations at a fixed arrival rate
+    python -m src.tools.load_generator --mode open --rate 200 \\
+        --spawn MAX_IN_FLIGHT_EVALUATIONS=4 --spawn MAX_IN_FLIGHT_EVALUATIONS=16
+
+    # Shard one workload across three local instances by property id
+    python -m src.tools.load_generator --spawn '' --spawn '' --spawn '' --shard
+
+    # Target an already running instance with a custom mix
+    python -m src.tools.load_generator --target http://localhost:5000 \\
+        --array-size 1-50 --risk-mix windows=0.6,attic=0.2,roof=0.2 --versions latest=0.9,3=0.1
+"""
+
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from ..application.services.fire_mitigation_service import FireMitigationService
+from ..application.services.node_pool import NodePool
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Upper bounds of latency histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float('inf')]
+
+
+@dataclass
+class WorkloadMix:
+    """Shape of the generated requests."""
+
+    array_size: Tuple[int, int] = (1, 3)
+    risk_weights: Dict[str, float] = field(default_factory=lambda: {'windows': 1.0, 'attic': 1.0, 'roof': 1.0})
+    version_weights: Dict[str, float] = field(default_factory=lambda: {'latest': 1.0})
+    property_count: int = 1000
+
+    def build_request(self, rng: random.Random, templates: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+        """
+        Build one request from the mix.
+
+        Returns:
+            Tuple of property id, observations and version (None for latest)
+        """
+        by_risk_type = {template['risk_type']: template for template in templates}
+        risk_types = list(self.risk_weights)
+        size = rng.randint(*self.array_size)
+
+        observations = []
+        for risk_type in rng.choices(risk_types, weights=[self.risk_weights[r] for r in risk_types], k=size):
+            observations.append(_vary_observation(rng, dict(by_risk_type[risk_type])))
+
+        versions = list(self.version_weights)
+        version = rng.choices(versions, weights=[self.version_weights[v] for v in versions])[0]
+        property_id = f"PROP-{rng.randrange(self.property_count)}"
+        return property_id, observations, None if version == 'latest' else version
+
+
+@dataclass
+class LoadResult:
+    """Raw measurements collected for one target."""
+
+    target: str
+    duration: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=dict)
+    observations: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms) + sum(self.errors.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """Compute throughput, error rate, latency percentiles and histogram."""
+        latencies = sorted(self.latencies_ms)
+        total = self.requests
+        histogram = [0] * len(HISTOGRAM_BUCKETS_MS)
+        for latency in latencies:
+            histogram[next(i for i, bound in enumerate(HISTOGRAM_BUCKETS_MS) if latency <= bound)] += 1
+
+        return {
+            'target': self.target,
+            'requests': total,
+            'throughput_rps': total / self.duration if self.duration else 0.0,
+            'observations_per_s': self.observations / self.duration if self.duration else 0.0,
+            'error_rate': sum(self.errors.values()) / total if total else 0.0,
+            'errors': dict(self.errors),
+            'p50_ms': _percentile(latencies, 50),
+            'p90_ms': _percentile(latencies, 90),
+            'p99_ms': _percentile(latencies, 99),
+            'max_ms': latencies[-1] if latencies else 0.0,
+            'histogram': histogram
+        }
+
+
+class LoadGenerator:
+    """Runs a workload against a single rules engine instance, or a fleet sharded by property id."""
+
+    def __init__(
+        self,
+        base_url: str,
+        mix: WorkloadMix,
+        wire_format: str = "json",
+        seed: Optional[int] = None,
+        node_pool: Optional[NodePool] = None
+    ):
+        self.base_url = base_url
+        self.node_pool = node_pool
+        self.mix = mix
+        self.wire_format = wire_format
+        self.seed = seed
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def run_closed_loop(self, concurrency: int, duration: float) -> LoadResult:
+        """Each of `concurrency` clients sends its next request as soon as the previous one completes."""
+        result = LoadResult(target=self.base_url)
+        stop_at = time.monotonic() + duration
+
+        def client(index: int):
+            rng = random.Random(None if self.seed is None else self.seed + index)
+            while time.monotonic() < stop_at:
+                self._send(rng, result, time.perf_counter())
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        result.duration = time.monotonic() - started
+        return result
+
+    def run_open_loop(self, rate: float, duration: float, max_workers: int = 256) -> LoadResult:
+        """
+        Send requests at a fixed arrival rate regardless of how fast responses come back.
+
+        Latency is measured from the scheduled send time so that queueing inside the
+        generator is not hidden (avoids coordinated omission).
+        """
+        result = LoadResult(target=self.base_url)
+        rng = random.Random(self.seed)
+        interval = 1.0 / rate
+        started = time.monotonic()
+        scheduled = time.perf_counter()
+        stop_at = scheduled + duration
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while scheduled < stop_at:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._send, random.Random(rng.random()), result, scheduled)
+                scheduled += interval
+
+        result.duration = time.monotonic() - started
+        return result
+
+    def _service(self) -> FireMitigationService:
+        # One client per thread so each keeps its own HTTP session
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = FireMitigationService(self.base_url, wire_format=self.wire_format, node_pool=self.node_pool)
+            self._local.service = service
+        return service
+
+    def _send(self, rng: random.Random, result: LoadResult, scheduled_at: float) -> None:
+        service = self._service()
+        property_id, observations, version = self.mix.build_request(rng, service.create_sample_observations())
+
+        error = None
+        try:
+            service.submit_property_observations(property_id, observations, version=version)
+        except RuntimeError as e:
+            error = _classify_error(e)
+
+        latency_ms = (time.perf_counter() - scheduled_at) * 1000.0
+        with self._lock:
+            if error is None:
+                result.latencies_ms.append(latency_ms)
+                result.observations += len(observations)
+            else:
+                result.errors[error] = result.errors.get(error, 0) + 1
+
+
+class LocalInstance:
+    """A rules engine process started on a free local port."""
+
+    def __init__(self, env_overrides: Dict[str, str]):
+        self.env_overrides = env_overrides
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self, timeout: float = 30.0) -> None:
+        env = dict(os.environ, HOST='127.0.0.1', PORT=str(self.port), DEBUG='false', **self.env_overrides)
+        self._process = subprocess.Popen(
+            [sys.executable, 'main.py'],
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Local instance exited with code {self._process.returncode}")
+            try:
+                if requests.get(f"{self.base_url}/health", timeout=1).ok:
+                    return
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(0.2)
+
+        self.stop()
+        raise RuntimeError(f"Local instance on port {self.port} did not become healthy")
+
+    def stop(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+    def describe(self) -> str:
+        settings = ','.join(f"{key}={value}" for key, value in self.env_overrides.items()) or 'defaults'
+        return f"{self.base_url} [{settings}]"
+
+
+def _vary_observation(rng: random.Random, observation: Dict[str, Any]) -> Dict[str, Any]:
+    """Randomize a sample observation within the values the rules understand."""
+    risk_type = observation['risk_type']
+    if risk_type == 'windows':
+        observation['window_type'] = rng.choice(['single', 'double', 'tempered'])
+        observation['vegetation_type'] = rng.choice(['tree', 'shrubs', 'grass'])
+        observation['distance'] = rng.randint(0, 150)
+    elif risk_type == 'attic':
+        observation['attic_vent_screens'] = rng.random() < 0.5
+    elif risk_type == 'roof':
+        observation['roof_type'] = rng.choice(['a', 'b', 'c'])
+        observation['wild_fire_risk'] = rng.choice(['a', 'b', 'c'])
+    return observation
+
+
+def _classify_error(error: RuntimeError) -> str:
+    cause = error.__cause__
+    response = getattr(cause, 'response', None)
+    if response is not None:
+        return f"http_{response.status_code}"
+    if isinstance(cause, requests.exceptions.Timeout):
+        return 'timeout'
+    if isinstance(cause, requests.exceptions.ConnectionError):
+        return 'connection'
+    return 'other'
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percentile / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _parse_weights(value: str) -> Dict[str, float]:
+    weights = {}
+    for item in value.split(','):
+        key, _, weight = item.partition('=')
+        weights[key.strip()] = float(weight) if weight else 1.0
+    return weights
+
+
+def _parse_env(value: str) -> Dict[str, str]:
+    return dict(item.split('=', 1) for item in value.split(',') if item)
+
+
+def _parse_range(value: str) -> Tuple[int, int]:
+    low, _, high = value.partition('-')
+    return int(low), int(high or low)
+
+
+def print_report(summaries: List[Dict[str, Any]]) -> None:
+    """Print summaries side by side, one column per target."""
+    rows = [
+        ('requests', '{:.0f}', 'requests'),
+        ('throughput (req/s)', '{:.1f}', 'throughput_rps'),
+        ('observations/s', '{:.1f}', 'observations_per_s'),
+        ('error rate', '{:.2%}', 'error_rate'),
+        ('p50 (ms)', '{:.2f}', 'p50_ms'),
+        ('p90 (ms)', '{:.2f}', 'p90_ms'),
+        ('p99 (ms)', '{:.2f}', 'p99_ms'),
+        ('max (ms)', '{:.2f}', 'max_ms')
+    ]
+    width = 24
+
+    print(''.ljust(width) + ''.join(f"[{i}]".rjust(width) for i in range(len(summaries))))
+    for label, fmt, key in rows:
+        print(label.ljust(width) + ''.join(fmt.format(summary[key]).rjust(width) for summary in summaries))
+
+    print('\nLatency histogram (successful requests)')
+    for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+        label = f"<= {bound:g} ms" if bound != float('inf') else f"> {HISTOGRAM_BUCKETS_MS[i - 1]:g} ms"
+        print(label.ljust(width) + ''.join(str(summary['histogram'][i]).rjust(width) for summary in summaries))
+
+    print('\nErrors')
+    for i, summary in enumerate(summaries):
+        errors = ', '.join(f"{kind}={count}" for kind, count in sorted(summary['errors'].items())) or 'none'
+        print(f"[{i}] {summary['target']}: {errors}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate load against rules engine instances.")
+    parser.add_argument('--target', action='append', default=[], help="Base URL of a running instance (repeatable)")
+    parser.add_argument('--spawn', action='append', default=[], type=_parse_env, metavar='ENV=VAL,...',
+                        help="Start a local instance with these environment overrides (repeatable)")
+    parser.add_argument('--mode', choices=['closed', 'open'], default='closed')
+    parser.add_argument('--concurrency', type=int, default=8, help="Closed-loop client count")
+    parser.add_argument('--rate', type=float, default=100.0, help="Open-loop arrival rate in requests/second")
+    parser.add_argument('--duration', type=float, default=10.0, help="Seconds to run against each target")
+    parser.add_argument('--warmup', type=float, default=1.0, help="Seconds of unreported warm-up per target")
+    parser.add_argument('--array-size', type=_parse_range, default=(1, 3), help="Observations per request, e.g. 1-10")
+    parser.add_argument('--risk-mix', type=_parse_weights, default={'windows': 1.0, 'attic': 1.0, 'roof': 1.0},
+                        help="Relative risk_type weights, e.g. windows=0.6,attic=0.2,roof=0.2")
+    parser.add_argument('--versions', type=_parse_weights, default={'latest': 1.0},
+                        help="Relative version weights, e.g. latest=0.9,3=0.1")
+    parser.add_argument('--wire-format', choices=['json', 'msgpack'], default='json')
+    parser.add_argument('--shard', action='store_true',
+                        help="Run one workload across all targets, routing each property to a node by consistent hashing")
+    parser.add_argument('--max-concurrency-per-node', type=int, default=16, help="Sharded in-flight request limit per node")
+    parser.add_argument('--seed', type=int, help="Random seed for reproducible request streams")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    mix = WorkloadMix(array_size=args.array_size, risk_weights=args.risk_mix, version_weights=args.versions)
+
+    spawn_specs = args.spawn if (args.spawn or args.target) else [{}]
+    instances = [LocalInstance(env) for env in spawn_specs]
+    summaries = []
+
+    try:
+        targets = [(url, url) for url in args.target]
+        for instance in instances:
+            instance.start()
+            targets.append((instance.base_url, instance.describe()))
+
+        node_pool = None
+        if args.shard:
+            node_pool = NodePool([url for url, _ in targets], max_concurrency_per_node=args.max_concurrency_per_node)
+            targets = [(targets[0][0], 'sharded: ' + ', '.join(description for _, description in targets))]
+
+        for base_url, description in targets:
+            generator = LoadGenerator(base_url, mix, wire_format=args.wire_format, seed=args.seed, node_pool=node_pool)
+            if args.warmup > 0:
+                generator.run_closed_loop(min(args.concurrency, 4), args.warmup)
+
+            print(f"Running {args.mode}-loop workload against {description} for {args.duration:g}s...")
+            if args.mode == 'closed':
+                result = generator.run_closed_loop(args.concurrency, args.duration)
+            else:
+                result = generator.run_open_loop(args.rate, args.duration)
+
+            summary = result.summary()
+            summary['target'] = description
+            summaries.append(summary)
+    finally:
+        for instance in instances:
+            instance.stop()
+
+    print()
+    print_report(summaries)
+    if node_pool is not None:
+        print('\nNodes')
+        for node, stats in node_pool.snapshot().items():
+            print(f"{node}: requests={stats['requests']}, ejections={stats['ejections']}, healthy={stats['healthy']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
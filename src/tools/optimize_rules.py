@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Offline optimizer for first-hit decision tables.
+
+Reads a decision graph and per-row hit statistics (an /admin/profile snapshot or
+a flat {row_id: hits} mapping) and writes an equivalent graph with frequently
+hit rows moved ahead wherever rows are provably mutually exclusive.
+
+Usage:
+    python -m src.tools.optimize_rules src/rules/fire_risk/3/fire_risk.json \\
+        --stats profile.json --version 3 --output src/rules/fire_risk/4/fire_risk.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from ..application.services.rule_table_optimizer import RuleTableOptimizer
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Reorder first-hit decision table rows by observed hit counts.")
+    parser.add_argument('rules', help="Path to the decision graph JSON to optimize")
+    parser.add_argument('--stats', required=True, help="Path to hit statistics JSON")
+    parser.add_argument('--version', help="Version to read from a profile snapshot (default: sum all versions)")
+    parser.add_argument('--output', help="Where to write the optimized graph (default: print report only)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    with open(args.rules, 'r') as f:
+        rule_json = f.read()
+    with open(args.stats, 'r') as f:
+        stats = json.load(f)
+
+    optimizer = RuleTableOptimizer(RuleTableOptimizer.load_row_hits(stats, args.version))
+    optimized_json, report = optimizer.optimize(rule_json)
+
+    for table in report.tables:
+        status = "reordered" if table.reordered else "unchanged"
+        print(f"{table.node_name} ({table.node_id}): {status}, {table.pinned_pairs} overlapping row pairs kept in order")
+        if table.reordered:
+            for position, row_id in enumerate(table.optimized_order):
+                hits = optimizer.row_hits.get(row_id, 0)
+                print(f"  {position}: {row_id} (was {table.original_order.index(row_id)}, {hits} hits)")
+        for row in table.unreachable_rows:
+            print(f"  WARNING: row {row['index']} ({row['row_id']}) is unreachable, shadowed by {row['shadowed_by']}")
+
+    for skipped in report.skipped:
+        print(f"Skipped {skipped['node_id']}: {skipped['reason']}")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            f.write(optimized_json)
+        print(f"Wrote optimized rules to {args.output}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from src.application.services.admission_controller import AdmissionController, OverloadedError
+from src.config.settings import Settings
+from src.presentation.app import create_app
+
+
+class TestAdmissionController:
+    def test_rejects_when_queue_is_full(self):
+        controller = AdmissionController(max_in_flight=1, max_queued=0, retry_after=3)
+
+        with controller.admit():
+            with pytest.raises(OverloadedError) as exc_info:
+                with controller.admit():
+                    pass
+
+        assert exc_info.value.retry_after == 3
+        assert controller.snapshot()["rejected"] == 1
+        assert controller.snapshot()["in_flight"] == 0
+
+    def test_queued_request_runs_after_release(self):
+        controller = AdmissionController(max_in_flight=1, max_queued=1, queue_timeout=5)
+        admitted = threading.Event()
+
+        def waiter():
+            with controller.admit():
+                admitted.set()
+
+        with controller.admit():
+            thread = threading.Thread(target=waiter)
+            thread.start()
+            time.sleep(0.05)
+            assert controller.snapshot()["queued"] == 1
+            assert not admitted.is_set()
+
+        thread.join(timeout=5)
+        assert admitted.is_set()
+        assert controller.snapshot()["admitted"] == 2
+
+    def test_deadline_expires_while_queued(self):
+        controller = AdmissionController(max_in_flight=1, max_queued=1, queue_timeout=5)
+
+        with controller.admit():
+            with pytest.raises(TimeoutError):
+                with controller.admit(deadline=time.monotonic() + 0.05):
+                    pass
+
+        assert controller.snapshot()["expired"] == 1
+
+
+class TestAdmissionEndpoints:
+    def setup_method(self):
+        self.app = create_app(Settings(
+            max_in_flight_evaluations=1,
+            max_queued_evaluations=0,
+            retry_after_seconds=2,
+            max_observations_per_request=2
+        ))
+        self.client = self.app.test_client()
+        self.observation = {"risk_type": "attic", "attic_vent_screens": False}
+
+    def test_too_many_observations(self):
+        response = self.client.post('/rules/latest', json={"observations": [self.observation] * 3})
+
+        assert response.status_code == 413
+
+    def test_overloaded_returns_retry_after(self):
+        with self.app.container.admission_controller().admit():
+            response = self.client.post('/rules/latest', json={"observations": self.observation})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+
+    def test_expired_deadline_is_dropped(self):
+        response = self.client.post(
+            '/rules/latest',
+            json={"observations": self.observation},
+            headers={"X-Request-Deadline-Ms": "0"}
+        )
+
+        assert response.status_code == 504
+
+    def test_deadline_with_budget_is_served(self):
+        response = self.client.post(
+            '/rules/latest',
+            json={"observations": self.observation},
+            headers={"X-Request-Deadline-Ms": "5000"}
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["result"]["mitigations"] == "Add Vents"
+
+    def test_non_finite_deadline_is_rejected(self):
+        for budget in ("nan", "inf", "-inf"):
+            response = self.client.post(
+                '/rules/latest',
+                json={"observations": self.observation},
+                headers={"X-Request-Deadline-Ms": budget}
+            )
+
+            assert response.status_code == 400
@@ -0,0 +1,100 @@
+import glob
+import gzip
+import json
+import os
+import threading
+
+import pytest
+
+from src.config.settings import Settings
+from src.domain.models.audit_record import AuditRecord
+from src.infrastructure.audit.ndjson_audit_sink import NdjsonAuditSink
+from src.presentation.app import create_app
+
+
+def _record(property_id="PROP-1"):
+    return AuditRecord(
+        kind="evaluation",
+        property_id=property_id,
+        version="3",
+        inputs={"risk_type": "attic", "attic_vent_screens": False},
+        outputs={"risk_type": "attic", "attic_vent_screens": False, "mitigations": "Add Vents"},
+        performance="35.0µs",
+        duration_ms=0.1
+    )
+
+
+def _read_segments(directory):
+    records = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.ndjson.gz"))):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+class TestNdjsonAuditSink:
+    def test_records_are_written_as_compressed_ndjson(self, tmp_path):
+        sink = NdjsonAuditSink(str(tmp_path), flush_interval=0.05)
+        for i in range(3):
+            assert sink.record(_record(f"PROP-{i}"))
+        sink.close()
+
+        records = _read_segments(str(tmp_path))
+        assert [record["property_id"] for record in records] == ["PROP-0", "PROP-1", "PROP-2"]
+        assert records[0]["outputs"]["mitigations"] == "Add Vents"
+        assert sink.stats()["written"] == 3
+
+    def test_segments_rotate_by_size(self, tmp_path):
+        sink = NdjsonAuditSink(str(tmp_path), batch_size=1, segment_max_bytes=1, fsync='never')
+        for _ in range(3):
+            sink.record(_record())
+        sink.close()
+
+        assert sink.stats()["segments"] == 3
+        assert len(_read_segments(str(tmp_path))) == 3
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        release = threading.Event()
+
+        class BlockedSink(NdjsonAuditSink):
+            def _write_batch(self, batch):
+                release.wait(timeout=5)
+                super()._write_batch(batch)
+
+        sink = BlockedSink(str(tmp_path), queue_size=1, batch_size=1, flush_interval=0.01)
+        results = [sink.record(_record()) for _ in range(5)]
+        release.set()
+        sink.close()
+
+        assert results.count(False) >= 3
+        assert sink.stats()["dropped"] == results.count(False)
+
+    def test_rejects_unknown_fsync_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            NdjsonAuditSink(str(tmp_path), fsync='sometimes')
+
+
+class TestAuditedEvaluations:
+    def test_evaluations_reach_the_audit_log(self, tmp_path):
+        app = create_app(Settings(audit_sink='ndjson', audit_directory=str(tmp_path), audit_flush_interval_seconds=0.05))
+        client = app.test_client()
+
+        response = client.post('/rules/version/3', json={
+            "observations": {"risk_type": "attic", "attic_vent_screens": False},
+            "property_id": "PROP-9"
+        })
+        assert response.status_code == 200
+
+        sink = app.container.audit_sink()
+        sink.close()
+
+        records = _read_segments(str(tmp_path))
+        assert len(records) == 1
+        assert records[0]["property_id"] == "PROP-9"
+        assert records[0]["version"] == "3"
+        assert records[0]["outputs"]["mitigations"] == "Add Vents"
+
+    def test_auditing_disabled_by_default(self):
+        client = create_app(Settings(audit_sink='none')).test_client()
+
+        assert client.get('/admin/audit').get_json() == {"enabled": False}
@@ -0,0 +1,96 @@
+import msgpack
+import pytest
+
+from src.presentation.app import create_app
+from src.presentation.columnar import columns_to_rows, rows_to_columns
+
+
+class TestColumnarFormat:
+    def setup_method(self):
+        self.client = create_app().test_client()
+        self.columns = {
+            "risk_type": ["windows", "attic", "roof"],
+            "window_type": ["single", None, None],
+            "vegetation_type": ["tree", None, None],
+            "distance": [80, None, None],
+            "attic_vent_screens": [None, False, None],
+            "roof_type": [None, None, "c"],
+            "wild_fire_risk": [None, None, "a"]
+        }
+
+    def test_columnar_request_gets_columnar_result(self):
+        response = self.client.post('/rules/version/3', json={"columns": self.columns, "property_id": 1})
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["property_id"] == 1
+        assert body["result"]["risk_type"] == ["windows", "attic", "roof"]
+        assert body["result"]["safe_distance_diff"] == [10, None, None]
+        assert body["result"]["mitigations"][1:] == ["Add Vents", "No Mitigation"]
+
+    def test_columnar_matches_row_results(self):
+        rows = columns_to_rows(self.columns)
+        row_body = self.client.post('/rules/version/3', json={"observations": rows}).get_json()
+        columnar_body = self.client.post('/rules/version/3', json={"columns": self.columns}).get_json()
+
+        assert columns_to_rows(columnar_body["result"]) == row_body["result"]
+
+    def test_columnar_msgpack(self):
+        response = self.client.post(
+            '/rules/version/3',
+            data=msgpack.packb({"columns": self.columns}),
+            content_type='application/msgpack'
+        )
+
+        assert response.status_code == 200
+        assert msgpack.unpackb(response.data, raw=False)["result"]["risk_type"][2] == "roof"
+
+    def test_mismatched_column_lengths_are_rejected(self):
+        response = self.client.post('/rules/latest', json={"columns": {"risk_type": ["attic"], "attic_vent_screens": []}})
+
+        assert response.status_code == 400
+
+    def test_arrow_round_trip(self):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({
+            "risk_type": ["attic", "roof"],
+            "attic_vent_screens": [True, None],
+            "roof_type": [None, "a"],
+            "wild_fire_risk": [None, "b"]
+        })
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        response = self.client.post(
+            '/rules/version/3',
+            data=sink.getvalue().to_pybytes(),
+            content_type='application/vnd.apache.arrow.stream',
+            headers={"X-Property-Id": "PROP-7"}
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/vnd.apache.arrow.stream'
+        result = pa.ipc.open_stream(response.data).read_all()
+        assert result.schema.metadata[b"api_version"] == b"3"
+        assert result.schema.metadata[b"property_id"] == b"PROP-7"
+        assert result.column("risk_type").to_pylist() == ["attic", "roof"]
+        assert result.column("mitigations").to_pylist() == [None, ""]
+
+    def test_arrow_is_rejected_outside_rule_evaluation(self):
+        for path in ('/rules/version/3/delta', '/expressions/evaluate'):
+            response = self.client.post(
+                path,
+                data=b'not-an-arrow-stream',
+                content_type='application/vnd.apache.arrow.stream',
+                headers={"X-Property-Id": "PROP-1"}
+            )
+
+            assert response.status_code == 415
+
+
+def test_rows_to_columns_fills_missing_fields():
+    columns = rows_to_columns([{"a": 1}, {"b": {"x": 2}}])
+
+    assert columns == {"a": [1, None], "b": [None, {"x": 2}]}
+    assert columns_to_rows(columns) == [{"a": 1}, {"b": {"x": 2}}]
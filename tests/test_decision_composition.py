@@ -0,0 +1,139 @@
+import json
+import os
+
+import pytest
+
+from src.application.services.compiled_decision_cache import CompiledDecisionCache
+from src.application.services.rules_service import RulesService
+from src.domain.models.rule_evaluation import RuleEvaluationRequest
+
+
+def _graph(nodes, edges):
+    return {"nodes": nodes, "edges": edges, "contentType": "application/vnd.gorules.decision"}
+
+
+def _input_node():
+    return {"id": "in", "name": "request", "type": "inputNode", "content": {"schema": ""}, "position": {"x": 0, "y": 0}}
+
+
+def _write(root, family, version, graph):
+    directory = os.path.join(root, family, version)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{family}.json"), "w") as f:
+        json.dump(graph, f)
+
+
+class TestDecisionComposition:
+    def setup_method(self):
+        self.mitigations = _graph(
+            [
+                _input_node(),
+                {
+                    "id": "table",
+                    "name": "Mitigations",
+                    "type": "decisionTableNode",
+                    "content": {
+                        "rules": [{"_id": "r1", "i": "> 0", "o": "\"Remove Vegetation\""}],
+                        "inputs": [{"id": "i", "name": "Input", "field": "safe_distance_diff"}],
+                        "outputs": [{"id": "o", "name": "Output", "field": "mitigations"}],
+                        "hitPolicy": "first",
+                        "inputField": None,
+                        "outputPath": None,
+                        "passThrough": True,
+                        "executionMode": "single"
+                    },
+                    "position": {"x": 0, "y": 0}
+                }
+            ],
+            [{"id": "e1", "type": "edge", "sourceId": "in", "targetId": "table"}]
+        )
+
+    def _parent(self, key):
+        return _graph(
+            [
+                _input_node(),
+                {
+                    "id": "sub",
+                    "name": "Shared Mitigations",
+                    "type": "decisionNode",
+                    "content": {"key": key, "passThrough": True, "inputField": None, "outputPath": None, "executionMode": "single"},
+                    "position": {"x": 0, "y": 0}
+                }
+            ],
+            [{"id": "e1", "type": "edge", "sourceId": "in", "targetId": "sub"}]
+        )
+
+    def test_sub_decision_is_resolved_and_shared(self, tmp_path):
+        root = str(tmp_path)
+        _write(root, "mitigations", "1", self.mitigations)
+        _write(root, "fire_risk", "1", self._parent("mitigations/1"))
+        _write(root, "fire_risk", "2", self._parent("mitigations"))
+
+        cache = CompiledDecisionCache(root)
+        service = RulesService(rules_base_path=os.path.join(root, "fire_risk"), decision_cache=cache)
+
+        for version in ("1", "2", "1"):
+            result = service.evaluate_fire_risk(RuleEvaluationRequest(
+                observations={"safe_distance_diff": 5},
+                version=version
+            ))
+            assert result.result["mitigations"] == "Remove Vegetation"
+
+        stats = cache.stats()
+        assert stats["contents"] == ["fire_risk/1", "fire_risk/2", "mitigations/1"]
+        assert stats["decisions"] == ["fire_risk/1", "fire_risk/2"]
+        # Each graph is parsed exactly once; later lookups are cache hits
+        assert stats["loads"] == 3
+
+    def test_custom_rules_path_reads_fire_risk_file(self, tmp_path):
+        root = str(tmp_path)
+        _write(root, "mitigations", "1", self.mitigations)
+        directory = os.path.join(root, "rules", "1")
+        os.makedirs(directory)
+        with open(os.path.join(directory, "fire_risk.json"), "w") as f:
+            json.dump(self._parent("mitigations/1"), f)
+
+        service = RulesService(rules_base_path=os.path.join(root, "rules"))
+        result = service.evaluate_fire_risk(RuleEvaluationRequest(observations={"safe_distance_diff": 5}))
+
+        assert result.api_version == "1"
+        assert result.result["mitigations"] == "Remove Vegetation"
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        root = str(tmp_path)
+        _write(root, "mitigations", "1", self.mitigations)
+        cache = CompiledDecisionCache(root)
+        first = cache.get_content("mitigations", "1")
+
+        path = os.path.join(root, "mitigations", "1", "mitigations.json")
+        os.utime(path, (os.path.getatime(path), os.path.getmtime(path) + 10))
+
+        assert cache.get_content("mitigations", "1") is not first
+
+    def test_loader_serves_resolved_keys_from_memory(self, tmp_path):
+        root = str(tmp_path)
+        _write(root, "mitigations", "1", self.mitigations)
+        cache = CompiledDecisionCache(root, reload_interval=60)
+        first = cache._load("mitigations/latest")
+
+        def unexpected(*args):
+            raise AssertionError("loader touched the filesystem")
+        cache.resolve_path = unexpected
+
+        assert cache._load("mitigations/latest") is first
+        assert cache.stats()["loads"] == 1
+
+    def test_latest_is_only_an_alias_in_decision_keys(self, tmp_path):
+        root = str(tmp_path)
+        _write(root, "mitigations", "1", self.mitigations)
+        cache = CompiledDecisionCache(root)
+
+        assert cache._load("mitigations/latest") is cache.get_content("mitigations", "1")
+        with pytest.raises(FileNotFoundError):
+            cache.get_content("mitigations", "latest")
+
+    def test_keys_cannot_escape_rules_root(self, tmp_path):
+        cache = CompiledDecisionCache(str(tmp_path))
+
+        with pytest.raises(ValueError):
+            cache.get_content("..", "1")
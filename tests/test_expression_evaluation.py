@@ -0,0 +1,75 @@
+import pytest
+
+from src.application.services.expression_service import ExpressionService
+from src.config.settings import Settings
+from src.domain.models.expression_evaluation import ExpressionEvaluationRequest
+from src.presentation.app import create_app
+
+
+class TestExpressionEvaluation:
+    def setup_method(self):
+        self.client = create_app(Settings(expression_cache_size=2)).test_client()
+
+    def test_batch_contexts(self):
+        response = self.client.post('/expressions/evaluate', json={
+            "expression": "distance - 70",
+            "contexts": [{"distance": 80}, {"distance": 50}]
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()["result"] == [10, -20]
+
+    def test_single_context_and_cache_hit(self):
+        payload = {"expression": "roof_type == 'a' and wild_fire_risk != 'a'", "context": {"roof_type": "a", "wild_fire_risk": "b"}}
+
+        first = self.client.post('/expressions/evaluate', json=payload).get_json()
+        second = self.client.post('/expressions/evaluate', json=payload).get_json()
+
+        assert first["result"] is True
+        assert first["cached"] is False
+        assert second["cached"] is True
+
+    def test_unary_expression(self):
+        response = self.client.post('/expressions/evaluate', json={
+            "expression": "> 0",
+            "unary": True,
+            "contexts": [{"$": 5}, {"$": -1}]
+        })
+
+        assert response.status_code == 200
+        assert response.get_json()["result"] == [True, False]
+
+    def test_invalid_expression_is_rejected(self):
+        response = self.client.post('/expressions/evaluate', json={"expression": "distance -", "context": {}})
+
+        assert response.status_code == 400
+
+    def test_missing_expression_is_rejected(self):
+        response = self.client.post('/expressions/evaluate', json={"context": {}})
+
+        assert response.status_code == 400
+
+    def test_cache_stats_endpoint(self):
+        self.client.post('/expressions/evaluate', json={"expression": "1 + 1"})
+
+        stats = self.client.get('/admin/expression-cache').get_json()
+        assert stats["max_size"] == 2
+        assert stats["size"] >= 1
+
+
+class TestExpressionService:
+    def test_lru_eviction(self):
+        service = ExpressionService(cache_size=2)
+        for expression in ("1 + 1", "2 + 2", "1 + 1", "3 + 3"):
+            service.evaluate_expression(ExpressionEvaluationRequest(expression=expression, contexts=[{}]))
+
+        stats = service.stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        # "1 + 1" was used most recently before "3 + 3", so "2 + 2" was evicted
+        assert service.evaluate_expression(ExpressionEvaluationRequest(expression="1 + 1", contexts=[{}])).cached is True
+        assert service.evaluate_expression(ExpressionEvaluationRequest(expression="2 + 2", contexts=[{}])).cached is False
+
+    def test_empty_expression(self):
+        with pytest.raises(ValueError):
+            ExpressionService().evaluate_expression(ExpressionEvaluationRequest(expression=" ", contexts=[{}]))
@@ -0,0 +1,129 @@
+import copy
+import itertools
+import json
+import os
+
+import zen
+
+from src.application.services.compiled_decision_cache import CompiledDecisionCache
+from src.application.services.finite_domain_lookup import FiniteDomainLookup
+from src.config.settings import Settings
+from src.presentation.app import create_app
+
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'rules', 'fire_risk', '3', 'fire_risk.json')
+
+
+class TestFiniteDomainLookup:
+    def setup_method(self):
+        with open(RULES_PATH) as f:
+            self.graph = json.load(f)
+        self.decision = zen.ZenEngine().create_decision(zen.ZenDecisionContent(json.dumps(self.graph)))
+        self.lookup = FiniteDomainLookup.build(self.graph, self.decision)
+
+    def test_attic_and_roof_branches_are_precomputed(self):
+        branches = self.lookup.describe()
+
+        assert set(branches) == {"attic", "roof"}
+        assert branches["attic"]["fields"] == ["attic_vent_screens"]
+        assert branches["roof"]["fields"] == ["roof_type", "wild_fire_risk"]
+
+    def test_lookup_matches_engine_across_domain(self):
+        absent = object()
+        observations = [
+            {"risk_type": "attic", "attic_vent_screens": screens}
+            for screens in (True, False)
+        ] + [{"risk_type": "attic"}]
+        for roof_type, wild_fire_risk in itertools.product(["a", "b", "c", "z", absent], ["a", "b", "c", absent]):
+            observation = {"risk_type": "roof"}
+            if roof_type is not absent:
+                observation["roof_type"] = roof_type
+            if wild_fire_risk is not absent:
+                observation["wild_fire_risk"] = wild_fire_risk
+            observations.append(observation)
+
+        for observation in observations:
+            result = self.lookup.lookup(observation)
+            assert result is not None, observation
+            assert result == self.decision.evaluate(observation)["result"]
+
+    def test_observations_outside_domain_use_engine(self):
+        assert self.lookup.lookup({"risk_type": "attic", "attic_vent_screens": 0}) is None
+        assert self.lookup.lookup({"risk_type": "attic", "attic_vent_screens": "false"}) is None
+        assert self.lookup.lookup({"risk_type": "roof", "roof_type": None}) is None
+        assert self.lookup.lookup({"risk_type": "roof", "roof_type": "a", "notes": "extra"}) is None
+        assert self.lookup.lookup({"risk_type": "windows", "window_type": "single"}) is None
+        assert self.lookup.lookup({"roof_type": "a"}) is None
+
+    def test_results_are_not_shared_between_calls(self):
+        first = self.lookup.lookup({"risk_type": "attic", "attic_vent_screens": False})
+        first["mitigations"] = "changed"
+
+        assert self.lookup.lookup({"risk_type": "attic", "attic_vent_screens": False})["mitigations"] == "Add Vents"
+
+    def test_tables_with_non_literal_cells_are_skipped(self):
+        graph = copy.deepcopy(self.graph)
+        roof = next(node for node in graph["nodes"] if node["name"] == "Roof")
+        roof_type_column = roof["content"]["inputs"][0]["id"]
+        roof["content"]["rules"][0][roof_type_column] = '"a", "b"'
+        decision = zen.ZenEngine().create_decision(zen.ZenDecisionContent(json.dumps(graph)))
+
+        lookup = FiniteDomainLookup.build(graph, decision)
+
+        assert set(lookup.describe()) == {"attic"}
+
+    def test_branch_shadowed_by_earlier_statement_is_skipped(self):
+        graph = copy.deepcopy(self.graph)
+        switch = next(node for node in graph["nodes"] if node["type"] == "switchNode")
+        switch["content"]["statements"].insert(1, {"id": "roof-first", "condition": 'risk_type == "roof"', "isDefault": False})
+        graph["nodes"].append({
+            "id": "roof-expression",
+            "name": "Roof Override",
+            "type": "expressionNode",
+            "content": {"expressions": [{"id": "e1", "key": "mitigations", "value": '"X-hit"'}]},
+            "position": {"x": 0, "y": 0}
+        })
+        graph["edges"].append({
+            "id": "roof-first-edge",
+            "type": "edge",
+            "sourceId": switch["id"],
+            "targetId": "roof-expression",
+            "sourceHandle": "roof-first"
+        })
+        decision = zen.ZenEngine().create_decision(zen.ZenDecisionContent(json.dumps(graph)))
+
+        lookup = FiniteDomainLookup.build(graph, decision)
+
+        # The engine routes every roof observation to the first matching statement
+        assert decision.evaluate({"risk_type": "roof", "roof_type": "x"})["result"]["mitigations"] == "X-hit"
+        assert set(lookup.describe()) == {"attic"}
+        assert lookup.lookup({"risk_type": "roof", "roof_type": "x"}) is None
+
+    def test_decision_cache_builds_lookup_only_when_enabled(self):
+        assert CompiledDecisionCache().get_lookup("fire_risk", "3") is None
+
+        cache = CompiledDecisionCache(precompute_lookups=True)
+        lookup = cache.get_lookup("fire_risk", "3")
+
+        assert cache.get_lookup("fire_risk", "3") is lookup
+        assert set(cache.stats()["lookups"]["fire_risk/3"]) == {"attic", "roof"}
+
+
+class TestFiniteDomainLookupApi:
+    def test_results_match_with_and_without_lookups(self):
+        observations = [
+            {"risk_type": "attic", "attic_vent_screens": False},
+            {"risk_type": "attic", "attic_vent_screens": True},
+            {"risk_type": "roof", "roof_type": "c", "wild_fire_risk": "a"},
+            {"risk_type": "roof", "roof_type": "a", "wild_fire_risk": "b"},
+            {"risk_type": "windows", "window_type": "single", "vegetation_type": "tree", "distance": 80}
+        ]
+
+        without = create_app(Settings(precompute_lookup_tables=False)).test_client().post(
+            '/rules/version/3', json={"observations": observations}
+        ).get_json()
+        with_client = create_app(Settings(precompute_lookup_tables=True)).test_client()
+        with_lookups = with_client.post('/rules/version/3', json={"observations": observations}).get_json()
+
+        assert with_lookups["result"] == without["result"]
+        assert "fire_risk/3" in with_client.get('/admin/decision-cache').get_json()["lookups"]
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from src.application.services.fire_mitigation_service import FireMitigationService
+from src.tools.load_generator import LoadResult, WorkloadMix
+
+
+class TestLoadGenerator:
+    def setup_method(self):
+        self.templates = FireMitigationService().create_sample_observations()
+
+    def test_mix_respects_array_size_and_risk_types(self):
+        mix = WorkloadMix(array_size=(2, 4), risk_weights={'attic': 1.0}, version_weights={'3': 1.0})
+        rng = random.Random(7)
+
+        for _ in range(50):
+            property_id, observations, version = mix.build_request(rng, self.templates)
+            assert property_id.startswith("PROP-")
+            assert 2 <= len(observations) <= 4
+            assert all(obs["risk_type"] == "attic" for obs in observations)
+            assert version == "3"
+
+    def test_latest_version_is_unpinned(self):
+        mix = WorkloadMix(version_weights={'latest': 1.0})
+
+        _, _, version = mix.build_request(random.Random(1), self.templates)
+
+        assert version is None
+
+    def test_summary_reports_errors_and_histogram(self):
+        result = LoadResult(target="local", duration=2.0, latencies_ms=[0.5, 3.0, 3.0, 150.0], observations=8)
+        result.errors = {"http_429": 1}
+
+        summary = result.summary()
+
+        assert summary["requests"] == 5
+        assert summary["throughput_rps"] == pytest.approx(2.5)
+        assert summary["error_rate"] == pytest.approx(0.2)
+        assert summary["histogram"][0] == 1
+        assert summary["histogram"][2] == 2
+        assert summary["max_ms"] == 150.0
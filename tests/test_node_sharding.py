@@ -0,0 +1,238 @@
+import socket
+import threading
+from collections import Counter
+
+import pytest
+from werkzeug.serving import make_server
+
+from src.application.services.fire_mitigation_service import FireMitigationService
+from src.application.services.node_pool import ConsistentHashRing, NodePool, NodeSaturatedError
+from src.presentation.app import create_app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestConsistentHashRing:
+    def setup_method(self):
+        self.nodes = ["http://node-a", "http://node-b", "http://node-c"]
+        self.keys = [f"PROP-{i}" for i in range(3000)]
+
+    def test_keys_spread_across_nodes(self):
+        ring = ConsistentHashRing(self.nodes)
+
+        counts = Counter(ring.node_for(key) for key in self.keys)
+
+        assert set(counts) == set(self.nodes)
+        assert min(counts.values()) > len(self.keys) / len(self.nodes) * 0.7
+
+    def test_mapping_is_stable_across_instances(self):
+        first = ConsistentHashRing(self.nodes)
+        second = ConsistentHashRing(list(reversed(self.nodes)))
+
+        assert all(first.node_for(key) == second.node_for(key) for key in self.keys)
+
+    def test_removing_a_node_only_moves_its_keys(self):
+        ring = ConsistentHashRing(self.nodes)
+        before = {key: ring.node_for(key) for key in self.keys}
+
+        ring.remove_node("http://node-b")
+
+        for key, node in before.items():
+            if node != "http://node-b":
+                assert ring.node_for(key) == node
+            else:
+                assert ring.node_for(key) == ring.preference_list(key)[0] != "http://node-b"
+
+    def test_preference_list_covers_every_node_once(self):
+        ring = ConsistentHashRing(self.nodes)
+
+        preference = ring.preference_list("PROP-1")
+
+        assert sorted(preference) == sorted(self.nodes)
+
+
+class TestNodePool:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.pool = NodePool(
+            ["http://node-a", "http://node-b"],
+            max_concurrency_per_node=1,
+            failure_threshold=2,
+            ejection_seconds=10,
+            acquire_timeout=0.01,
+            clock=self.clock
+        )
+        self.owner = self.pool.candidates("PROP-1")[0]
+
+    def test_node_is_ejected_after_consecutive_failures(self):
+        self.pool.record_failure(self.owner)
+        assert self.pool.candidates("PROP-1")[0] == self.owner
+
+        self.pool.record_failure(self.owner)
+
+        assert self.pool.candidates("PROP-1")[0] != self.owner
+        # Ejected nodes stay available as a last resort
+        assert self.pool.candidates("PROP-1")[-1] == self.owner
+        assert self.pool.snapshot()[self.owner]["healthy"] is False
+
+    def test_success_resets_failure_count(self):
+        self.pool.record_failure(self.owner)
+        self.pool.record_success(self.owner)
+        self.pool.record_failure(self.owner)
+
+        assert self.pool.candidates("PROP-1")[0] == self.owner
+
+    def test_ejected_node_is_retried_after_cooldown(self):
+        self.pool.record_failure(self.owner)
+        self.pool.record_failure(self.owner)
+
+        self.clock.now = 11
+        assert self.pool.candidates("PROP-1")[0] == self.owner
+
+        # A failure while on probation ejects the node again immediately
+        self.pool.record_failure(self.owner)
+        assert self.pool.candidates("PROP-1")[0] != self.owner
+
+        self.clock.now = 22
+        self.pool.record_success(self.owner)
+        self.pool.record_failure(self.owner)
+        assert self.pool.candidates("PROP-1")[0] == self.owner
+
+    def test_concurrency_is_bounded_per_node(self):
+        other = self.pool.candidates("PROP-1")[1]
+
+        with self.pool.slot(self.owner):
+            with pytest.raises(NodeSaturatedError):
+                with self.pool.slot(self.owner):
+                    pass
+            with self.pool.slot(other):
+                pass
+
+        with self.pool.slot(self.owner):
+            pass
+
+
+class CountingApp:
+    """Records the paths each local instance serves."""
+
+    def __init__(self, app):
+        self.app = app
+        self.paths = []
+
+    def __call__(self, environ, start_response):
+        self.paths.append(environ['PATH_INFO'])
+        return self.app(environ, start_response)
+
+
+class StatusApp:
+    """Answers every request with a fixed error status."""
+
+    def __init__(self, status):
+        self.status = status
+        self.paths = []
+
+    def __call__(self, environ, start_response):
+        self.paths.append(environ['PATH_INFO'])
+        start_response(self.status, [('Content-Type', 'application/json')])
+        return [b'{"error": "unavailable"}']
+
+
+class TestShardedFireMitigationService:
+    def setup_method(self):
+        self.servers = []
+        self.apps = {}
+        for _ in range(3):
+            app = CountingApp(create_app())
+            self.apps[self._serve(app)] = app
+
+    def _serve(self, app) -> str:
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    def teardown_method(self):
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_property_always_reaches_the_same_node(self):
+        service = FireMitigationService(rules_api_base_urls=list(self.apps))
+        observations = service.create_sample_observations()
+
+        for i in range(12):
+            property_id = f"PROP-{i}"
+            owner = service.node_for_property(property_id)
+            before = {url: len(app.paths) for url, app in self.apps.items()}
+
+            for _ in range(2):
+                result = service.submit_property_observations(property_id, observations)
+                assert result["property_id"] == property_id
+
+            assert {url: len(app.paths) - before[url] for url, app in self.apps.items() if len(app.paths) != before[url]} == {owner: 2}
+
+    def test_unreachable_node_is_ejected_and_its_properties_fall_over(self):
+        dead_url = f"http://127.0.0.1:{_unused_port()}"
+        service = FireMitigationService(rules_api_base_urls=list(self.apps) + [dead_url], failure_threshold=1)
+        observations = service.create_sample_observations()
+        property_id = next(f"PROP-{i}" for i in range(1000) if service.node_for_property(f"PROP-{i}") == dead_url)
+
+        result = service.submit_property_observations(property_id, observations)
+
+        assert len(result["result"]) == 3
+        assert service.nodes.snapshot()[dead_url]["healthy"] is False
+        assert service.node_for_property(property_id) != dead_url
+
+    def test_deadline_timeout_is_not_resent_or_counted_against_the_node(self):
+        slow_url = self._serve(StatusApp('504 Gateway Timeout'))
+        service = FireMitigationService(rules_api_base_urls=list(self.apps) + [slow_url], failure_threshold=1)
+        property_id = next(f"PROP-{i}" for i in range(1000) if service.node_for_property(f"PROP-{i}") == slow_url)
+
+        with pytest.raises(RuntimeError):
+            service.submit_property_observations(property_id, service.create_sample_observations())
+
+        assert all(not app.paths for app in self.apps.values())
+        assert service.nodes.snapshot()[slow_url]["healthy"] is True
+
+    def test_delta_is_not_resent_once_a_node_received_it(self):
+        failing_url = self._serve(StatusApp('503 Service Unavailable'))
+        service = FireMitigationService(rules_api_base_urls=list(self.apps) + [failing_url], failure_threshold=1)
+        property_id = next(f"PROP-{i}" for i in range(1000) if service.node_for_property(f"PROP-{i}") == failing_url)
+
+        with pytest.raises(RuntimeError):
+            service.submit_property_delta(property_id, added={"a1": {"risk_type": "attic"}}, replace=True)
+
+        assert all(not app.paths for app in self.apps.values())
+        assert service.nodes.snapshot()[failing_url]["healthy"] is False
+
+    def test_delta_falls_over_when_the_node_is_unreachable(self):
+        dead_url = f"http://127.0.0.1:{_unused_port()}"
+        service = FireMitigationService(rules_api_base_urls=list(self.apps) + [dead_url], failure_threshold=1)
+        property_id = next(f"PROP-{i}" for i in range(1000) if service.node_for_property(f"PROP-{i}") == dead_url)
+
+        result = service.submit_property_delta(
+            property_id, added={"a1": {"risk_type": "attic", "attic_vent_screens": False}}, replace=True
+        )
+
+        assert result["result"]["a1"]["mitigations"] == "Add Vents"
+
+    def test_health_check_reports_each_node(self):
+        dead_url = f"http://127.0.0.1:{_unused_port()}"
+        service = FireMitigationService(rules_api_base_urls=list(self.apps) + [dead_url], failure_threshold=1)
+
+        health = service.check_node_health()
+
+        assert health[dead_url] is False
+        assert all(health[url] for url in self.apps)
+
+
+def _unused_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
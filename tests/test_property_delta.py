@@ -0,0 +1,125 @@
+from src.config.settings import Settings
+from src.domain.models.property_state import PropertyState
+from src.infrastructure.repositories.in_memory_property_state_repository import InMemoryPropertyStateRepository
+from src.presentation.app import create_app
+
+
+class TestPropertyDelta:
+    def setup_method(self):
+        self.app = create_app(Settings(profile_sample_rate=0.0))
+        self.client = self.app.test_client()
+        self.window = {"risk_type": "windows", "window_type": "single", "vegetation_type": "tree", "distance": 80}
+        self.attic = {"risk_type": "attic", "attic_vent_screens": False}
+
+    def _delta(self, **body):
+        return self.client.post('/rules/version/3/delta', json={"property_id": "PROP-1", **body})
+
+    def test_added_observations_are_evaluated(self):
+        response = self._delta(added={"w1": self.window, "a1": self.attic}, replace=True)
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["api_version"] == "3"
+        assert body["property_id"] == "PROP-1"
+        assert body["result"]["w1"]["safe_distance_diff"] == 10
+        assert body["result"]["a1"]["mitigations"] == "Add Vents"
+
+    def test_changes_merge_with_stored_state(self):
+        self._delta(added={"w1": self.window, "a1": self.attic}, replace=True)
+
+        response = self._delta(
+            changed={"a1": {"risk_type": "attic", "attic_vent_screens": True}},
+            removed=["w1"]
+        )
+
+        assert response.status_code == 200
+        result = response.get_json()["result"]
+        assert set(result) == {"a1"}
+        assert "mitigations" not in result["a1"]
+
+    def test_unknown_ids_require_full_resubmission(self):
+        self._delta(added={"a1": self.attic}, replace=True)
+
+        response = self._delta(changed={"missing": self.attic})
+
+        assert response.status_code == 409
+
+    def test_delta_without_stored_state_is_rejected(self):
+        response = self._delta(added={"a1": self.attic})
+
+        assert response.status_code == 409
+
+    def test_delta_after_eviction_is_rejected(self):
+        client = create_app(Settings(profile_sample_rate=0.0, property_state_max_properties=1)).test_client()
+        client.post('/rules/version/3/delta', json={
+            "property_id": "A", "added": {"a1": self.attic, "a2": self.attic}, "replace": True
+        })
+        client.post('/rules/version/3/delta', json={"property_id": "B", "added": {"b1": self.attic}, "replace": True})
+
+        response = client.post('/rules/version/3/delta', json={"property_id": "A", "added": {"a3": self.attic}})
+
+        assert response.status_code == 409
+
+    def test_replace_discards_stored_state(self):
+        self._delta(added={"w1": self.window, "a1": self.attic}, replace=True)
+
+        response = self._delta(added={"a1": self.attic}, replace=True)
+
+        assert response.status_code == 200
+        assert set(response.get_json()["result"]) == {"a1"}
+
+    def test_replace_only_accepts_added_observations(self):
+        self._delta(added={"a1": self.attic}, replace=True)
+
+        assert self._delta(added={"a2": self.attic}, removed=["a1"], replace=True).status_code == 400
+        assert self._delta(added={"a2": self.attic}, replace="yes").status_code == 400
+
+    def test_latest_is_not_a_version(self):
+        response = self.client.post('/rules/version/latest/delta', json={
+            "property_id": "PROP-1", "added": {"a1": self.attic}, "replace": True
+        })
+
+        assert response.status_code == 500
+        assert self.client.post('/rules/version/latest', json={"observations": self.attic}).status_code == 500
+        assert self.app.container.property_state_repository().get("PROP-1", "latest") is None
+
+    def test_duplicate_added_id_is_rejected(self):
+        self._delta(added={"a1": self.attic}, replace=True)
+
+        assert self._delta(added={"a1": self.attic}).status_code == 400
+
+    def test_property_limit_is_enforced(self):
+        client = create_app(Settings(max_observations_per_property=1)).test_client()
+
+        response = client.post('/rules/version/3/delta', json={
+            "property_id": "PROP-1",
+            "added": {"w1": self.window, "a1": self.attic},
+            "replace": True
+        })
+
+        assert response.status_code == 400
+
+    def test_property_id_is_required(self):
+        response = self.client.post('/rules/latest/delta', json={"added": {"a1": self.attic}, "replace": True})
+
+        assert response.status_code == 400
+
+
+class TestInMemoryPropertyStateRepository:
+    def test_least_recently_used_property_is_evicted(self):
+        repository = InMemoryPropertyStateRepository(max_properties=2)
+        repository.save(PropertyState(property_id="p1", version="3"))
+        repository.save(PropertyState(property_id="p2", version="3"))
+        repository.get("p1", "3")
+        repository.save(PropertyState(property_id="p3", version="3"))
+
+        assert repository.get("p2", "3") is None
+        assert repository.get("p1", "3") is not None
+        assert repository.stats()["evictions"] == 1
+
+    def test_state_is_keyed_by_version(self):
+        repository = InMemoryPropertyStateRepository()
+        repository.save(PropertyState(property_id="p1", version="2"))
+
+        assert repository.get("p1", "3") is None
+        assert repository.delete("p1", "2")
@@ -0,0 +1,116 @@
+import random
+import time
+
+from src.application.services.phase_timer import PhaseTimer, current_timer, timed
+from src.application.services.slow_request_log import SlowRequestLog
+from src.config.settings import Settings
+from src.presentation.app import create_app
+
+
+def _server_timing(response):
+    phases = {}
+    for entry in response.headers['Server-Timing'].split(', '):
+        name, _, duration = entry.partition(';dur=')
+        phases[name] = float(duration)
+    return phases
+
+
+class TestRequestTiming:
+    def setup_method(self):
+        self.client = create_app(Settings(slow_request_threshold_ms=0)).test_client()
+        self.client.delete('/admin/slow-requests')
+        self.body = {"observations": [{"risk_type": "windows", "window_type": "single", "vegetation_type": "tree", "distance": 80}]}
+
+    def test_server_timing_reports_request_phases(self):
+        response = self.client.post('/rules/latest', json=self.body)
+
+        phases = _server_timing(response)
+        assert {"parse", "validate", "admission", "resolve", "evaluate", "serialize", "total"} <= set(phases)
+        assert sum(duration for name, duration in phases.items() if name != "total") <= phases["total"] + 0.01
+
+    def test_pinned_version_skips_resolution(self):
+        response = self.client.post('/rules/version/3', json=self.body)
+
+        assert "resolve" not in _server_timing(response)
+
+    def test_error_responses_are_timed(self):
+        response = self.client.post('/rules/latest', json={"observations": []})
+
+        assert response.status_code == 400
+        assert "validate" in _server_timing(response)
+
+    def test_server_timing_can_be_disabled(self):
+        client = create_app(Settings(server_timing_enabled=False)).test_client()
+
+        response = client.post('/rules/latest', json=self.body)
+
+        assert 'Server-Timing' not in response.headers
+
+    def test_slow_requests_endpoint(self):
+        self.client.post('/rules/latest', json=self.body)
+
+        snapshot = self.client.get('/admin/slow-requests').get_json()
+
+        entry = snapshot["entries"][0]
+        assert entry["path"] == "/rules/latest"
+        assert entry["status"] == 200
+        assert entry["request_bytes"] > 0
+        assert entry["response_bytes"] > 0
+        assert "evaluate" in entry["phases_ms"]
+
+        assert self.client.delete('/admin/slow-requests').status_code == 200
+        assert self.client.get('/admin/slow-requests').get_json()["entries"] == []
+
+    def test_timer_is_cleared_after_request(self):
+        self.client.post('/rules/latest', json=self.body)
+
+        assert current_timer() is None
+
+
+class TestPhaseTimer:
+    def test_nested_phases_are_exclusive(self):
+        timer = PhaseTimer()
+        with timer.phase("outer"):
+            time.sleep(0.01)
+            with timer.phase("inner"):
+                time.sleep(0.02)
+
+        assert timer.phases["inner"] >= 0.02
+        assert 0.01 <= timer.phases["outer"] < 0.02
+
+    def test_timed_is_a_no_op_without_a_request(self):
+        with timed("evaluate"):
+            pass
+
+        assert current_timer() is None
+
+
+class TestSlowRequestLog:
+    def _record(self, log, total_ms):
+        return log.record("POST", "/rules/latest", 200, total_ms, {"evaluate": total_ms}, 10, 20)
+
+    def test_fast_requests_are_ignored(self):
+        log = SlowRequestLog(threshold_ms=50)
+
+        assert self._record(log, 10) is False
+        assert self._record(log, 60) is True
+        assert log.snapshot()["requests"] == 2
+        assert log.snapshot()["slow_requests"] == 1
+
+    def test_entries_are_bounded_and_sorted_by_duration(self):
+        log = SlowRequestLog(capacity=3, threshold_ms=0)
+        for total_ms in (5, 50, 20, 10, 30):
+            self._record(log, total_ms)
+
+        entries = log.snapshot()["entries"]
+
+        # The oldest entries were overwritten
+        assert [entry["total_ms"] for entry in entries] == [30, 20, 10]
+        assert [entry["total_ms"] for entry in log.snapshot(limit=1)["entries"]] == [30]
+
+    def test_sampling(self):
+        log = SlowRequestLog(capacity=1000, threshold_ms=0, sample_rate=0.25, rng=random.Random(3))
+        for _ in range(400):
+            self._record(log, 100)
+
+        assert 60 < len(log.snapshot()["entries"]) < 140
@@ -0,0 +1,282 @@
+import json
+import multiprocessing
+import os
+import stat
+import threading
+
+import pytest
+
+from src.application.services.compiled_decision_cache import CompiledDecisionCache
+from src.application.services.rule_graph_profiler import RuleGraphProfiler
+from src.application.services.rules_service import RulesService
+from src.config.settings import Settings
+from src.domain.models.rule_evaluation import RuleEvaluationRequest
+from src.infrastructure.cache.null_result_cache import NullResultCache
+from src.infrastructure.cache.sqlite_result_cache import SqliteResultCache
+from src.presentation.app import create_app
+
+
+RULES_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'rules')
+
+WINDOW = {"risk_type": "windows", "window_type": "single", "vegetation_type": "tree", "distance": 80}
+RESULT = {"risk_type": "windows", "safe_distance_diff": 10}
+
+
+def _write_from_other_process(path):
+    cache = SqliteResultCache(path)
+    cache.put_many("3", "f1", [(WINDOW, RESULT)])
+    cache.close()
+
+
+def _graph(nodes, edges):
+    return {"nodes": nodes, "edges": edges, "contentType": "application/vnd.gorules.decision"}
+
+
+def _input_node():
+    return {"id": "in", "name": "request", "type": "inputNode", "content": {"schema": ""}, "position": {"x": 0, "y": 0}}
+
+
+def _write(root, family, version, graph):
+    directory = os.path.join(root, family, version)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{family}.json")
+    with open(path, "w") as f:
+        json.dump(graph, f)
+    return path
+
+
+class TestSqliteResultCache:
+    def _cache(self, tmp_path, **kwargs):
+        return SqliteResultCache(str(tmp_path / "results.sqlite"), evict_interval=1, **kwargs)
+
+    def test_round_trip_with_canonical_keys(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_many("3", "f1", [(WINDOW, RESULT)])
+
+        reordered = dict(reversed(list(WINDOW.items())))
+        assert cache.get_many("3", "f1", [reordered, {"risk_type": "roof"}]) == [RESULT, None]
+        assert cache.get_many("2", "f1", [WINDOW]) == [None]
+        assert cache.get_many("3", "f2", [WINDOW]) == [None]
+
+    def test_values_are_not_confused_across_types(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_many("3", "f1", [({"risk_type": "attic", "attic_vent_screens": True}, {"n": 1})])
+
+        assert cache.get_many("3", "f1", [{"risk_type": "attic", "attic_vent_screens": 1}]) == [None]
+
+    def test_shared_between_processes(self, tmp_path):
+        cache = self._cache(tmp_path)
+        process = multiprocessing.get_context('fork').Process(target=_write_from_other_process, args=(cache.path,))
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert cache.get_many("3", "f1", [WINDOW]) == [RESULT]
+
+    def test_new_fingerprint_purges_older_results(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_many("3", "f1", [(WINDOW, RESULT)])
+        cache.put_many("2", "f1", [(WINDOW, RESULT)])
+
+        cache.put_many("3", "f2", [({"risk_type": "roof"}, {"mitigations": "No Mitigation"})])
+
+        assert cache.get_many("3", "f1", [WINDOW]) == [None]
+        assert cache.get_many("2", "f1", [WINDOW]) == [RESULT]
+
+    def test_invalidate_version(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_many("3", "f1", [(WINDOW, RESULT)])
+        cache.put_many("2", "f1", [(WINDOW, RESULT)])
+
+        assert cache.invalidate("3") == 1
+        assert cache.get_many("3", "f1", [WINDOW]) == [None]
+        assert cache.invalidate() == 1
+
+    def test_size_is_bounded(self, tmp_path):
+        cache = self._cache(tmp_path, max_entries=10)
+        for i in range(30):
+            cache.put_many("3", "f1", [({"risk_type": "windows", "distance": i}, {"i": i})])
+
+        stats = cache.stats()
+        assert stats["entries"] <= 10
+        assert stats["evictions"] >= 20
+        # The most recent entries survive
+        assert cache.get_many("3", "f1", [{"risk_type": "windows", "distance": 29}]) == [{"i": 29}]
+
+    def test_unavailable_backend_is_bypassed(self, tmp_path):
+        cache = SqliteResultCache(str(tmp_path / "missing" / "results.sqlite"), retry_interval=60)
+
+        assert cache.get_many("3", "f1", [WINDOW]) == [None]
+        assert cache.available() is False
+        stats = cache.stats()
+        assert stats["errors"] == 1
+        assert stats["bypassed"] == 1
+
+    def test_connections_stay_bounded_across_short_lived_threads(self, tmp_path):
+        cache = self._cache(tmp_path, max_connections=2, timeout_ms=1000)
+
+        def request(i):
+            observation = {"risk_type": "windows", "distance": i}
+            cache.put_many("3", "f1", [(observation, {"i": i})])
+            assert cache.get_many("3", "f1", [observation]) == [{"i": i}]
+
+        for batch in range(30):
+            threads = [threading.Thread(target=request, args=(batch * 10 + i,)) for i in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        stats = cache.stats()
+        assert stats["connections"] <= 2
+        assert stats["entries"] == 300
+        assert stats["errors"] == 0
+
+    def test_invalidate_reports_unavailable_backend(self, tmp_path):
+        cache = SqliteResultCache(str(tmp_path / "missing" / "results.sqlite"), retry_interval=60)
+
+        with pytest.raises(RuntimeError):
+            cache.invalidate()
+        assert cache.available() is False
+        assert cache.stats()["errors"] == 1
+
+    def test_database_file_is_private(self, tmp_path):
+        cache = self._cache(tmp_path)
+        cache.put_many("3", "f1", [(WINDOW, RESULT)])
+
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+
+    def test_default_location_is_a_private_directory(self, tmp_path):
+        cache = SqliteResultCache(base_directory=str(tmp_path), evict_interval=1)
+        cache.put_many("3", "f1", [(WINDOW, RESULT)])
+
+        directory = os.path.dirname(cache.path)
+        assert os.path.dirname(directory) == str(tmp_path)
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+        assert cache.get_many("3", "f1", [WINDOW]) == [RESULT]
+
+    def test_shared_default_directory_is_refused(self, tmp_path):
+        directory = tmp_path / f"fire-rules-{os.getuid()}"
+        directory.mkdir()
+        directory.chmod(0o777)
+        cache = SqliteResultCache(base_directory=str(tmp_path), retry_interval=60)
+
+        assert cache.get_many("3", "f1", [WINDOW]) == [None]
+        assert cache.available() is False
+        assert not os.path.exists(cache.path)
+
+
+class TestRulesServiceResultCache:
+    def _service(self, path):
+        return RulesService(
+            decision_cache=CompiledDecisionCache(RULES_ROOT, precompute_lookups=True),
+            result_cache=SqliteResultCache(path)
+        )
+
+    def test_repeated_observations_are_served_from_cache(self, tmp_path):
+        path = str(tmp_path / "results.sqlite")
+        observations = [WINDOW, {"risk_type": "attic", "attic_vent_screens": False}]
+        service = self._service(path)
+        first = service.evaluate_fire_risk(RuleEvaluationRequest(observations=observations, version="3"))
+
+        # A second service with its own decision cache stands in for another worker process
+        other = self._service(path)
+        second = other.evaluate_fire_risk(RuleEvaluationRequest(observations=observations, version="3"))
+
+        assert second.result == first.result
+        assert other._result_cache.stats()["hits"] == 1
+        # Observations answered by precomputed lookup tables are not stored
+        assert service._result_cache.stats()["writes"] == 1
+
+    def test_lookup_tables_are_consulted_once_per_observation(self, tmp_path):
+        service = self._service(str(tmp_path / "results.sqlite"))
+        lookup = service._load_lookup("3")
+        calls = []
+        original = lookup.lookup
+        lookup.lookup = lambda observation: calls.append(observation) or original(observation)
+
+        service.evaluate_fire_risk(RuleEvaluationRequest(
+            observations=[WINDOW, {"risk_type": "attic", "attic_vent_screens": False}],
+            version="3"
+        ))
+
+        assert len(calls) == 2
+
+    def test_sampled_observations_bypass_the_cache(self, tmp_path):
+        path = str(tmp_path / "results.sqlite")
+        self._service(path).evaluate_fire_risk(RuleEvaluationRequest(observations=[WINDOW], version="3"))
+        profiler = RuleGraphProfiler(sample_rate=1.0)
+        service = RulesService(
+            decision_cache=CompiledDecisionCache(RULES_ROOT, precompute_lookups=True),
+            result_cache=SqliteResultCache(path),
+            profiler=profiler
+        )
+
+        result = service.evaluate_fire_risk(RuleEvaluationRequest(observations=[WINDOW, WINDOW], version="3"))
+
+        assert result.result[0]["safe_distance_diff"] == 10
+        assert profiler.snapshot()["versions"]["3"]["samples"] == 2
+        stats = service._result_cache.stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
+
+    def test_evaluation_falls_back_when_backend_fails(self, tmp_path):
+        service = self._service(str(tmp_path / "missing" / "results.sqlite"))
+
+        result = service.evaluate_fire_risk(RuleEvaluationRequest(observations=[WINDOW], version="3"))
+
+        assert result.result[0]["safe_distance_diff"] == 10
+
+
+class TestDecisionFingerprint:
+    def test_fingerprint_covers_referenced_graphs(self, tmp_path):
+        root = str(tmp_path)
+        child_path = _write(root, "child", "1", _graph([_input_node()], []))
+        _write(root, "parent", "1", _graph(
+            [
+                _input_node(),
+                {
+                    "id": "sub",
+                    "name": "Child",
+                    "type": "decisionNode",
+                    "content": {"key": "child/1", "passThrough": True, "inputField": None, "outputPath": None, "executionMode": "single"},
+                    "position": {"x": 0, "y": 0}
+                }
+            ],
+            [{"id": "e1", "type": "edge", "sourceId": "in", "targetId": "sub"}]
+        ))
+        cache = CompiledDecisionCache(root)
+        before = cache.fingerprint("parent", "1")
+        assert cache.fingerprint("parent", "1") == before
+
+        with open(child_path, "w") as f:
+            json.dump(_graph([_input_node()], [{"id": "e0", "type": "edge", "sourceId": "in", "targetId": "in"}]), f)
+        stat = os.stat(child_path)
+        os.utime(child_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        assert cache.fingerprint("parent", "1") != before
+
+
+class TestResultCacheApi:
+    def test_admin_endpoints(self, tmp_path):
+        settings = Settings(result_cache_backend='sqlite', result_cache_path=str(tmp_path / "results.sqlite"))
+        client = create_app(settings).test_client()
+
+        client.post('/rules/version/3', json={"observations": [WINDOW]})
+        response = client.post('/rules/version/3', json={"observations": [WINDOW]})
+
+        assert response.get_json()["result"][0]["safe_distance_diff"] == 10
+        assert client.get('/admin/result-cache').get_json()["hits"] >= 1
+        assert client.delete('/admin/result-cache?version=3').get_json()["removed"] == 1
+
+    def test_invalidate_of_unavailable_backend_returns_503(self, tmp_path):
+        settings = Settings(result_cache_backend='sqlite', result_cache_path=str(tmp_path / "missing" / "results.sqlite"))
+        client = create_app(settings).test_client()
+
+        assert client.delete('/admin/result-cache').status_code == 503
+
+    def test_disabled_by_default(self):
+        assert NullResultCache().available() is False
+        client = create_app(Settings(result_cache_backend='none')).test_client()
+
+        assert client.get('/admin/result-cache').get_json() == {"enabled": False}
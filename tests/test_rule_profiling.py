@@ -0,0 +1,59 @@
+import pytest
+
+from src.application.services.performance import parse_performance_us
+from src.config.settings import Settings
+from src.presentation.app import create_app
+
+
+WINDOWS_TABLE_ID = "9eec2884-0c0c-494a-863c-2ed9c22088f6"
+SWITCH_ID = "418ebdd8-95d7-46f5-9aa9-1918a474127f"
+
+
+class TestRuleProfiling:
+    def setup_method(self):
+        self.app = create_app(Settings(profile_sample_rate=1.0))
+        self.client = self.app.test_client()
+
+    def test_profile_aggregates_nodes_and_rows(self):
+        observations = [
+            {"risk_type": "windows", "window_type": "tempered", "vegetation_type": "grass", "distance": 5},
+            {"risk_type": "windows", "window_type": "tempered", "vegetation_type": "grass", "distance": 50},
+            {"risk_type": "attic", "attic_vent_screens": False}
+        ]
+        response = self.client.post('/rules/version/3', json={"observations": observations})
+        assert response.status_code == 200
+        assert "trace" not in response.get_json()["result"][0]
+
+        profile = self.client.get('/admin/profile').get_json()
+        version = profile["versions"]["3"]
+        assert version["samples"] == 3
+
+        switch = version["nodes"][SWITCH_ID]
+        assert switch["name"] == "switch1"
+        assert switch["hits"] == 3
+
+        windows = version["nodes"][WINDOWS_TABLE_ID]
+        assert windows["hits"] == 2
+        assert windows["rows"]["28f13cfd-f7df-4279-a814-86aa3acade1f"] == {"index": 8, "hits": 2}
+
+    def test_reset_clears_profile(self):
+        self.client.post('/rules/version/3', json={"observations": {"risk_type": "attic", "attic_vent_screens": True}})
+
+        assert self.client.delete('/admin/profile').status_code == 200
+        assert self.client.get('/admin/profile').get_json()["versions"] == {}
+
+    def test_profiling_disabled_by_default(self):
+        client = create_app(Settings(profile_sample_rate=0.0)).test_client()
+        client.post('/rules/version/3', json={"observations": {"risk_type": "attic", "attic_vent_screens": True}})
+
+        assert client.get('/admin/profile').get_json()["versions"] == {}
+
+
+@pytest.mark.parametrize("performance,expected", [
+    ("35.0µs", 35.0),
+    ("1.5ms", 1500.0),
+    ("275.0ns", 0.275),
+    ("", 0.0)
+])
+def test_parse_performance_us(performance, expected):
+    assert parse_performance_us(performance) == pytest.approx(expected)
@@ -0,0 +1,113 @@
+import json
+import os
+
+import pytest
+import zen
+
+from src.application.services.rule_table_optimizer import (
+    RuleTableOptimizer,
+    cell_covers,
+    cells_disjoint,
+    parse_cell
+)
+
+
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src', 'rules', 'fire_risk', '3', 'fire_risk.json')
+GRASS_TEMPERED_ROW = "28f13cfd-f7df-4279-a814-86aa3acade1f"
+ROOF_CATCH_ALL_ROW = "e8be3855-78d0-4c13-9e3a-420b160d5f6a"
+
+
+class TestRuleTableOptimizer:
+    def setup_method(self):
+        with open(RULES_PATH, 'r') as f:
+            self.rule_content = f.read()
+
+    def _table(self, report, name):
+        return next(table for table in report.tables if table.node_name == name)
+
+    def test_hot_exclusive_row_moves_first(self):
+        optimizer = RuleTableOptimizer({GRASS_TEMPERED_ROW: 100})
+        optimized_json, report = optimizer.optimize(self.rule_content)
+
+        windows = self._table(report, "Windows")
+        assert windows.reordered
+        assert windows.optimized_order[0] == GRASS_TEMPERED_ROW
+        assert windows.pinned_pairs == 0
+
+        graph = json.loads(optimized_json)
+        node = next(node for node in graph["nodes"] if node["name"] == "Windows")
+        assert node["content"]["rules"][0]["_id"] == GRASS_TEMPERED_ROW
+
+    def test_overlapping_catch_all_stays_last(self):
+        optimizer = RuleTableOptimizer({ROOF_CATCH_ALL_ROW: 1000})
+        _, report = optimizer.optimize(self.rule_content)
+
+        roof = self._table(report, "Roof")
+        assert not roof.reordered
+        assert roof.optimized_order[-1] == ROOF_CATCH_ALL_ROW
+
+    def test_optimized_graph_is_equivalent(self):
+        optimizer = RuleTableOptimizer({GRASS_TEMPERED_ROW: 100, ROOF_CATCH_ALL_ROW: 50})
+        optimized_json, _ = optimizer.optimize(self.rule_content)
+
+        engine = zen.ZenEngine()
+        original = engine.create_decision(self.rule_content)
+        optimized = engine.create_decision(optimized_json)
+
+        for window_type in ("single", "double", "tempered", "other"):
+            for vegetation_type in ("tree", "shrubs", "grass", "other"):
+                for distance in (0, 10, 100):
+                    observation = {
+                        "risk_type": "windows",
+                        "window_type": window_type,
+                        "vegetation_type": vegetation_type,
+                        "distance": distance
+                    }
+                    assert optimized.evaluate(observation)["result"] == original.evaluate(observation)["result"]
+
+        for roof_type in ("a", "b", "c"):
+            for wild_fire_risk in ("a", "b", "c"):
+                observation = {"risk_type": "roof", "roof_type": roof_type, "wild_fire_risk": wild_fire_risk}
+                assert optimized.evaluate(observation)["result"] == original.evaluate(observation)["result"]
+
+    def test_flags_unreachable_rows(self):
+        graph = json.loads(self.rule_content)
+        roof = next(node for node in graph["nodes"] if node["name"] == "Roof")
+        # A duplicate of the catch-all row can never be hit
+        roof["content"]["rules"].append(dict(roof["content"]["rules"][2], _id="duplicate"))
+
+        _, report = RuleTableOptimizer({}).optimize(json.dumps(graph))
+
+        unreachable = self._table(report, "Roof").unreachable_rows
+        assert unreachable == [{"row_id": "duplicate", "index": 3, "shadowed_by": ROOF_CATCH_ALL_ROW}]
+
+    def test_load_row_hits_from_profile_snapshot(self):
+        snapshot = {"versions": {"3": {"nodes": {"n": {"rows": {"r1": {"index": 0, "hits": 4}}}}}}}
+
+        assert RuleTableOptimizer.load_row_hits(snapshot, "3") == {"r1": 4}
+        assert RuleTableOptimizer.load_row_hits({"r1": 2}) == {"r1": 2}
+
+
+@pytest.mark.parametrize("first,second,disjoint", [
+    ('"tree"', '"grass"', True),
+    ('"tree"', '"tree", "grass"', False),
+    ('> 0', '<= 0', True),
+    ('> 0', '[0..5]', False),
+    ('[0..5)', '[5..10]', True),
+    ('true', '1', True),
+    ('', '"tree"', False),
+    ('$ > 0 and $ < 5', '"tree"', False)
+])
+def test_cells_disjoint(first, second, disjoint):
+    assert cells_disjoint(parse_cell(first), parse_cell(second)) is disjoint
+
+
+@pytest.mark.parametrize("outer,inner,covers", [
+    ('', '"tree"', True),
+    ('"tree", "grass"', '"tree"', True),
+    ('> 0', '[1..5]', True),
+    ('> 0', '[0..5]', False),
+    ('"tree"', '', False)
+])
+def test_cell_covers(outer, inner, covers):
+    assert cell_covers(parse_cell(outer), parse_cell(inner)) is covers
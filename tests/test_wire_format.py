@@ -0,0 +1,72 @@
+import msgpack
+
+from src.presentation.app import create_app
+
+
+class TestWireFormat:
+    def setup_method(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+        self.payload = {
+            "observations": [
+                {
+                    "risk_type": "attic",
+                    "attic_vent_screens": False
+                },
+                {
+                    "risk_type": "roof",
+                    "roof_type": "c",
+                    "wild_fire_risk": "a"
+                }
+            ],
+            "property_id": 1
+        }
+
+    def test_msgpack_request_gets_msgpack_response(self):
+        response = self.client.post(
+            '/rules/version/3',
+            data=msgpack.packb(self.payload),
+            content_type='application/msgpack'
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/msgpack'
+
+        body = msgpack.unpackb(response.data, raw=False)
+        assert body["api_version"] == "3"
+        assert body["property_id"] == 1
+        assert body["result"][0]["mitigations"] == "Add Vents"
+        assert body["result"][1]["mitigations"] == "No Mitigation"
+
+    def test_accept_header_overrides_request_format(self):
+        response = self.client.post(
+            '/rules/version/3',
+            json=self.payload,
+            headers={'Accept': 'application/msgpack'}
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/msgpack'
+        assert msgpack.unpackb(response.data, raw=False)["api_version"] == "3"
+
+    def test_json_remains_default(self):
+        response = self.client.post('/rules/version/3', json=self.payload)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json()["result"][0]["risk_type"] == "attic"
+
+    def test_malformed_msgpack_is_rejected(self):
+        response = self.client.post(
+            '/rules/latest',
+            data=b'\xc1',
+            content_type='application/msgpack'
+        )
+
+        assert response.status_code == 400
+
+    def test_unsupported_content_type_is_rejected(self):
+        response = self.client.post('/rules/latest', data='observations', content_type='text/plain')
+
+        assert response.status_code == 400
+        assert 'Content-Type' in response.get_json()["error"]